@@ -6,10 +6,11 @@
 # pylint: disable=E1101
 
 # Third-party
+from sqlalchemy import event
 from sqlalchemy.orm import relationship
 
 # First-party
-from apiserver.extensions import db
+from apiserver.extensions import db, role_registry
 
 
 class Role(db.Model):
@@ -36,3 +37,11 @@ class Role(db.Model):
             name (str): The name of the role.
         """
         self.name = name
+
+
+@event.listens_for(Role, 'after_insert')
+@event.listens_for(Role, 'after_update')
+@event.listens_for(Role, 'after_delete')
+def bump_role_registry(mapper, connection, target):  # pylint: disable=W0613
+    """Reload the role registry after roles are written."""
+    role_registry.bump()
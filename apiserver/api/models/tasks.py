@@ -23,9 +23,29 @@ class Task(db.Model):
     Attributes:
         id (str): A unique UUID for the task.
         created_at (datetime): Timestamp of when the task record was created.
+        updated_at (datetime): Timestamp of the last change to the task.
+        version (int): Incremented on every change to the task or its comments.
     """
 
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Indexes end with the sort columns used by keyset pagination
+        db.Index('ix_tasks_created_at_id', 'created_at', 'id'),
+        db.Index('ix_tasks_updated_at_id', 'updated_at', 'id'),
+        db.Index('ix_tasks_status_created_at_id', 'status', 'created_at', 'id'),
+        db.Index(
+            'ix_tasks_assigned_to_id_created_at_id',
+            'assigned_to_id',
+            'created_at',
+            'id',
+        ),
+        db.Index(
+            'ix_tasks_created_by_id_created_at_id',
+            'created_by_id',
+            'created_at',
+            'id',
+        ),
+    )
 
     id = db.Column(
         db.Integer,
@@ -41,26 +61,47 @@ class Task(db.Model):
         db.Enum(PriorityLevel), nullable=False, default=PriorityLevel.MEDIUM
     )
     status = db.Column(db.Enum(TaskStatus), nullable=False, default=TaskStatus.OPEN)
+    # Deleting a user clears these columns in the database, the ORM never
+    # loads the user's tasks to do it
     created_by_id = db.Column(
-        db.Integer, db.ForeignKey('users.id')
+        db.Integer, db.ForeignKey('users.id', ondelete='SET NULL')
     )  # Relationship with the 'User' who created the task
     created_by = db.relationship(
-        'User', backref='tasks_created', foreign_keys=[created_by_id]
+        'User',
+        backref=db.backref('tasks_created', passive_deletes=True),
+        foreign_keys=[created_by_id],
     )
     assigned_to_id = db.Column(
-        db.Integer, db.ForeignKey('users.id')
+        db.Integer, db.ForeignKey('users.id', ondelete='SET NULL')
     )  # Relationship with the 'User' assigned to the task
     assigned_to = db.relationship(
-        'User', backref='tasks_assigned', foreign_keys=[assigned_to_id]
+        'User',
+        backref=db.backref('tasks_assigned', passive_deletes=True),
+        foreign_keys=[assigned_to_id],
     )
     created_at = db.Column(db.DateTime, default=TASK_DATETIME_DEFAULT)
-    updated_at = db.Column(db.DateTime, default=TASK_DATETIME_DEFAULT)
+    updated_at = db.Column(
+        db.DateTime, default=TASK_DATETIME_DEFAULT, onupdate=TASK_DATETIME_DEFAULT
+    )
     completion_date = db.Column(db.DateTime, nullable=True)
     recurring_task = db.Column(db.Boolean, default=False)
     estimate = db.Column(db.Integer, nullable=True)
     actual_time_spent = db.Column(db.Integer, nullable=True)
-    comments = db.relationship('Comment', backref='task', cascade='all, delete-orphan')
+    # Comments are deleted by the database along with their task
+    comments = db.relationship(
+        'Comment', backref='task', cascade='all, delete-orphan', passive_deletes=True
+    )
     type = db.Column(db.Enum(TaskType), nullable=False, default=TaskType.TASK)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+
+    def bump_version(self):
+        """
+        Record a change to the task or to one of its comments.
+
+        The version is incremented by the database, so concurrent writers never
+        produce the same version, and updated_at is refreshed by the UPDATE.
+        """
+        self.version = Task.version + 1
 
 
 class Comment(db.Model):
@@ -75,11 +116,16 @@ class Comment(db.Model):
     """
 
     __tablename__ = 'comments'
+    __table_args__ = (
+        db.Index('ix_comments_task_id_created_at_id', 'task_id', 'created_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     content = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=TASK_DATETIME_DEFAULT)
-    task_id = db.Column(db.Integer, db.ForeignKey(TASKS_ID), nullable=False)
+    task_id = db.Column(
+        db.Integer, db.ForeignKey(TASKS_ID, ondelete='CASCADE'), nullable=False
+    )
 
     def to_json(self):
         """
@@ -88,5 +134,9 @@ class Comment(db.Model):
         return {
             'id': self.id,
             'content': self.content,
-            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'created_at': (
+                self.created_at.strftime('%Y-%m-%d %H:%M:%S')
+                if self.created_at
+                else None
+            ),
         }
@@ -5,12 +5,9 @@
 
 # pylint: disable=E1101
 
-# Third-party
-from werkzeug.security import check_password_hash, generate_password_hash
-
 # First-party
 from apiserver.commons.constants import TASK_DATETIME_DEFAULT
-from apiserver.extensions import db
+from apiserver.extensions import credential_cache, db, hashing_pool
 
 
 class User(db.Model):
@@ -53,10 +50,17 @@ class User(db.Model):
         """
         Hash and set the user's password.
 
+        Credentials cached for the previous password are dropped.
+
         Args:
             password (str): The plain text password to hash and store.
+
+        Raises:
+            HashingPoolBusy: If too many passwords are being hashed.
         """
-        self.password = generate_password_hash(password)
+        self.password = hashing_pool.generate(password)
+        if self.id is not None:
+            credential_cache.invalidate_user(self.id)
 
     def check_password(self, password):
         """
@@ -67,5 +71,8 @@ class User(db.Model):
 
         Returns:
             bool: True if the password matches, False otherwise.
+
+        Raises:
+            HashingPoolBusy: If too many passwords are being hashed.
         """
-        return check_password_hash(self.password, password)
+        return hashing_pool.check(self.password, password)
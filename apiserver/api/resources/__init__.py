@@ -6,9 +6,12 @@ Initializes all required Flask-RESTful resources.
 """
 
 # First-party
+from apiserver.api.resources.admin import DatabasePoolResource
 from apiserver.api.resources.tasks import (
     AssignedTasksListResource,
     AssignTaskResource,
+    BulkAssignTaskResource,
+    BulkTaskResource,
     CommentResource,
     TaskResource,
 )
@@ -27,7 +30,10 @@ __all__ = [
     'SigninResource',
     'SignupResource',
     'TaskResource',
+    'BulkTaskResource',
     'AssignedTasksListResource',
     'CommentResource',
     'AssignTaskResource',
+    'BulkAssignTaskResource',
+    'DatabasePoolResource',
 ]
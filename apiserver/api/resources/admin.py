@@ -0,0 +1,70 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+
+"""Defines operational APIs for administrators."""
+
+# Standard library
+from http import HTTPStatus
+
+# Third-party
+from flask_restful import Resource
+
+# First-party
+from apiserver.commons.constants import APIResponse, APIResponseKeys
+from apiserver.commons.database import pool_status
+from apiserver.commons.helpers import require_auth, role_required
+from apiserver.extensions import db
+
+
+class DatabasePoolResource(Resource):
+    """
+    API Resource reporting the state of the database connection pools.
+
+    Attributes:
+        method_decorators (list): A list of method decorators to apply to the resource methods.
+    """
+
+    method_decorators = [
+        role_required('admin'),
+        require_auth,
+    ]
+
+    def get(self):
+        """
+        Report the connection pools of this worker process.
+
+        Each worker process has its own pools, the figures cover the worker which handled the request.
+
+        Returns:
+            tuple: A tuple containing response data and status code.
+        ---
+        tags:
+          - Administration
+        security:
+          - basicAuth: []
+          - authBearer: []
+        responses:
+          200:
+            description: Pool status keyed by database bind, the default database is keyed by "default"
+            content: application/json
+            schema:
+              type: object
+              properties:
+                result:
+                  type: object
+                  example: {"default": {"pool": "InstrumentedQueuePool", "size": 5, "checked_in": 2,
+                    "checked_out": 1, "overflow": 0, "max_overflow": 10, "timeout": 30.0, "checkouts": 120,
+                    "timeouts": 0, "wait_sum": 0.08, "wait_max": 0.01}}
+                status:
+                  type: string
+                  example: "success"
+          403:
+            description: Access denied for non-admin users
+        """
+        return {
+            APIResponseKeys.RESULT.value: {
+                bind or 'default': pool_status(engine)
+                for bind, engine in db.engines.items()
+            },
+            APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+        }, HTTPStatus.OK
@@ -8,27 +8,199 @@
 from http import HTTPStatus
 
 # Third-party
-from flask import g, request
+from flask import current_app, g, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_restful import Resource
+from sqlalchemy import and_, delete, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, noload
 
 # First-party
 from apiserver.api.models import Comment, Task, User
+from apiserver.api.schemas.compiled import dump_task, dump_task_row
 from apiserver.api.schemas.tasks import CommentSchema, TaskSchema
 from apiserver.commons.constants import (
+    ALLOWED_FIELDS_TO_BULK_UPDATE,
+    ALLOWED_FIELDS_TO_CREATE,
     ALLOWED_FIELDS_TO_UPDATE,
     APIResponse,
     APIResponseKeys,
     APIResponseMessage,
 )
+from apiserver.commons.database import read_replica
+from apiserver.commons.etags import (
+    if_match_versions,
+    not_modified,
+    task_etag,
+    version_etag,
+)
+from apiserver.commons.filters import (
+    TASK_FILTER_FIELDS,
+    parse_comment_sort,
+    parse_task_filters,
+    parse_task_sort,
+)
 from apiserver.commons.helpers import (
-    require_basic_auth,
+    require_auth,
     role_required,
     validate_fields,
     validate_input,
 )
-from apiserver.extensions import db
+from apiserver.commons.pagination import (
+    encode_cursor,
+    keyset_paginate,
+    keyset_predicate,
+    parse_limit,
+)
+from apiserver.commons.streaming import stream_ndjson, wants_stream
+from apiserver.commons.utilities import parse_task_fields
+from apiserver.extensions import db, response_cache
+
+# Loading strategy for dumping tasks through TaskSchema: nested users are
+# fetched in the same statement and comments are never loaded.
+TASK_LOAD_OPTIONS = (
+    joinedload(Task.created_by),
+    joinedload(Task.assigned_to),
+    noload(Task.comments),
+)
+
+
+def task_read_tags():
+    """Cache tags of GET /tasks, either one task or the task list.
+
+    The id is normalized as invalidate_tasks() builds the tag from the
+    integer id, a response for an id which is not an integer is not cached.
+    """
+    task_id = request.args.get('task_id')
+    if not task_id:
+        return ['users', 'tasks']
+    try:
+        return ['users', f'task:{int(task_id)}']
+    except ValueError:
+        return None
+
+
+def assigned_tasks_tags():
+    """Cache tags of the tasks assigned to the current user."""
+    return ['users', f'assigned:{get_jwt_identity()}']
+
+
+def invalidate_tasks(task_ids, assignee_ids=()):
+    """
+    Invalidate cached reads affected by a write to tasks.
+
+    Args:
+        task_ids (list): IDs of the tasks written.
+        assignee_ids (list): IDs of the users the tasks are or were assigned to.
+    """
+    response_cache.invalidate(
+        'tasks',
+        *(f'task:{task_id}' for task_id in task_ids),
+        *(
+            f'assigned:{user_id}'
+            for user_id in set(assignee_ids)
+            if user_id is not None
+        ),
+    )
+
+
+def item_id(value):
+    """
+    Check an ID read from a JSON payload.
+
+    Args:
+        value (object): The decoded JSON value.
+
+    Returns:
+        int: The ID.
+
+    Raises:
+        TypeError: If the value is not an integer, e.g. a float, a boolean or a string.
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError('IDs must be integers.')
+    return value
+
+
+def supports_returning(statement):
+    """
+    Whether the database can return rows from an UPDATE or DELETE.
+
+    Args:
+        statement (str): Either 'update' or 'delete'.
+    """
+    return getattr(db.session.get_bind().dialect, f'{statement}_returning')
+
+
+def touch_task(task_id):
+    """
+    Bump the version of a task with a single UPDATE, see Task.bump_version().
+
+    Args:
+        task_id (int): ID of the task.
+
+    Returns:
+        Row: ID of the task and of the user it is assigned to, for cache
+            invalidation, or None if the task does not exist.
+    """
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(version=Task.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    columns = (Task.id, Task.assigned_to_id)
+    if supports_returning('update'):
+        return db.session.execute(statement.returning(*columns)).first()
+    db.session.execute(statement)
+    return db.session.execute(select(*columns).where(Task.id == task_id)).first()
+
+
+def count_tasks(criteria, limit):
+    """
+    Count the tasks matching criteria, up to a limit.
+
+    Args:
+        criteria (list): SQL predicates selecting the tasks.
+        limit (int): Number of matches from which counting stops.
+
+    Returns:
+        int: The number of matching tasks, at most limit.
+    """
+    matches = select(Task.id).where(*criteria).limit(limit).subquery()
+    return db.session.scalar(select(func.count()).select_from(matches))
+
+
+def update_tasks(criteria, values):
+    """
+    Apply the same values to every task matching criteria with one UPDATE.
+
+    Versions are bumped by the same statement. Without RETURNING support the
+    matching tasks are selected and locked first.
+
+    Args:
+        criteria (list): SQL predicates selecting the tasks.
+        values (dict): Column values to set.
+
+    Returns:
+        list: Rows holding the id and assigned_to_id of the updated tasks, the
+            latter is only reliable if values do not change it.
+    """
+    statement = (
+        update(Task)
+        .values(**values, version=Task.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if supports_returning('update'):
+        return db.session.execute(
+            statement.where(*criteria).returning(Task.id, Task.assigned_to_id)
+        ).all()
+    rows = db.session.execute(
+        select(Task.id, Task.assigned_to_id).where(*criteria).with_for_update()
+    ).all()
+    if rows:
+        db.session.execute(statement.where(Task.id.in_([row.id for row in rows])))
+    return rows
 
 
 class TaskResource(Resource):
@@ -42,7 +214,7 @@ class TaskResource(Resource):
     """
 
     method_decorators = [
-        require_basic_auth,
+        require_auth,
     ]
 
     @role_required('admin')
@@ -64,6 +236,7 @@ class TaskResource(Resource):
           - Task Management
         security:
           - basicAuth: []
+          - authBearer: []
         requestBody:
           required: true
           content:
@@ -83,10 +256,10 @@ class TaskResource(Resource):
                     example: "2023-09-15"
                   priority:
                     type: string
-                    example: "HIGH"
+                    example: "high"
                   status:
                     type: string
-                    example: "OPEN"
+                    example: "open"
                   assigned_to_id:
                     type: integer
                     example: 1
@@ -152,17 +325,27 @@ class TaskResource(Resource):
                 'message': APIResponseMessage.FAILED_TO_CREATE_TASK.value,
                 'status': APIResponse.FAIL.value,
             }, HTTPStatus.BAD_REQUEST
-        task = Task.query.filter_by(title=data.get('title')).first()
+        try:
+            if not isinstance(data, dict):
+                raise ValueError(APIResponseMessage.INVALID_PAYLOAD.value)
+            values = parse_task_fields(data, ALLOWED_FIELDS_TO_CREATE)
+        except ValueError as error:
+            return {
+                APIResponseKeys.MESSAGE.value: str(error),
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+        task = Task.query.filter_by(title=values.get('title')).first()
         if task:
             return {
                 'message': f'Task \'{task.title}\' <{task.id}>  already exists',
                 'status': APIResponse.FAIL.value,
             }, HTTPStatus.CONFLICT
 
-        new_task = Task(**data)
-        new_task.created_by_id = g.current_user.id
+        new_task = Task(**values)
+        new_task.created_by_id = g.current_user_id
         db.session.add(new_task)
         db.session.commit()
+        invalidate_tasks([new_task.id], [new_task.assigned_to_id])
         try:
             db.session.commit()
             return {
@@ -176,11 +359,15 @@ class TaskResource(Resource):
                 'status': APIResponse.FAIL.value,
             }, HTTPStatus.BAD_REQUEST
 
+    @response_cache.cached(task_read_tags)
+    @read_replica
     def get(self):
         """
         Retrieve a list of tasks or a specific task.
 
-        This endpoint allows an admin user to retrieve a list of all tasks or a specific task by providing the task ID.
+        This endpoint allows an admin user to retrieve a page of tasks or a specific task by providing the task ID.
+        Tasks are ordered by creation time and paginated with an opaque cursor, pass `next_cursor` of a page as
+        `cursor` to fetch the following page.
 
         Returns:
             tuple: A tuple containing response data and status code.
@@ -189,12 +376,75 @@ class TaskResource(Resource):
           - Task Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: query
             name: task_id
             required: false
             type: string
             description: The ID of the task to retrieve (optional).
+          - in: query
+            name: limit
+            required: false
+            type: integer
+            description: Maximum number of tasks per page (optional).
+          - in: query
+            name: cursor
+            required: false
+            type: string
+            description: The `next_cursor` returned with the previous page (optional).
+          - in: query
+            name: all
+            required: false
+            type: boolean
+            description: Return all tasks in a single response instead of a page (optional).
+          - in: query
+            name: status
+            required: false
+            type: string
+            description: Comma separated statuses, e.g. "open,in work" (optional).
+          - in: query
+            name: priority
+            required: false
+            type: string
+            description: Comma separated priorities, e.g. "high" (optional).
+          - in: query
+            name: type
+            required: false
+            type: string
+            description: Comma separated task types, e.g. "sub-task" (optional).
+          - in: query
+            name: assigned_to_id
+            required: false
+            type: string
+            description: Comma separated IDs of assignees (optional).
+          - in: query
+            name: created_by_id
+            required: false
+            type: string
+            description: Comma separated IDs of creators (optional).
+          - in: query
+            name: due_date_from
+            required: false
+            type: string
+            format: date-time
+            description: Earliest due date, inclusive (optional).
+          - in: query
+            name: due_date_to
+            required: false
+            type: string
+            format: date-time
+            description: Latest due date, inclusive (optional).
+          - in: query
+            name: sort
+            required: false
+            type: string
+            description: One of created_at, updated_at, title. Prefix with "-" for descending order (optional).
+          - in: query
+            name: stream
+            required: false
+            type: boolean
+            description: Stream all matching tasks as newline delimited JSON, same as `Accept: application/x-ndjson` (optional).
         definitions:
           TaskSchema:
             type: object
@@ -234,9 +484,24 @@ class TaskResource(Resource):
                   type: array
                   items:
                     $ref: "#/definitions/TaskSchema"
+                next_cursor:
+                  type: string
+                  example: "WyIyMDIzLTA5LTA1VDEyOjAwOjAwIiwgNTBd"
                 status:
                   type: string
                   example: "success"
+          400:
+            description: Invalid filter, sort, limit or cursor
+            content: application/json
+            schema:
+              type: object
+              properties:
+                message:
+                  type: string
+                  example: "Invalid limit or cursor."
+                status:
+                  type: string
+                  example: "failed"
           404:
             description: Task not found
             content: application/json
@@ -252,30 +517,216 @@ class TaskResource(Resource):
         """
         task_id = request.args.get('task_id')
         if task_id:
-            task = Task.query.filter_by(id=task_id).first()
+            task = Task.query.options(*TASK_LOAD_OPTIONS).filter_by(id=task_id).first()
             if task:
-                return {
-                    APIResponseKeys.RESULT.value: TaskSchema().dump(task),
-                    APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
-                }, HTTPStatus.OK
+                etag = version_etag(task.id, task.version)
+                response = not_modified(etag)
+                if response is not None:
+                    return response
+                return (
+                    {
+                        APIResponseKeys.RESULT.value: dump_task(task),
+                        APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+                    },
+                    HTTPStatus.OK,
+                    {'ETag': etag},
+                )
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
 
-        tasks = Task.query.order_by('created_at').all()
+        try:
+            filters = parse_task_filters(request.args)
+            sort_columns, descending = parse_task_sort(request.args.get('sort'))
+        except ValueError as error:
+            return {
+                APIResponseKeys.MESSAGE.value: str(error),
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+        query = Task.query.options(*TASK_LOAD_OPTIONS).filter(*filters)
+        order_by = [column.desc() if descending else column for column in sort_columns]
+
+        if wants_stream():
+            return stream_ndjson(query.order_by(*order_by), dump_task)
+
+        if request.args.get('all', '').lower() == 'true':
+            tasks = query.order_by(*order_by).all()
+            etag = task_etag(tasks)
+            response = not_modified(etag)
+            if response is not None:
+                return response
+            return (
+                {
+                    APIResponseKeys.RESULT.value: [dump_task(task) for task in tasks],
+                    APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+                },
+                HTTPStatus.OK,
+                {'ETag': etag},
+            )
+
+        try:
+            limit = parse_limit(
+                request.args.get('limit'),
+                current_app.config['PAGINATION_DEFAULT_LIMIT'],
+                current_app.config['PAGINATION_MAX_LIMIT'],
+            )
+            tasks, next_cursor = keyset_paginate(
+                query,
+                sort_columns,
+                limit,
+                cursor=request.args.get('cursor'),
+                descending=descending,
+            )
+        except ValueError:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAGINATION.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        etag = task_etag(tasks, next_cursor)
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        return (
+            {
+                APIResponseKeys.RESULT.value: [dump_task(task) for task in tasks],
+                APIResponseKeys.NEXT_CURSOR.value: next_cursor,
+                APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+            },
+            HTTPStatus.OK,
+            {'ETag': etag},
+        )
+
+    @role_required('admin')
+    def patch(self):
+        """
+        Update many tasks.
+
+        This endpoint allows an admin user to apply the same changes to a list of tasks, or to every task
+        matching a filter, e.g. to move a column of the board to completed. The changes are applied with a
+        single UPDATE statement in one transaction.
+
+        Returns:
+            tuple: A tuple containing response data and status code.
+        ---
+        tags:
+          - Task Management
+        security:
+          - basicAuth: []
+          - authBearer: []
+        requestBody:
+          required: true
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  ids:
+                    type: array
+                    items:
+                      type: integer
+                    example: [1, 2, 3]
+                  filter:
+                    type: object
+                    description: Same filters as GET /tasks, used instead of ids.
+                    example: {"status": "in work", "assigned_to_id": 1}
+                  changes:
+                    type: object
+                    description: Fields to set, any field of PUT /tasks/<task_id> except title.
+                    example: {"status": "completed"}
+        responses:
+          200:
+            description: Tasks updated, the result lists the IDs of the updated tasks
+            content: application/json
+            schema:
+              type: object
+              properties:
+                result:
+                  type: array
+                  items:
+                    type: integer
+                  example: [1, 2, 3]
+                status:
+                  type: string
+                  example: "success"
+          400:
+            description: Invalid ids, filter or changes, or a filter matching more tasks than allowed in a single request
+          413:
+            description: Too many ids in a single request
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or ('ids' in data) == ('filter' in data):
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAYLOAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        try:
+            if not isinstance(data.get('changes'), dict) or not data['changes']:
+                raise ValueError('changes are required.')
+            values = parse_task_fields(data['changes'], ALLOWED_FIELDS_TO_BULK_UPDATE)
+            if 'ids' in data:
+                ids = data['ids']
+                if not isinstance(ids, list) or not all(
+                    isinstance(task_id, int) for task_id in ids
+                ):
+                    raise ValueError('ids must be a list of integers.')
+                criteria = [Task.id.in_(ids)]
+            else:
+                # An empty or misspelled filter must not update every task
+                if not isinstance(data['filter'], dict) or not data['filter']:
+                    raise ValueError('filter is required.')
+                unknown = [
+                    key for key in data['filter'] if key not in TASK_FILTER_FIELDS
+                ]
+                if unknown:
+                    raise ValueError(f'Filter(s) {", ".join(unknown)} not allowed.')
+                criteria = parse_task_filters(data['filter'])
+        except ValueError as error:
+            return {
+                APIResponseKeys.MESSAGE.value: str(error),
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+        max_items = current_app.config['BULK_MAX_ITEMS']
+        if len(data.get('ids', ())) > max_items:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.TOO_MANY_ITEMS.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        # A filter is capped like a list of ids, the count stops past the cap
+        if 'filter' in data and count_tasks(criteria, max_items + 1) > max_items:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.FILTER_TOO_BROAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        try:
+            rows = update_tasks(criteria, values)
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAYLOAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
 
+        task_ids = sorted(row.id for row in rows)
+        invalidate_tasks(task_ids, [row.assigned_to_id for row in rows])
         return {
-            APIResponseKeys.RESULT.value: TaskSchema(many=True).dump(tasks),
+            APIResponseKeys.MESSAGE.value: APIResponseMessage.TASKS_UPDATED.value,
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+            APIResponseKeys.RESULT.value: task_ids,
         }, HTTPStatus.OK
 
+    @role_required('admin')
     @validate_fields(ALLOWED_FIELDS_TO_UPDATE)
     def put(self, task_id):
         """
         Update a task.
 
         This endpoint allows an admin user to update a specific task by providing the task ID and the updated data.
+        Send the ETag of the task in If-Match to apply the update only if nobody changed the task since it was read.
 
         Returns:
             tuple: A tuple containing response data and status code.
@@ -284,12 +735,18 @@ class TaskResource(Resource):
           - Task Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
             required: true
             type: string
             description: The ID of the task to update.
+          - in: header
+            name: If-Match
+            required: false
+            type: string
+            description: ETag returned by GET /tasks?task_id=<task_id>.
         requestBody:
           required: true
           content:
@@ -327,7 +784,7 @@ class TaskResource(Resource):
                     example: 7
         responses:
           201:
-            description: Task updated successfully
+            description: Task updated successfully, the result holds its new state and the ETag header its new tag
             content: application/json
             schema:
               type: object
@@ -335,9 +792,15 @@ class TaskResource(Resource):
                 message:
                   type: string
                   example: "Task updated successfully"
+                result:
+                  type: object
                 status:
                   type: string
                   example: "success"
+          400:
+            description: Invalid field value
+          403:
+            description: Only admin users can update tasks
           404:
             description: Task not found
             content: application/json
@@ -350,24 +813,69 @@ class TaskResource(Resource):
                 status:
                   type: string
                   example: "error"
+          412:
+            description: The task was modified since the ETag in If-Match was read
         """
-        task = Task.query.get(task_id)
-        if not task:
+        try:
+            values = parse_task_fields(request.get_json(), ALLOWED_FIELDS_TO_UPDATE)
+        except ValueError as error:
             return {
-                APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
+                APIResponseKeys.MESSAGE.value: str(error),
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
-            }, HTTPStatus.NOT_FOUND
+            }, HTTPStatus.BAD_REQUEST
 
-        # Update task attributes based on request data
-        data = request.get_json()
-        for key, value in data.items():
-            setattr(task, key, value)
+        # Optimistic concurrency: the version is compared by the UPDATE itself,
+        # so no row is locked between the client's read and its write
+        criteria = [Task.id == task_id]
+        versions = if_match_versions(task_id)
+        if versions is not None:
+            criteria.append(Task.version.in_(versions))
+        statement = (
+            update(Task)
+            .where(*criteria)
+            .values(**values, version=Task.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        columns = list(Task.__table__.columns)
+        try:
+            if supports_returning('update'):
+                task = db.session.execute(statement.returning(*columns)).first()
+            else:
+                updated = db.session.execute(statement).rowcount
+                task = None
+                if updated:
+                    task = db.session.execute(
+                        select(*columns).where(Task.id == task_id)
+                    ).first()
+            if task is None:
+                db.session.rollback()
+                if versions is not None and Task.query.filter_by(id=task_id).count():
+                    return {
+                        APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_MODIFIED.value,
+                        APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+                    }, HTTPStatus.PRECONDITION_FAILED
+                return {
+                    APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
+                    APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+                }, HTTPStatus.NOT_FOUND
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAYLOAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
 
-        db.session.commit()
-        return {
-            APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_UPDATED.value,
-            APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
-        }, HTTPStatus.CREATED
+        invalidate_tasks([task.id], [task.assigned_to_id])
+        return (
+            {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_UPDATED.value,
+                APIResponseKeys.RESULT.value: dump_task_row(task),
+                APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+            },
+            HTTPStatus.CREATED,
+            {'ETag': version_etag(task.id, task.version)},
+        )
 
     @role_required('admin')
     def delete(self, task_id):
@@ -383,6 +891,7 @@ class TaskResource(Resource):
           - Task Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
@@ -415,21 +924,211 @@ class TaskResource(Resource):
                   type: string
                   example: "error"
         """
-        task = Task.query.get(task_id)
-        if not task:
+        # Comments are removed by the ON DELETE CASCADE of their foreign key
+        statement = (
+            delete(Task)
+            .where(Task.id == task_id)
+            .execution_options(synchronize_session=False)
+        )
+        columns = (Task.id, Task.assigned_to_id)
+        if supports_returning('delete'):
+            task = db.session.execute(statement.returning(*columns)).first()
+        else:
+            task = db.session.execute(
+                select(*columns).where(Task.id == task_id)
+            ).first()
+            if task is not None:
+                db.session.execute(statement)
+        if task is None:
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
 
-        db.session.delete(task)
         db.session.commit()
+        invalidate_tasks([task.id], [task.assigned_to_id])
         return {
             APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_DELETED.value,
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
         }, HTTPStatus.OK
 
 
+class BulkTaskResource(Resource):
+    """
+    API Resource for creating many tasks at once.
+
+    Titles are checked for duplicates with a single query and all new tasks are
+    inserted with one multi-row statement in one transaction.
+
+    Attributes:
+        method_decorators (list): A list of method decorators to apply to the resource methods.
+    """
+
+    method_decorators = [
+        role_required('admin'),
+        require_auth,
+    ]
+
+    def post(self):
+        """
+        Create many tasks.
+
+        This endpoint allows an admin user to create a batch of tasks. Each item is reported separately,
+        items with a missing or duplicate title or an invalid field are skipped.
+
+        Returns:
+            tuple: A tuple containing response data and status code.
+        ---
+        tags:
+          - Task Management
+        security:
+          - basicAuth: []
+          - authBearer: []
+        requestBody:
+          required: true
+          content:
+            application/json:
+              schema:
+                type: array
+                items:
+                  type: object
+                  properties:
+                    title:
+                      type: string
+                      example: "Task Title"
+                    description:
+                      type: string
+                      example: "Task description goes here"
+                    due_date:
+                      type: string
+                      format: date
+                      example: "2023-09-15"
+                    priority:
+                      type: string
+                      example: "high"
+                    status:
+                      type: string
+                      example: "open"
+                    assigned_to_id:
+                      type: integer
+                      example: 1
+        responses:
+          201:
+            description: All tasks created
+            content: application/json
+            schema:
+              type: object
+              properties:
+                result:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      index:
+                        type: integer
+                        example: 0
+                      status:
+                        type: string
+                        example: "created"
+                      id:
+                        type: integer
+                        example: 1
+                      message:
+                        type: string
+                        example: "Task 'Task Title' already exists"
+                status:
+                  type: string
+                  example: "success"
+          207:
+            description: Some tasks created, see the result of each item
+          400:
+            description: No task created
+          413:
+            description: Too many items in a single request
+        """
+        data = request.get_json(silent=True)
+        if not isinstance(data, list):
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAYLOAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+        if len(data) > current_app.config['BULK_MAX_ITEMS']:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.TOO_MANY_ITEMS.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+        results = [{'index': index} for index in range(len(data))]
+        rows = {}
+        for result, item in zip(results, data):
+            try:
+                if not isinstance(item, dict) or not item.get('title'):
+                    raise ValueError('title is required.')
+                values = parse_task_fields(item, ALLOWED_FIELDS_TO_CREATE)
+            except ValueError as error:
+                result.update(status='invalid', message=str(error))
+                continue
+            if values['title'] in rows:
+                result.update(status='conflict', message='Duplicate title in request.')
+                continue
+            values['created_by_id'] = g.current_user_id
+            rows[values['title']] = values
+
+        existing_titles = set()
+        if rows:
+            existing_titles = set(
+                db.session.scalars(select(Task.title).where(Task.title.in_(list(rows))))
+            )
+        for result, item in zip(results, data):
+            if 'status' not in result and item['title'] in existing_titles:
+                result.update(
+                    status='conflict',
+                    message=f'Task \'{item["title"]}\' already exists',
+                )
+                del rows[item['title']]
+
+        if rows:
+            # A multi-row VALUES clause needs the same columns in every row
+            columns = set().union(*rows.values())
+            for values in rows.values():
+                for column in columns.difference(values):
+                    default = Task.__table__.c[column].default
+                    values[column] = default.arg if default is not None else None
+            try:
+                db.session.execute(insert(Task).values(list(rows.values())))
+                created_ids = dict(
+                    db.session.execute(
+                        select(Task.title, Task.id).where(Task.title.in_(list(rows)))
+                    ).all()
+                )
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                return {
+                    APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_CREATE_TASK.value,
+                    APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+                }, HTTPStatus.CONFLICT
+            for result, item in zip(results, data):
+                if 'status' not in result:
+                    result.update(status='created', id=created_ids[item['title']])
+            invalidate_tasks(
+                created_ids.values(),
+                [values.get('assigned_to_id') for values in rows.values()],
+            )
+
+        if not rows:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_CREATE_TASK.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+                APIResponseKeys.RESULT.value: results,
+            }, HTTPStatus.BAD_REQUEST
+        return {
+            APIResponseKeys.MESSAGE.value: APIResponseMessage.TASKS_CREATED.value,
+            APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+            APIResponseKeys.RESULT.value: results,
+        }, HTTPStatus.CREATED if len(rows) == len(data) else HTTPStatus.MULTI_STATUS
+
+
 class CommentResource(Resource):
     """
     API Resource for managing comments on tasks.
@@ -440,7 +1139,7 @@ class CommentResource(Resource):
         method_decorators (list): A list of method decorators to apply to the resource methods.
     """
 
-    method_decorators = [require_basic_auth]
+    method_decorators = [require_auth]
 
     @validate_input({'comment': ['required']})
     def post(self, task_id):
@@ -456,6 +1155,7 @@ class CommentResource(Resource):
           - Comment Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
@@ -526,6 +1226,8 @@ class CommentResource(Resource):
         data = request.get_json()
         new_comment = Comment(content=data.get('comment'))
         task.comments.append(new_comment)
+        task.bump_version()
+        task_id, assignee_id = task.id, task.assigned_to_id
 
         try:
             db.session.commit()
@@ -535,17 +1237,20 @@ class CommentResource(Resource):
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_DELETE_COMMENT.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.BAD_REQUEST
+        invalidate_tasks([task_id], [assignee_id])
 
         return {
             APIResponseKeys.RESULT.value: CommentSchema().dump(new_comment),
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
         }, HTTPStatus.CREATED
 
+    @read_replica
     def get(self, task_id):
         """
-        Retrieve all comments on a task.
+        Retrieve the comments on a task, one page at a time.
 
-        This endpoint allows an authenticated user to retrieve all comments on a specific task.
+        Comments are ordered by creation time, oldest first unless sort is
+        '-created_at'. Pass the returned next_cursor to fetch the next page.
 
         Returns:
             list: A list containing comment data.
@@ -554,12 +1259,29 @@ class CommentResource(Resource):
           - Comment Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
             required: true
             type: string
             description: The ID of the task to retrieve comments from.
+          - in: query
+            name: limit
+            required: false
+            type: integer
+            description: Maximum number of comments returned.
+          - in: query
+            name: cursor
+            required: false
+            type: string
+            description: The next_cursor returned with the previous page.
+          - in: query
+            name: sort
+            required: false
+            type: string
+            enum: [created_at, -created_at]
+            description: Sort order, '-created_at' returns the newest comments first.
         definitions:
           CommentSchema:
             type: object
@@ -592,6 +1314,8 @@ class CommentResource(Resource):
               type: array
               items:
                 $ref: "#/definitions/CommentSchema"
+          400:
+            description: Invalid limit, cursor or sort
           404:
             description: Task not found
             content: application/json
@@ -605,15 +1329,57 @@ class CommentResource(Resource):
                   type: string
                   example: "error"
         """
-        task = Task.query.filter_by(id=task_id).first()
-        if not task:
+        try:
+            sort_columns, descending = parse_comment_sort(request.args.get('sort'))
+        except ValueError as error:
+            return {
+                APIResponseKeys.MESSAGE.value: str(error),
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        # The task is the outer side of the join, so a task without comments
+        # (left on this page) yields a single row with no comment, and a
+        # missing task yields no row at all.
+        join_on = [Comment.task_id == Task.id]
+        try:
+            limit = parse_limit(
+                request.args.get('limit'),
+                current_app.config['PAGINATION_DEFAULT_LIMIT'],
+                current_app.config['PAGINATION_MAX_LIMIT'],
+            )
+            if request.args.get('cursor'):
+                join_on.append(
+                    keyset_predicate(sort_columns, request.args['cursor'], descending)
+                )
+        except ValueError:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAGINATION.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        order_by = [column.desc() if descending else column for column in sort_columns]
+        rows = (
+            Task.query.with_entities(Task.id, Comment)
+            .outerjoin(Comment, and_(*join_on))
+            .filter(Task.id == task_id)
+            .order_by(*order_by)
+            .limit(limit + 1)
+            .all()
+        )
+        if not rows:
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
-        comments = [comment.to_json() for comment in task.comments]
+
+        comments = [comment for _, comment in rows if comment is not None]
+        next_cursor = None
+        if len(comments) > limit:
+            comments = comments[:limit]
+            next_cursor = encode_cursor(sort_columns, comments[-1])
         return {
-            APIResponseKeys.RESULT.value: comments,
+            APIResponseKeys.RESULT.value: [comment.to_json() for comment in comments],
+            APIResponseKeys.NEXT_CURSOR.value: next_cursor,
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
         }, HTTPStatus.OK
 
@@ -631,6 +1397,7 @@ class CommentResource(Resource):
           - Comment Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
@@ -695,26 +1462,32 @@ class CommentResource(Resource):
                   type: string
                   example: "error"
         """
-        task = Task.query.filter_by(id=task_id).first()
-        if not task:
-            return {
-                APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_NOT_FOUND.value,
-                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
-            }, HTTPStatus.NOT_FOUND
-        comment = Comment.query.filter_by(id=comment_id).first()
-        if not comment:
+        # Scoping by task_id rejects comments of another task in the same statement
+        statement = (
+            update(Comment)
+            .where(Comment.id == comment_id, Comment.task_id == task_id)
+            .values(content=request.get_json().get('comment'))
+            .execution_options(synchronize_session=False)
+        )
+        if supports_returning('update'):
+            comment = db.session.execute(statement.returning(Comment)).scalar()
+        else:
+            updated = db.session.execute(statement).rowcount
+            comment = db.session.get(Comment, comment_id) if updated else None
+        if comment is None:
+            db.session.rollback()
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.COMMENT_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
 
-        data = request.get_json()
-        comment.content = data.get('comment', comment.content)
-
+        task = touch_task(task_id)
+        response = comment.to_json()
         db.session.commit()
+        invalidate_tasks([task.id], [task.assigned_to_id])
 
         return {
-            APIResponseKeys.RESULT.value: comment.to_json(),
+            APIResponseKeys.RESULT.value: response,
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
         }, HTTPStatus.OK
 
@@ -731,6 +1504,7 @@ class CommentResource(Resource):
           - Comment Management
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: path
             name: task_id
@@ -768,18 +1542,20 @@ class CommentResource(Resource):
                   type: string
                   example: "error"
         """
-        task = Task.query.filter_by(id=task_id).first()
-        comment = Comment.query.filter_by(id=comment_id).first()
-
-        if not (comment and task):
+        deleted = db.session.execute(
+            delete(Comment)
+            .where(Comment.id == comment_id, Comment.task_id == task_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not deleted:
+            db.session.rollback()
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.RESOURCE_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
 
-        db.session.delete(comment)
-
         try:
+            task = touch_task(task_id)
             db.session.commit()
         except IntegrityError:
             db.session.rollback()
@@ -787,6 +1563,7 @@ class CommentResource(Resource):
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_DELETE_COMMENT.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.BAD_REQUEST
+        invalidate_tasks([task.id], [task.assigned_to_id])
 
         return {
             APIResponseKeys.MESSAGE.value: APIResponseMessage.COMMENT_DELETED.value,
@@ -806,7 +1583,7 @@ class AssignTaskResource(Resource):
 
     method_decorators = [
         role_required('admin'),  # Only admins can assign tasks to users
-        require_basic_auth,
+        require_auth,
     ]
 
     @validate_input({'user_id': ['required'], 'task_id': ['required']})
@@ -823,6 +1600,7 @@ class AssignTaskResource(Resource):
           - Task Assignment
         security:
           - basicAuth: []
+          - authBearer: []
         parameters:
           - in: body
             name: body
@@ -894,8 +1672,10 @@ class AssignTaskResource(Resource):
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.NOT_FOUND
 
-        # Assign the task to the user
+        # Assign the task to the user, cache tags are built from the stored ids
+        task_id, previous_assignee_id = task.id, task.assigned_to_id
         task.assigned_to_id = user_id
+        task.bump_version()
 
         try:
             db.session.commit()
@@ -905,6 +1685,7 @@ class AssignTaskResource(Resource):
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_ASSIGN_TASK.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
             }, HTTPStatus.BAD_REQUEST
+        invalidate_tasks([task_id], [previous_assignee_id, user.id])
 
         return {
             APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_ASSIGNED.value,
@@ -913,6 +1694,188 @@ class AssignTaskResource(Resource):
         }, HTTPStatus.CREATED
 
 
+class BulkAssignTaskResource(Resource):
+    """
+    API Resource for assigning many tasks at once.
+
+    All referenced users and tasks are validated with two queries, then the
+    tasks are reassigned with one UPDATE per target user in one transaction.
+
+    Attributes:
+        method_decorators (list): A list of method decorators to apply to the resource methods.
+    """
+
+    method_decorators = [
+        role_required('admin'),
+        require_auth,
+    ]
+
+    def post(self):
+        """
+        Assign many tasks.
+
+        This endpoint allows an admin to assign a list of tasks, each to its own user, or to move every
+        task assigned to one user to another user. Either all assignments are applied or none.
+
+        Returns:
+            tuple: A tuple containing response data and status code.
+        ---
+        tags:
+          - Task Assignment
+        security:
+          - basicAuth: []
+          - authBearer: []
+        parameters:
+          - in: body
+            name: body
+            required: true
+            schema:
+              type: object
+              properties:
+                assignments:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      task_id:
+                        type: integer
+                        example: 1
+                      user_id:
+                        type: integer
+                        example: 2
+                from_user_id:
+                  type: integer
+                  description: Used with to_user_id instead of assignments.
+                  example: 2
+                to_user_id:
+                  type: integer
+                  example: 3
+        responses:
+          200:
+            description: Tasks assigned, the result lists every assignment applied
+            content: application/json
+            schema:
+              type: object
+              properties:
+                result:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      task_id:
+                        type: integer
+                        example: 1
+                      user_id:
+                        type: integer
+                        example: 2
+                status:
+                  type: string
+                  example: "success"
+          400:
+            description: Invalid request payload
+          404:
+            description: Some users or tasks do not exist, nothing was assigned
+          413:
+            description: Too many assignments in a single request
+        """
+        data = request.get_json(silent=True)
+        try:
+            if 'assignments' in data:
+                if not isinstance(data['assignments'], list):
+                    raise TypeError
+                assignments = {}
+                for item in data['assignments']:
+                    task_id = item_id(item['task_id'])
+                    user_id = item_id(item['user_id'])
+                    # The same task cannot go to two users
+                    if assignments.setdefault(task_id, user_id) != user_id:
+                        raise ValueError
+            else:
+                from_user_id = item_id(data['from_user_id'])
+                to_user_id = item_id(data['to_user_id'])
+        except (KeyError, TypeError, ValueError):
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.INVALID_PAYLOAD.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
+
+        if 'assignments' in data:
+            if len(data['assignments']) > current_app.config['BULK_MAX_ITEMS']:
+                return {
+                    APIResponseKeys.MESSAGE.value: APIResponseMessage.TOO_MANY_ITEMS.value,
+                    APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+                }, HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            return self._assign(assignments)
+        return self._reassign(from_user_id, to_user_id)
+
+    @staticmethod
+    def _not_found(user_ids, task_ids=()):
+        return {
+            APIResponseKeys.MESSAGE.value: APIResponseMessage.RESOURCE_NOT_FOUND.value,
+            APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            APIResponseKeys.RESULT.value: {
+                'user_ids': sorted(user_ids),
+                'task_ids': sorted(task_ids),
+            },
+        }, HTTPStatus.NOT_FOUND
+
+    @staticmethod
+    def _missing_users(user_ids):
+        found = db.session.scalars(select(User.id).where(User.id.in_(list(user_ids))))
+        return set(user_ids).difference(found)
+
+    @staticmethod
+    def _assigned(pairs):
+        return {
+            APIResponseKeys.MESSAGE.value: APIResponseMessage.TASK_ASSIGNED.value,
+            APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
+            APIResponseKeys.RESULT.value: [
+                {'task_id': task_id, 'user_id': user_id}
+                for task_id, user_id in sorted(pairs)
+            ],
+        }, HTTPStatus.OK
+
+    def _assign(self, assignments):
+        """Apply task_id -> user_id assignments, one UPDATE per user."""
+        missing_users = self._missing_users(set(assignments.values()))
+        previous_assignees = dict(
+            db.session.execute(
+                select(Task.id, Task.assigned_to_id).where(
+                    Task.id.in_(list(assignments))
+                )
+            ).all()
+        )
+        missing_tasks = set(assignments).difference(previous_assignees)
+        if missing_users or missing_tasks:
+            return self._not_found(missing_users, missing_tasks)
+
+        tasks_by_user = {}
+        for task_id, user_id in assignments.items():
+            tasks_by_user.setdefault(user_id, []).append(task_id)
+        for user_id, task_ids in tasks_by_user.items():
+            update_tasks([Task.id.in_(task_ids)], {'assigned_to_id': user_id})
+        db.session.commit()
+        invalidate_tasks(
+            list(assignments),
+            [*previous_assignees.values(), *tasks_by_user],
+        )
+        return self._assigned(assignments.items())
+
+    def _reassign(self, from_user_id, to_user_id):
+        """Move every task of one user to another user with one UPDATE."""
+        missing_users = self._missing_users({from_user_id, to_user_id})
+        if missing_users:
+            return self._not_found(missing_users)
+
+        rows = update_tasks(
+            [Task.assigned_to_id == from_user_id], {'assigned_to_id': to_user_id}
+        )
+        db.session.commit()
+        task_ids = [row.id for row in rows]
+        invalidate_tasks(task_ids, [from_user_id, to_user_id])
+        return self._assigned((task_id, to_user_id) for task_id in task_ids)
+
+
 class AssignedTasksListResource(Resource):
     """
     API Resource for retrieving tasks assigned to the current user.
@@ -927,6 +1890,8 @@ class AssignedTasksListResource(Resource):
         jwt_required(),
     ]
 
+    @response_cache.cached(assigned_tasks_tags)
+    @read_replica
     def get(self):
         """
         Retrieve tasks assigned to the current user.
@@ -940,6 +1905,12 @@ class AssignedTasksListResource(Resource):
           - Task Assignment
         security:
           - authBearer: []
+        parameters:
+          - in: query
+            name: stream
+            required: false
+            type: boolean
+            description: Stream the tasks as newline delimited JSON, same as `Accept: application/x-ndjson` (optional).
         definitions:
           TaskSchema:
             type: object
@@ -990,9 +1961,15 @@ class AssignedTasksListResource(Resource):
                   example: "error"
         """
         current_user_id = get_jwt_identity()
-        tasks = Task.query.filter_by(assigned_to_id=current_user_id).all()
+        query = Task.query.options(*TASK_LOAD_OPTIONS).filter_by(
+            assigned_to_id=current_user_id
+        )
+        if wants_stream():
+            return stream_ndjson(query.order_by(Task.id), dump_task)
+
+        tasks = query.all()
 
         return {
-            APIResponseKeys.RESULT.value: TaskSchema(many=True).dump(tasks),
+            APIResponseKeys.RESULT.value: [dump_task(task) for task in tasks],
             APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
         }, HTTPStatus.OK
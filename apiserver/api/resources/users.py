@@ -10,21 +10,26 @@ from http import HTTPStatus
 
 # Third-party
 from flask import g, request
-from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
+from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_restful import Resource
+from sqlalchemy import delete, or_, update
 
 # First-party
-from apiserver.api.models import Role, User
+from apiserver.api.models import Task, User
 from apiserver.api.schemas import UserSchema
+from apiserver.api.schemas.compiled import dump_user
 from apiserver.commons.constants import APIResponse, APIResponseKeys, APIResponseMessage
+from apiserver.commons.database import read_replica
 from apiserver.commons.helpers import (
+    create_user_token,
     require_basic_auth,
     role_required,
     validate_data,
     validate_input,
 )
+from apiserver.commons.streaming import stream_ndjson, wants_stream
 from apiserver.commons.utilities import is_valid_email
-from apiserver.extensions import db
+from apiserver.extensions import credential_cache, db, response_cache, role_registry
 
 logger = logging.getLogger('TaskManagement.api')
 
@@ -118,7 +123,12 @@ class SignupResource(Resource):
             }, HTTPStatus.CONFLICT
 
         # Set the role to "user" if not provided
-        role_id = Role.query.filter_by(name=data.get('role', 'user')).first().id
+        role_id = role_registry.get_id(data.get('role', 'user'))
+        if role_id is None:
+            return {
+                APIResponseKeys.MESSAGE.value: APIResponseMessage.FAILED_TO_SIGN_UP.value,
+                APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
+            }, HTTPStatus.BAD_REQUEST
 
         # Create a new user with the role
         user = User(
@@ -128,10 +138,11 @@ class SignupResource(Resource):
             password=data['password'],
             role_id=role_id,  # Use the role value from above
         )
+        # Hashing errors propagate, a saturated pool answers 503
+        user.set_password(data['password'])
 
         try:
             # Add the user to the database
-            user.set_password(data['password'])
             db.session.add(user)
             db.session.commit()
         except Exception as _e:
@@ -197,9 +208,8 @@ class SigninResource(Resource):
                             example: "error"
         """
         try:
-            current_user = g.current_user
-            # Create an access token for the user
-            access_token = create_access_token(identity=current_user.id)
+            # Create an access token for the user, carrying the role as a claim
+            access_token = create_user_token(g.current_user_id, g.current_role)
             return {
                 APIResponseKeys.RESULT.value: {
                     'access_token': access_token,
@@ -227,6 +237,7 @@ class UserResource(Resource):
         jwt_required(),
     ]
 
+    @read_replica
     def get(self):
         """
         Fetches logged in User's details.
@@ -278,10 +289,8 @@ class UserResource(Resource):
         # Retrieve the user info of the authenticated user
         user = User.query.get(current_user_id)
         if user:
-            schema = UserSchema()
-            result = schema.dump(user)
             return {
-                APIResponseKeys.RESULT.value: result,
+                APIResponseKeys.RESULT.value: dump_user(user),
                 APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
             }, HTTPStatus.OK
         return {
@@ -304,6 +313,7 @@ class UsersListResource(Resource):
         require_basic_auth,
     ]
 
+    @read_replica
     def get(self):
         """Handle GET request for listing users.
 
@@ -314,6 +324,12 @@ class UsersListResource(Resource):
           - List all Users
         security:
           - basicAuth: []
+        parameters:
+          - in: query
+            name: stream
+            required: false
+            type: boolean
+            description: Stream the users as newline delimited JSON, same as `Accept: application/x-ndjson` (optional).
         responses:
           200:
             description: List of users retrieved successfully
@@ -359,11 +375,13 @@ class UsersListResource(Resource):
                 example: john.doe@example.com
         """
         # Retrieve list of all users in the system
-        schema = UserSchema(many=True)
+        query = User.query.order_by(User.created_at, User.id)
+        if wants_stream():
+            return stream_ndjson(query, dump_user)
+
         try:
-            query = User.query.order_by('created_at')
             return {
-                APIResponseKeys.RESULT.value: schema.dump(query),
+                APIResponseKeys.RESULT.value: [dump_user(user) for user in query],
                 APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
             }, HTTPStatus.OK
         except Exception as _e:
@@ -446,15 +464,32 @@ class DeleteAccount(Resource):
                   example: "error"
         """
         try:
-            user = User.query.get(user_id)
-            if user:
-                # Delete the user from the database
-                db.session.delete(user)
+            # Tasks of the user lose their creator or assignee through the
+            # ON DELETE SET NULL foreign keys, bump their versions first so
+            # clients holding their ETags see the change
+            db.session.execute(
+                update(Task)
+                .where(
+                    or_(Task.created_by_id == user_id, Task.assigned_to_id == user_id)
+                )
+                .values(version=Task.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            deleted = db.session.execute(
+                delete(User)
+                .where(User.id == user_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if deleted:
                 db.session.commit()
+                credential_cache.invalidate_user(int(user_id))
+                # Cached tasks may embed the deleted user
+                response_cache.invalidate('users')
                 return {
                     APIResponseKeys.MESSAGE.value: APIResponseMessage.DELETED_USER.value,
                     APIResponseKeys.STATUS.value: APIResponse.SUCCESS.value,
                 }, HTTPStatus.OK
+            db.session.rollback()
             return {
                 APIResponseKeys.MESSAGE.value: APIResponseMessage.USER_NOT_FOUND.value,
                 APIResponseKeys.STATUS.value: APIResponse.FAIL.value,
@@ -0,0 +1,101 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+
+"""Compile marshmallow schemas into plain serializer functions.
+
+Dumping through marshmallow resolves every field, its accessor and its
+options on each call. compile_schema() does that once per schema and
+generates a function which reads the attributes and converts the values
+directly, producing the same output as ``Schema().dump(obj)``.
+"""
+
+# Third-party
+from marshmallow import fields, missing
+from marshmallow.utils import get_func_args
+
+# First-party
+from apiserver.api.schemas.tasks import TaskSchema
+from apiserver.api.schemas.users import UserSchema
+
+# Fields converting a non null value with a single call
+CONVERTERS = {
+    fields.String: str,
+    fields.Integer: int,
+    fields.Boolean: bool,
+}
+
+
+def _converter(field):
+    """Return a function converting a non null value of a field, or None if
+    the field needs marshmallow's own serialization."""
+    if type(field) in CONVERTERS and not getattr(field, 'as_string', False):
+        return CONVERTERS[type(field)]
+    if type(field) is fields.DateTime and field.format in (None, 'iso'):
+        return lambda value: value.isoformat()
+    if type(field) is fields.Nested and not (field.many or field.schema.many):
+        return compile_schema(type(field.schema), only=field.only)
+    return None
+
+
+def compile_schema(schema_class, only=None):
+    """
+    Generate a serializer function equivalent to ``schema_class().dump``.
+
+    Args:
+        schema_class (type): Marshmallow schema to compile.
+        only (list): Field names to restrict the output to.
+
+    Returns:
+        function: Serializer taking one object and returning a dict.
+    """
+    schema = schema_class(only=only)
+    namespace = {'missing': missing}
+    lines = ['def serialize(obj):', '    result = {}']
+
+    for index, (name, field) in enumerate(schema.dump_fields.items()):
+        key = field.data_key if field.data_key is not None else name
+        namespace[f'field_{index}'] = field
+
+        if (
+            type(field) is fields.Function
+            and len(get_func_args(field.serialize_func)) == 1
+        ):
+            namespace[f'function_{index}'] = field.serialize_func
+            lines.append(f'    result[{key!r}] = function_{index}(obj)')
+            continue
+
+        convert = _converter(field)
+        if convert is None or field.dump_default is not missing:
+            # Fall back to marshmallow for anything else
+            lines += [
+                f'    value = field_{index}.serialize({name!r}, obj)',
+                '    if value is not missing:',
+                f'        result[{key!r}] = value',
+            ]
+            continue
+
+        namespace[f'convert_{index}'] = convert
+        attribute = field.attribute or name
+        lines += [
+            f'    value = getattr(obj, {attribute!r}, missing)',
+            '    if value is not missing:',
+            f'        result[{key!r}] = None if value is None else convert_{index}(value)',
+        ]
+
+    lines.append('    return result')
+    exec('\n'.join(lines), namespace)  # pylint: disable=W0122
+    return namespace['serialize']
+
+
+# Serializers used by the read endpoints
+dump_task = compile_schema(TaskSchema)
+# Columns of the task only, for rows returned by UPDATE ... RETURNING
+dump_task_row = compile_schema(
+    TaskSchema,
+    only=[
+        name
+        for name in TaskSchema().dump_fields
+        if name not in ('created_by', 'assigned_to')
+    ],
+)
+dump_user = compile_schema(UserSchema)
@@ -38,6 +38,7 @@ class TaskSchema(SQLAlchemyAutoSchema):
     recurring_task = ma.Boolean(data_key='recurringTask')
     estimate = ma.Integer(data_key='estimate')
     actual_time_spent = ma.Integer(data_key='actualTimeSpent')
+    version = ma.Integer(data_key='version')
 
     # Custom fields to enforce conversion
     type = ma.Function(lambda obj: obj.type.value)
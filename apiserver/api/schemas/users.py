@@ -9,8 +9,7 @@ from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 
 # First-party
 from apiserver.api.models.users import User
-from apiserver.api.schemas import RoleSchema
-from apiserver.extensions import db, ma
+from apiserver.extensions import db, ma, role_registry
 
 
 class UserSchema(SQLAlchemyAutoSchema):
@@ -29,4 +28,10 @@ class UserSchema(SQLAlchemyAutoSchema):
     first_name = ma.String(data_key='firstName')
     last_name = ma.String(data_key='lastName')
     created_at = ma.DateTime(data_key='createdAt')
-    role = ma.Nested(RoleSchema, data_key='role', only=['name'])
+
+    # Resolved through the role registry instead of loading the role
+    role = ma.Function(
+        lambda obj: None
+        if obj.role_id is None
+        else {'name': role_registry.get_name(obj.role_id)}
+    )
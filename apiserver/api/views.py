@@ -11,7 +11,10 @@ from flask_restful import Api
 from apiserver.api.resources import (
     AssignedTasksListResource,
     AssignTaskResource,
+    BulkAssignTaskResource,
+    BulkTaskResource,
     CommentResource,
+    DatabasePoolResource,
     DeleteAccount,
     SigninResource,
     SignupResource,
@@ -65,7 +68,13 @@ resource_config = {
         },
         {
             'endpoint': '/tasks',
-            'methods': ['GET'],
+            'methods': ['GET', 'PATCH'],
+        },
+    ],
+    BulkTaskResource: [
+        {
+            'endpoint': '/tasks/bulk',
+            'methods': ['POST'],
         },
     ],
     AssignedTasksListResource: [
@@ -80,6 +89,12 @@ resource_config = {
             'methods': ['POST'],
         },
     ],
+    BulkAssignTaskResource: [
+        {
+            'endpoint': '/assign-task/bulk',
+            'methods': ['POST'],
+        },
+    ],
     CommentResource: [
         {
             'endpoint': '/tasks/<string:task_id>/comments',
@@ -90,6 +105,12 @@ resource_config = {
             'methods': ['PUT', 'DELETE'],
         },
     ],
+    DatabasePoolResource: [
+        {
+            'endpoint': '/admin/db-pool',
+            'methods': ['GET'],
+        },
+    ],
 }
 
 for resource_class, methods_config in resource_config.items():
@@ -7,29 +7,48 @@ database connections, errors and exceptions.
 
 # Third-party
 from flasgger import Swagger
-from flask import Flask, jsonify, make_response
+from flask import Flask, Response, jsonify, make_response
 from werkzeug.exceptions import default_exceptions
 
 # First-party
 from apiserver import api, manage
 from apiserver.commons.constants import APIResponse
-from apiserver.extensions import db, jwt, migrate
+from apiserver.commons.database import configure_engine, configure_pools, pool_status
+from apiserver.commons.metrics import CONTENT_TYPE
+from apiserver.extensions import (
+    credential_cache,
+    db,
+    hashing_pool,
+    jwt,
+    migrate,
+    query_profiler,
+    request_metrics,
+    response_cache,
+    role_registry,
+)
 
 __author__ = 'hashmiatna@gmail.com'
 
 
-def create_app():
-    """Application factory used to create application."""
+def create_app(config=None):
+    """Application factory used to create application.
+
+    Args:
+        config (object): Optional configuration object overriding defaults.
+    """
     app = Flask('apiserver')
     app.config.from_object('apiserver.config')
 
     Swagger(app, config=configure_swagger(), merge=True)
 
     app.config.from_object('apiserver.config')
+    if config is not None:
+        app.config.from_object(config)
 
     configure_extensions(app)
     configure_cli(app)
     register_blueprints(app)
+    register_metrics(app)
     register_errors(app)
 
     return app
@@ -61,9 +80,19 @@ def configure_swagger():
 
 def configure_extensions(app):
     """Configure Flask extensions"""
+    configure_pools(app.config)
     db.init_app(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            configure_engine(engine)
+        query_profiler.init_app(app, db.engines.values())
+    request_metrics.init_app(app)
     jwt.init_app(app)
     migrate.init_app(app, db)
+    credential_cache.init_app(app)
+    hashing_pool.init_app(app)
+    role_registry.init_app(app)
+    response_cache.init_app(app)
 
 
 def configure_cli(app):
@@ -76,6 +105,24 @@ def register_blueprints(app):
     app.register_blueprint(api.views.blueprint)
 
 
+def register_metrics(app):
+    """Expose the metrics of the worker process on /metrics for Prometheus"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    def metrics():
+        pools = {
+            bind or 'default': pool_status(engine)
+            for bind, engine in db.engines.items()
+        }
+        body = request_metrics.render(
+            hashing=hashing_pool.metrics(), cache=response_cache.metrics(), pools=pools
+        )
+        return Response(body, content_type=CONTENT_TYPE)
+
+    app.add_url_rule('/metrics', 'metrics', metrics)
+
+
 def handle_exception(error):
     """Return JSON instead of HTML for HTTP errors"""
     response = {
@@ -85,7 +132,11 @@ def handle_exception(error):
         'code': error.code,
     }
 
-    return make_response(jsonify(response), error.code)
+    # Keep headers such as Retry-After set by the exception
+    headers = [
+        (name, value) for name, value in error.get_headers() if name != 'Content-Type'
+    ]
+    return make_response(jsonify(response), error.code, headers)
 
 
 def register_errors(app):
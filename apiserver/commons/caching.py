@@ -0,0 +1,279 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Response cache for read endpoints with tag based invalidation
+"""
+# Standard library
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from http import HTTPStatus
+
+# Third-party
+from flask import g, request
+from flask_jwt_extended import get_jwt_identity
+
+# First-party
+from apiserver.commons.etags import not_modified
+from apiserver.commons.streaming import wants_stream
+
+
+class MemoryBackend:
+    """
+    In-process LRU store with a TTL, private to each worker process.
+
+    Only the ``max_tags`` most recently bumped tags keep their own
+    generation, every other tag is at the floor generation. Forgetting a tag
+    raises the floor above every generation it had, which acts as a bump of
+    all the forgotten tags: the generations of a tag never repeat, so a
+    stale response can never be served again.
+
+    Attributes:
+        max_size (int): Maximum number of responses kept.
+        ttl (int): Number of seconds a response stays valid.
+        max_tags (int): Maximum number of tag generations kept.
+        evictions (int): Number of responses dropped to make room.
+    """
+
+    def __init__(self, max_size=1024, ttl=30, max_tags=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_tags = max_tags if max_tags is not None else 4 * max_size
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._generations = OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the response stored under key, or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Store a response, evicting the least recently used ones if full."""
+        with self._lock:
+            self._entries[key] = (entry, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def generations(self, tags):
+        """Return the current generation of every tag."""
+        with self._lock:
+            return [self._generations.get(tag, self._floor) for tag in tags]
+
+    def bump(self, tags):
+        """Move tags to a new generation."""
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, self._floor) + 1
+                self._generations.move_to_end(tag)
+            while len(self._generations) > self.max_tags:
+                _, generation = self._generations.popitem(last=False)
+                self._floor = max(self._floor, generation) + 1
+
+    def clear(self):
+        """Drop all responses and tag generations."""
+        with self._lock:
+            self._entries.clear()
+            self._floor = max([self._floor, *self._generations.values()]) + 1
+            self._generations.clear()
+
+
+class SharedBackend:
+    """
+    Store shared by all worker processes, backed by a Redis compatible client.
+
+    Responses are stored as JSON and expire after ``ttl`` seconds. Tag
+    generations are counters in the same store, so a write handled by one
+    worker invalidates the responses cached by every other worker.
+
+    Attributes:
+        client (object): Client exposing get, set, mget and incr.
+        ttl (int): Number of seconds a response stays valid.
+        prefix (str): Prefix of every key written by the cache.
+        evictions (int): Always 0, evictions are handled by the server.
+    """
+
+    def __init__(self, client, ttl=30, prefix='task-management:cache:'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the response stored under key, or None."""
+        raw = self.client.get(f'{self.prefix}response:{key}')
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, entry):
+        """Store a response until it expires."""
+        self.client.set(f'{self.prefix}response:{key}', json.dumps(entry), ex=self.ttl)
+
+    def generations(self, tags):
+        """Return the current generation of every tag."""
+        values = self.client.mget([f'{self.prefix}tag:{tag}' for tag in tags])
+        return [int(value or 0) for value in values]
+
+    def bump(self, tags):
+        """Move tags to a new generation."""
+        for tag in tags:
+            self.client.incr(f'{self.prefix}tag:{tag}')
+
+    def clear(self):
+        """Drop all responses, by moving on to a new prefix."""
+        self.prefix = f'{self.prefix}{time.time_ns()}:'
+
+
+def _caller():
+    if g.get('current_user_id') is not None:
+        return g.current_user_id
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        return None
+
+
+class ResponseCache:
+    """
+    Cache of successful JSON responses of read endpoints.
+
+    Each response is keyed by the endpoint, the query arguments, the caller
+    and the current generation of the tags it depends on. Write paths call
+    invalidate() with the tags they affect, which moves those tags to a new
+    generation: later reads compute new keys and the stale responses are
+    never served again, they simply age out of the store.
+
+    Attributes:
+        backend (object): MemoryBackend, SharedBackend, or None when disabled.
+        hits (int): Number of responses served from the cache.
+        misses (int): Number of cacheable requests which reached the handler.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Create the backend selected by RESPONSE_CACHE_BACKEND.
+        """
+        backend = app.config.get('RESPONSE_CACHE_BACKEND', 'memory')
+        ttl = app.config.get('RESPONSE_CACHE_TTL', 30)
+        if backend == 'memory':
+            self.backend = MemoryBackend(
+                app.config.get('RESPONSE_CACHE_MAX_SIZE', 1024), ttl
+            )
+        elif backend == 'redis':
+            # Optional dependency, only needed for the shared backend
+            # Third-party
+            import redis  # pylint: disable=C0415
+
+            client = redis.Redis.from_url(app.config['RESPONSE_CACHE_REDIS_URL'])
+            self.backend = SharedBackend(client, ttl)
+        elif backend == 'none':
+            self.backend = None
+        else:
+            raise ValueError(f'Unknown RESPONSE_CACHE_BACKEND: {backend}')
+        self.hits = self.misses = 0
+
+    def _key(self, tags):
+        args = sorted(request.args.items(multi=True))
+        generations = self.backend.generations(tags)
+        material = json.dumps([request.endpoint, args, _caller(), generations])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def cached(self, tags):
+        """
+        Decorator caching the successful responses of a read handler.
+
+        Streamed responses bypass the cache. A cached response is answered
+        with 304 when the client already holds it.
+
+        Args:
+            tags (function): Returns the tags the response depends on, or
+                None when the response must not be cached.
+
+        Returns:
+            function: The decorator.
+        """
+
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if self.backend is None or wants_stream():
+                    return func(*args, **kwargs)
+
+                response_tags = tags()
+                if response_tags is None:
+                    return func(*args, **kwargs)
+                key = self._key(response_tags)
+                entry = self.backend.get(key)
+                if entry is not None:
+                    with self._lock:
+                        self.hits += 1
+                    etag = entry['headers'].get('ETag')
+                    response = not_modified(etag) if etag else None
+                    if response is not None:
+                        return response
+                    return entry['data'], entry['status'], entry['headers']
+
+                with self._lock:
+                    self.misses += 1
+                result = func(*args, **kwargs)
+                if isinstance(result, tuple) and result[1] == HTTPStatus.OK:
+                    data, status, headers = (result + ({},))[:3]
+                    self.backend.set(
+                        key, {'data': data, 'status': int(status), 'headers': headers}
+                    )
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, *tags):
+        """
+        Invalidate every cached response depending on one of the tags.
+
+        Args:
+            *tags: Tags affected by a write.
+        """
+        if self.backend is not None and tags:
+            self.backend.bump(tags)
+
+    def clear(self):
+        """
+        Drop all cached responses.
+        """
+        if self.backend is not None:
+            self.backend.clear()
+
+    def metrics(self):
+        """
+        Snapshot of the cache counters.
+
+        Returns:
+            dict: Number of hits, misses and evictions.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.backend.evictions if self.backend else 0,
+            }
@@ -10,7 +10,8 @@ from datetime import datetime
 
 # Define constants for string literals
 TASK_UUID_DEFAULT = str(uuid.uuid4())
-TASK_DATETIME_DEFAULT = datetime.utcnow()
+# Called for every row, not once at import time
+TASK_DATETIME_DEFAULT = datetime.utcnow
 TASKS_ID = 'tasks.id'
 ALLOWED_FIELDS_TO_UPDATE = [
     'title',
@@ -21,6 +22,15 @@ ALLOWED_FIELDS_TO_UPDATE = [
     'estimate',
     'actual_time_spent',
 ]
+# Titles are unique, so they cannot be set on many tasks at once
+ALLOWED_FIELDS_TO_BULK_UPDATE = [
+    field for field in ALLOWED_FIELDS_TO_UPDATE if field != 'title'
+]
+ALLOWED_FIELDS_TO_CREATE = ALLOWED_FIELDS_TO_UPDATE + [
+    'type',
+    'assigned_to_id',
+    'recurring_task',
+]
 
 
 class APIResponse(enum.Enum):
@@ -37,6 +47,7 @@ class APIResponseKeys(enum.Enum):
     MESSAGE = 'message'
     STATUS = 'status'
     RESULT = 'result'
+    NEXT_CURSOR = 'next_cursor'
 
 
 class APIResponseMessage(enum.Enum):
@@ -58,12 +69,19 @@ class APIResponseMessage(enum.Enum):
     TASK_ASSIGNED = 'Task assigned successfully.'
     FAILED_TO_CREATE_TASK = 'Failed to create task.'
     TASK_CREATED = 'Task created successfully.'
+    TASKS_CREATED = 'Tasks created.'
+    TOO_MANY_ITEMS = 'Too many items in a single request.'
+    FILTER_TOO_BROAD = 'Filter matches too many tasks, narrow it down.'
+    INVALID_PAYLOAD = 'Invalid request payload.'
     TASK_UPDATED = 'Task updated successfully.'
+    TASK_MODIFIED = 'Task was modified since it was read.'
+    TASKS_UPDATED = 'Tasks updated.'
     COMMENT_DELETED = 'Comment successfully deleted.'
     TASK_DELETED = 'Task deleted successfully'
     TASK_NOT_FOUND = 'Task does not exist'
     COMMENT_NOT_FOUND = 'Comment ID does not exist.'
     RESOURCE_NOT_FOUND = 'Requested resource(s) does not exist.'
+    INVALID_PAGINATION = 'Invalid limit or cursor.'
 
 
 class PriorityLevel(enum.Enum):
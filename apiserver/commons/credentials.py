@@ -0,0 +1,123 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Defines CredentialCache class
+"""
+# Standard library
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class CredentialCache:
+    """
+    Bounded, TTL based cache of verified credentials.
+
+    Entries are keyed by an HMAC digest of (email, password) under a per-process
+    random key, so neither the plaintext password nor a reusable hash of it is
+    ever stored. Each entry remembers the password hash it was verified against,
+    hence a password change invalidates it even if nobody calls invalidate_user().
+
+    Attributes:
+        max_size (int): Maximum number of entries kept, 0 disables the cache.
+        ttl (int): Number of seconds an entry stays valid.
+    """
+
+    def __init__(self, max_size=1024, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._key = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Read cache limits from application config.
+        """
+        self.max_size = app.config.get('AUTH_CACHE_MAX_SIZE', self.max_size)
+        self.ttl = app.config.get('AUTH_CACHE_TTL', self.ttl)
+        self.clear()
+
+    def _digest(self, email, password):
+        message = f'{email}\x00{password}'.encode('utf-8')
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def is_verified(self, email, password, user_id, password_hash):
+        """
+        Check if credentials were recently verified against the given hash.
+
+        Args:
+            email (str): Email used as username.
+            password (str): Plain text password received in the request.
+            user_id (int): ID of the user the email resolved to.
+            password_hash (str): Password hash currently stored for the user.
+
+        Returns:
+            bool: True if a valid entry exists, False otherwise.
+        """
+        if not self.max_size:
+            return False
+        digest = self._digest(email, password)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return False
+            cached_user_id, cached_hash, expires_at = entry
+            if (
+                expires_at < time.monotonic()
+                or cached_user_id != user_id
+                or not hmac.compare_digest(cached_hash, password_hash)
+            ):
+                del self._entries[digest]
+                return False
+            self._entries.move_to_end(digest)
+            return True
+
+    def add(self, email, password, user_id, password_hash):
+        """
+        Remember credentials which have just been verified.
+
+        Args:
+            email (str): Email used as username.
+            password (str): Plain text password received in the request.
+            user_id (int): ID of the authenticated user.
+            password_hash (str): Password hash the credentials were checked against.
+        """
+        if not self.max_size:
+            return
+        digest = self._digest(email, password)
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[digest] = (user_id, password_hash, expires_at)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id):
+        """
+        Drop all entries belonging to a user.
+
+        Args:
+            user_id (int): ID of the user whose entries are dropped.
+        """
+        with self._lock:
+            stale = [
+                digest
+                for digest, (cached_user_id, _, _) in self._entries.items()
+                if cached_user_id == user_id
+            ]
+            for digest in stale:
+                del self._entries[digest]
+
+    def clear(self):
+        """
+        Drop all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
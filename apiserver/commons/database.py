@@ -0,0 +1,282 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Engine configuration and session routing of the database connections
+"""
+# Standard library
+import bisect
+import os
+import random
+import threading
+import time
+import weakref
+from functools import wraps
+
+# Third-party
+from flask import current_app, g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
+
+# Upper bounds, in seconds, of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolWaitMetrics:
+    """
+    Time spent by requests waiting for a pooled connection.
+
+    The wait includes opening a new connection when the pool has room for
+    one, and ends with a timeout when the pool stays exhausted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+        self._wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def record(self, elapsed, timed_out=False):
+        """Record one checkout attempt."""
+        with self._lock:
+            self._checkouts += 1
+            self._timeouts += timed_out
+            self._wait_sum += elapsed
+            self._wait_max = max(self._wait_max, elapsed)
+            self._wait_buckets[bisect.bisect_left(WAIT_BUCKETS, elapsed)] += 1
+
+    def snapshot(self):
+        """
+        Snapshot of the wait metrics.
+
+        Returns:
+            dict: Number of checkouts and timeouts, total and longest wait, and
+                the wait histogram as cumulative counts keyed by bucket upper
+                bound.
+        """
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip(WAIT_BUCKETS + (float('inf'),), self._wait_buckets):
+                cumulative += count
+                buckets[bound] = cumulative
+            return {
+                'checkouts': self._checkouts,
+                'timeouts': self._timeouts,
+                'wait_sum': self._wait_sum,
+                'wait_max': self._wait_max,
+                'wait_buckets': buckets,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool measuring how long each checkout waits for a connection.
+
+    The metrics survive recreate(), i.e. engine.dispose().
+    """
+
+    # Log under sqlalchemy.pool, whose level SQLAlchemy keeps at WARN
+    _sqla_logger_namespace = 'sqlalchemy.pool.impl.InstrumentedQueuePool'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_metrics = PoolWaitMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_metrics = self.wait_metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_metrics.record(time.perf_counter() - started)
+        return connection
+
+
+def pool_options(uri, config):
+    """
+    Engine options configuring the connection pool of a database.
+
+    An in-memory SQLite database lives in its single connection, which
+    Flask-SQLAlchemy keeps in a StaticPool, so it gets no pool options.
+
+    Args:
+        uri (str): URI of the database.
+        config (dict): Application config holding the DB_POOL_* settings.
+
+    Returns:
+        dict: Engine options.
+    """
+    url = make_url(uri)
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}
+    return {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING'],
+    }
+
+
+def configure_pools(config):
+    """
+    Add the pool options matching each database URI to the engine options.
+
+    Options set explicitly in SQLALCHEMY_ENGINE_OPTIONS, or in the options of
+    a bind, take precedence.
+
+    Args:
+        config (dict): Application config, updated in place.
+    """
+    uri = config.get('SQLALCHEMY_DATABASE_URI')
+    if uri:
+        config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            **pool_options(uri, config),
+            **config.get('SQLALCHEMY_ENGINE_OPTIONS', {}),
+        }
+    binds = {}
+    for key, value in config.get('SQLALCHEMY_BINDS', {}).items():
+        options = {'url': value} if isinstance(value, str) else dict(value)
+        binds[key] = {**pool_options(options['url'], config), **options}
+    config['SQLALCHEMY_BINDS'] = binds
+
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+def reset_after_fork(engine):
+    """
+    Forget the connections a child process inherited from its parent.
+
+    Sockets opened before a pre-forking server forks its workers are shared
+    with the parent, using them from two processes corrupts the protocol
+    state. The pooled connections are dropped without being closed, as the
+    parent still owns them.
+
+    Args:
+        engine (Engine): The engine to reset.
+    """
+    engine.dispose(close=False)
+
+
+def configure_engine(engine):
+    """
+    Prepare an engine created by Flask-SQLAlchemy.
+
+    SQLite ignores foreign keys unless asked on every connection, while the
+    ON DELETE actions of the schema are relied upon to delete tasks and users
+    with a single statement. Every engine is reset in forked children.
+
+    Args:
+        engine (Engine): The engine to configure.
+    """
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', _enable_foreign_keys)
+
+    engine_ref = weakref.ref(engine)
+
+    def _after_fork():
+        forked_engine = engine_ref()
+        if forked_engine is not None:
+            reset_after_fork(forked_engine)
+
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def pool_status(engine):
+    """
+    Describe the connection pool of an engine.
+
+    Args:
+        engine (Engine): The engine to describe.
+
+    Returns:
+        dict: Pool class and, for queue pools, its size and the number of
+            idle, checked out and overflow connections, plus the checkout
+            wait metrics when the pool is instrumented.
+    """
+    pool = engine.pool
+    status = {'pool': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,  # pylint: disable=W0212
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.wait_metrics.snapshot())
+    return status
+
+
+def read_replica(func):
+    """
+    Decorator sending the reads of a resource method to a read replica.
+
+    The routing lasts for the rest of the request, so that a response
+    streamed after the method returned is read from the same replica. It has
+    no effect when no replica is configured.
+
+    Args:
+        func (function): The read-only resource method.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        g.read_replica = True
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class RoutingSession(Session):
+    """
+    Session sending the reads of replica routed requests to a read replica.
+
+    Only plain SELECT statements are routed, any flush or DML statement is
+    sent to the primary and keeps every later read of the request on the
+    primary too, so that a request reads its own writes. The replica is
+    picked at random among DATABASE_REPLICA_BINDS once per request.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_app_context():
+            if self._flushing or isinstance(clause, UpdateBase):
+                g.primary_only = True
+            elif (
+                isinstance(clause, Select) and clause._for_update_arg is None
+            ):  # pylint: disable=W0212
+                engine = self._replica_engine()
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _replica_engine(self):
+        if not g.get('read_replica') or g.get('primary_only'):
+            return None
+        if 'replica_bind' not in g:
+            replicas = current_app.config.get('DATABASE_REPLICA_BINDS') or ()
+            g.replica_bind = random.choice(replicas) if replicas else None
+        if g.replica_bind is None:
+            return None
+        return self._db.engines[g.replica_bind]
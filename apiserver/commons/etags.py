@@ -0,0 +1,89 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Entity tags and conditional GET for task responses
+"""
+# Standard library
+import hashlib
+
+# Third-party
+from flask import Response, request
+from werkzeug.http import quote_etag, unquote_etag
+
+
+def task_etag(tasks, *extra):
+    """
+    Compute a strong entity tag for a list of tasks.
+
+    The tag is derived from the id and version of every task, which change
+    whenever the task or one of its comments is written, so it can be
+    computed without serializing the response.
+
+    Args:
+        tasks (list): Tasks included in the response, in response order.
+        *extra: Other values the response depends on, e.g. the next cursor.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for task in tasks:
+        digest.update(f'{task.id}:{task.version};'.encode('ascii'))
+    for value in extra:
+        digest.update(f'|{value}'.encode('utf-8'))
+    return quote_etag(digest.hexdigest())
+
+
+def version_etag(task_id, version):
+    """
+    Compute the entity tag of a single task.
+
+    Unlike task_etag() the version can be read back from the tag, so that
+    conditional writes can compare it in SQL, see if_match_versions().
+
+    Args:
+        task_id (int): ID of the task.
+        version (int): Current version of the task.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    return quote_etag(f'{task_id}-{version}')
+
+
+def if_match_versions(task_id):
+    """
+    Read the versions of a task listed in the ``If-Match`` header.
+
+    Args:
+        task_id (int): ID of the task being written.
+
+    Returns:
+        list: Versions the client expects, empty if none of the tags belongs
+            to the task, or None if the write is unconditional (no header or
+            ``*``).
+    """
+    if not request.if_match or request.if_match.star_tag:
+        return None
+    versions = []
+    for tag in request.if_match.as_set():
+        tag_task_id, _, version = tag.rpartition('-')
+        if tag_task_id == str(task_id) and version.isdigit():
+            versions.append(int(version))
+    return versions
+
+
+def not_modified(etag):
+    """
+    Check the ``If-None-Match`` header of the current request.
+
+    Args:
+        etag (str): Quoted entity tag of the current representation.
+
+    Returns:
+        Response: An empty 304 response if the client already holds this
+            representation, None otherwise.
+    """
+    if request.if_none_match.contains_weak(unquote_etag(etag)[0]):
+        return Response(status=304, headers={'ETag': etag})
+    return None
@@ -0,0 +1,140 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Translate query arguments into SQL predicates and ordering for tasks and comments
+"""
+# Standard library
+from datetime import datetime
+
+# First-party
+from apiserver.api.models import Comment, Task
+from apiserver.commons.constants import PriorityLevel, TaskStatus, TaskType
+from apiserver.commons.utilities import parse_enum
+
+# Filters matched against enum values or names, multiple values are comma separated
+TASK_ENUM_FILTERS = {
+    'status': (Task.status, TaskStatus),
+    'priority': (Task.priority, PriorityLevel),
+    'type': (Task.type, TaskType),
+}
+TASK_ID_FILTERS = {
+    'assigned_to_id': Task.assigned_to_id,
+    'created_by_id': Task.created_by_id,
+}
+TASK_RANGE_FILTERS = {
+    'due_date_from': lambda value: Task.due_date >= value,
+    'due_date_to': lambda value: Task.due_date <= value,
+}
+TASK_FILTER_FIELDS = (*TASK_ENUM_FILTERS, *TASK_ID_FILTERS, *TASK_RANGE_FILTERS)
+
+# Sortable columns, prefix the name with '-' to sort in descending order
+TASK_SORT_FIELDS = {
+    'created_at': Task.created_at,
+    'updated_at': Task.updated_at,
+    'title': Task.title,
+}
+TASK_DEFAULT_SORT = 'created_at'
+COMMENT_SORT_FIELDS = {
+    'created_at': Comment.created_at,
+}
+COMMENT_DEFAULT_SORT = 'created_at'
+
+
+def _split(value):
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [item.strip() for item in str(value).split(',') if item.strip()]
+
+
+def parse_task_filters(args):
+    """
+    Build SQL predicates from task filter arguments.
+
+    Values are validated before any query is built: enum filters accept the
+    enum values defined in constants.py or their names, id filters accept integers and
+    due date filters accept ISO 8601 dates.
+
+    Args:
+        args (dict): Query arguments or JSON data holding filter values.
+
+    Returns:
+        list: SQLAlchemy predicates to be combined with AND.
+
+    Raises:
+        ValueError: If a filter value is not valid.
+    """
+    predicates = []
+    for name, (column, enum_class) in TASK_ENUM_FILTERS.items():
+        if args.get(name) is None:
+            continue
+        try:
+            members = [parse_enum(enum_class, value) for value in _split(args[name])]
+        except ValueError as error:
+            allowed = ', '.join(member.value for member in enum_class)
+            raise ValueError(f'Invalid {name}, allowed values: {allowed}.') from error
+        predicates.append(column.in_(members))
+
+    for name, column in TASK_ID_FILTERS.items():
+        if args.get(name) is None:
+            continue
+        try:
+            ids = [int(value) for value in _split(args[name])]
+        except ValueError as error:
+            raise ValueError(f'Invalid {name}, expected integer(s).') from error
+        predicates.append(column.in_(ids))
+
+    for name, predicate in TASK_RANGE_FILTERS.items():
+        if args.get(name) is None:
+            continue
+        try:
+            predicates.append(predicate(datetime.fromisoformat(str(args[name]))))
+        except ValueError as error:
+            raise ValueError(f'Invalid {name}, expected an ISO 8601 date.') from error
+
+    return predicates
+
+
+def parse_task_sort(value):
+    """
+    Resolve a sort argument to the columns used for keyset pagination.
+
+    Args:
+        value (str): Sort field name, optionally prefixed with '-'.
+
+    Returns:
+        tuple: Columns to order by (the primary key last) and whether the
+            order is descending.
+
+    Raises:
+        ValueError: If the field is not sortable.
+    """
+    value = value or TASK_DEFAULT_SORT
+    descending = value.startswith('-')
+    field = value.lstrip('-')
+    if field not in TASK_SORT_FIELDS:
+        allowed = ', '.join(TASK_SORT_FIELDS)
+        raise ValueError(f'Invalid sort, allowed fields: {allowed}.')
+    return [TASK_SORT_FIELDS[field], Task.id], descending
+
+
+def parse_comment_sort(value):
+    """
+    Resolve a sort argument of the comment list, see parse_task_sort().
+
+    Args:
+        value (str): Sort field name, optionally prefixed with '-'.
+
+    Returns:
+        tuple: Columns to order by (the primary key last) and whether the
+            order is descending.
+
+    Raises:
+        ValueError: If the field is not sortable.
+    """
+    value = value or COMMENT_DEFAULT_SORT
+    descending = value.startswith('-')
+    field = value.lstrip('-')
+    if field not in COMMENT_SORT_FIELDS:
+        allowed = ', '.join(COMMENT_SORT_FIELDS)
+        raise ValueError(f'Invalid sort, allowed fields: {allowed}.')
+    return [COMMENT_SORT_FIELDS[field], Comment.id], descending
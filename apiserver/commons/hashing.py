@@ -0,0 +1,166 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Defines HashingPool class
+"""
+# Standard library
+import bisect
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Third-party
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Upper bounds, in seconds, of the hash latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class HashingPoolBusy(ServiceUnavailable):
+    """Raised when the hashing pool sheds a request because its queue is full."""
+
+    description = 'Too many authentication requests, retry later.'
+
+
+class HashingPool:
+    """
+    Bounded process pool running password hashing off the request threads.
+
+    At most ``max_pending`` hashes are admitted at a time, counting those
+    running and those waiting for a worker. Requests beyond that are rejected
+    immediately with HashingPoolBusy, so a burst of sign-ins fails fast
+    instead of slowing down every other endpoint.
+
+    The executor is created lazily in the process using it, so a pool set up
+    before a server forks its workers is not shared with them.
+
+    Attributes:
+        workers (int): Number of worker processes, 0 hashes in the calling thread.
+        max_pending (int): Maximum number of hashes admitted at a time.
+        retry_after (int): Seconds clients are asked to wait when rejected.
+    """
+
+    def __init__(self, workers=2, max_pending=16, retry_after=1):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._reset_metrics()
+
+    def init_app(self, app):
+        """
+        Read pool limits from application config.
+        """
+        self.shutdown()
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', self.workers)
+        self.max_pending = app.config.get('PASSWORD_HASH_MAX_PENDING', self.max_pending)
+        self.retry_after = app.config.get('PASSWORD_HASH_RETRY_AFTER', self.retry_after)
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        self._pending = 0
+        self._hashes = 0
+        self._rejected = 0
+        self._latency_sum = 0.0
+        self._latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+            return self._executor
+
+    def shutdown(self):
+        """
+        Stop the worker processes, they are started again when needed.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, function, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise HashingPoolBusy(retry_after=self.retry_after)
+            self._pending += 1
+
+        started = time.perf_counter()
+        try:
+            if not self.workers:
+                return function(*args)
+            try:
+                return self._get_executor().submit(function, *args).result()
+            except BrokenProcessPool as error:
+                self.shutdown()
+                raise HashingPoolBusy(retry_after=self.retry_after) from error
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._pending -= 1
+                self._hashes += 1
+                self._latency_sum += elapsed
+                self._latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def generate(self, password):
+        """
+        Hash a password.
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The password hash.
+
+        Raises:
+            HashingPoolBusy: If the pool is saturated.
+        """
+        return self._run(generate_password_hash, password)
+
+    def check(self, password_hash, password):
+        """
+        Check a password against a hash.
+
+        Args:
+            password_hash (str): The stored password hash.
+            password (str): The plain text password.
+
+        Returns:
+            bool: True if the password matches, False otherwise.
+
+        Raises:
+            HashingPoolBusy: If the pool is saturated.
+        """
+        return self._run(check_password_hash, password_hash, password)
+
+    def metrics(self):
+        """
+        Snapshot of the pool metrics.
+
+        Returns:
+            dict: Current queue depth, its limit, the number of hashes computed
+                and rejected, and the latency histogram as cumulative counts
+                keyed by bucket upper bound.
+        """
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip(
+                LATENCY_BUCKETS + (float('inf'),), self._latency_buckets
+            ):
+                cumulative += count
+                buckets[bound] = cumulative
+            return {
+                'queue_depth': self._pending,
+                'max_queue_depth': self.max_pending,
+                'hashes': self._hashes,
+                'rejected': self._rejected,
+                'latency_sum': self._latency_sum,
+                'latency_buckets': buckets,
+            }
@@ -10,12 +10,80 @@ from http import HTTPStatus
 
 # Third-party
 from flask import g, request
-from flask_jwt_extended import get_jwt_identity
+from flask_jwt_extended import (
+    create_access_token,
+    get_jwt,
+    get_jwt_identity,
+    verify_jwt_in_request,
+)
 
 # First-party
 from apiserver.api.models import User
 from apiserver.commons.constants import APIResponse, APIResponseKeys, APIResponseMessage
 from apiserver.commons.utilities import authenticate_user
+from apiserver.extensions import role_registry
+
+# Name of the access token claim holding the role of the user
+ROLE_CLAIM = 'role'
+
+
+def authenticate_request():
+    """
+    Resolve the principal of the current request.
+
+    The request is authenticated only once, either through a Bearer token or
+    through Basic Authentication, and the outcome is stored on ``g`` as
+    ``current_user_id`` and ``current_role`` so every decorator in the chain
+    and the handler reuse it instead of verifying credentials again.
+
+    Bearer tokens carry the role of the user as a claim, so they are
+    authorized without a database query. Tokens issued without the claim are
+    resolved against the database.
+
+    Returns:
+        int: The id of the authenticated user, or None if authentication fails.
+    """
+    if 'current_user_id' in g:
+        return g.current_user_id
+
+    current_user_id, current_role = None, None
+    authorization_header = request.headers.get('Authorization', '')
+    if authorization_header.startswith('Bearer '):
+        # If the header starts with 'Bearer ', assume JWT authentication
+        verify_jwt_in_request()
+        current_user_id = get_jwt_identity()
+        current_role = get_jwt().get(ROLE_CLAIM)
+        if current_role is None:
+            user = User.query.get(current_user_id)
+            current_user_id = user.id if user else None
+            current_role = role_registry.get_name(user.role_id) if user else None
+    elif request.authorization:
+        # Otherwise, assume Basic Authentication
+        user = authenticate_user(
+            request.authorization.username,
+            request.authorization.password,
+        )
+        if user:
+            current_user_id = user.id
+            current_role = role_registry.get_name(user.role_id)
+
+    g.current_user_id = current_user_id
+    g.current_role = current_role
+    return current_user_id
+
+
+def create_user_token(user_id, role):
+    """
+    Issue an access token for a user, carrying the role as a claim.
+
+    Args:
+        user_id (int): The id of the user.
+        role (str): The name of the role of the user.
+
+    Returns:
+        str: The encoded access token.
+    """
+    return create_access_token(identity=user_id, additional_claims={ROLE_CLAIM: role})
 
 
 def role_required(required_role):
@@ -23,7 +91,8 @@ def role_required(required_role):
     Decorator to check if the current user has the required role.
 
     This decorator checks the role of the current user and ensures that they have
-    the required role to access the decorated API endpoint.
+    the required role to access the decorated API endpoint. The principal
+    resolved by an outer authentication decorator is reused.
 
     Args:
         required_role (str): The required role name.
@@ -36,37 +105,55 @@ def role_required(required_role):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if 'Authorization' in request.headers:
-                # Check if the 'Authorization' header is present in the request
-                authorization_header = request.headers['Authorization']
-                if authorization_header.startswith('Bearer '):
-                    # If the header starts with 'Bearer ', assume JWT authentication
-                    current_user_id = get_jwt_identity()
-                    current_user = User.query.get(current_user_id)
-                else:
-                    # If it doesn't start with 'Bearer ', assume Basic Authentication
-                    username, password = (
-                        request.authorization.username,
-                        request.authorization.password,
-                    )
-                    current_user = authenticate_user(username, password)
-
-                if not current_user:
-                    return {
-                        'message': APIResponseMessage.INVALID_CREDENTIALS.value
-                    }, HTTPStatus.UNAUTHORIZED
-
-                if current_user.role.name == required_role:
-                    g.current_user = current_user
-                    return func(*args, **kwargs)
+            if 'Authorization' not in request.headers:
                 return {
-                    'message': APIResponseMessage.ACCESS_DENIED.value
-                }, HTTPStatus.FORBIDDEN
+                    'message': APIResponseMessage.MISSING_AUTH_HEADER.value
+                }, HTTPStatus.UNAUTHORIZED
+
+            if not authenticate_request():
+                return {
+                    'message': APIResponseMessage.INVALID_CREDENTIALS.value
+                }, HTTPStatus.UNAUTHORIZED
+
+            if g.current_role == required_role:
+                return func(*args, **kwargs)
+            return {
+                'message': APIResponseMessage.ACCESS_DENIED.value
+            }, HTTPStatus.FORBIDDEN
+
+        return wrapper
+
+    return decorator
+
+
+def require_auth(func):
+    """
+    A decorator that authenticates the user with either a Bearer token or
+    Basic Authentication.
+
+    Args:
+        func (function): The function to be decorated.
+
+    Returns:
+        function: The decorated function.
+
+    Raises:
+        Unauthorized (HTTPStatus.UNAUTHORIZED): If authentication fails.
+    """
+
+    @wraps(func)
+    def decorator(*args, **kwargs):
+        if 'Authorization' not in request.headers:
             return {
                 'message': APIResponseMessage.MISSING_AUTH_HEADER.value
             }, HTTPStatus.UNAUTHORIZED
 
-        return wrapper
+        if not authenticate_request():
+            return {
+                'message': APIResponseMessage.INVALID_CREDENTIALS.value
+            }, HTTPStatus.UNAUTHORIZED
+
+        return func(*args, **kwargs)
 
     return decorator
 
@@ -92,18 +179,16 @@ def require_basic_auth(func):
             return {
                 'message': APIResponseMessage.MISSING_AUTH_HEADER.value
             }, HTTPStatus.UNAUTHORIZED
-        username, password = (
-            request.authorization.username,
-            request.authorization.password,
-        )
-        current_user = authenticate_user(username, password)
 
-        if not current_user:
+        if (
+            not request.authorization
+            or request.authorization.type != 'basic'
+            or not authenticate_request()
+        ):
             return {
                 'message': APIResponseMessage.INVALID_CREDENTIALS.value
             }, HTTPStatus.UNAUTHORIZED
 
-        g.current_user = current_user
         return func(*args, **kwargs)
 
     return decorator
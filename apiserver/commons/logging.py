@@ -21,16 +21,32 @@ class Logger:
 
         self.log_path = os.getenv('LOG_FILE_PATH')
         self.filename = 'task_manager_api.log'
+        self.slow_query_filename = 'task_manager_slow_queries.log'
 
         if os.path.isfile(self._config):
-            self.init_config(self._config, self.log_path, self.filename, self.root_dir)
+            self.init_config(
+                self._config,
+                self.log_path,
+                self.filename,
+                self.root_dir,
+                self.slow_query_filename,
+            )
 
     @staticmethod
-    def init_config(config, _path, filename, root=None):
+    def init_config(
+        config,
+        _path,
+        filename,
+        root=None,
+        slow_query_filename='task_manager_slow_queries.log',
+    ):
         """
         Initialise logger configuration from config file
         """
         log_file = os.path.join(root, _path, filename)
+        slow_query_log_file = os.path.join(root, _path, slow_query_filename)
         logging.config.fileConfig(
-            config, disable_existing_loggers=False, defaults={'log_file': log_file}
+            config,
+            disable_existing_loggers=False,
+            defaults={'log_file': log_file, 'slow_query_log_file': slow_query_log_file},
         )
@@ -0,0 +1,395 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Request and database metrics exposed in the Prometheus text format
+"""
+# Standard library
+import bisect
+import threading
+import time
+
+# Third-party
+from flask import g, request
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds, in seconds, of the request and database time histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the number of statements per request histogram buckets
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """
+    Observations counted per bucket, cumulated only when rendered.
+
+    Attributes:
+        bounds (tuple): Upper bounds of the buckets, the last one is +Inf.
+        counts (list): Number of observations falling in each bucket.
+        total (float): Sum of the observations.
+    """
+
+    __slots__ = ('bounds', 'counts', 'total')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def merge(self, other):
+        """Add the observations of another histogram with the same bounds."""
+        for index, count in enumerate(list(other.counts)):
+            self.counts[index] += count
+        self.total += other.total
+
+    def cumulative(self):
+        """Return the cumulative counts keyed by bucket upper bound."""
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.bounds + (float('inf'),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return buckets
+
+
+class _ThreadStats:
+    """Metrics of the requests handled by one thread, written by it alone."""
+
+    def __init__(self):
+        self.requests = {}
+        self.errors = {}
+        self.latency = {}
+        self.db_queries = {}
+        self.db_time = {}
+
+    @staticmethod
+    def observe(histograms, key, bounds, value):
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(bounds)
+        histogram.observe(value)
+
+
+def _merge_counters(target, source):
+    for key, value in list(source.items()):
+        target[key] = target.get(key, 0) + value
+
+
+def _merge_histograms(target, source, bounds):
+    for key, histogram in list(source.items()):
+        target.setdefault(key, Histogram(bounds)).merge(histogram)
+
+
+def _merge_all(target, source):
+    _merge_counters(target.requests, source.requests)
+    _merge_counters(target.errors, source.errors)
+    _merge_histograms(target.latency, source.latency, LATENCY_BUCKETS)
+    _merge_histograms(target.db_queries, source.db_queries, QUERY_BUCKETS)
+    _merge_histograms(target.db_time, source.db_time, LATENCY_BUCKETS)
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'),
+        )
+        for name, value in labels.items()
+    )
+    return f'{{{pairs}}}'
+
+
+def _family(lines, name, kind, description, samples):
+    lines.append(f'# HELP {name} {description}')
+    lines.append(f'# TYPE {name} {kind}')
+    for suffix, labels, value in samples:
+        lines.append(f'{name}{suffix}{_format_labels(labels)} {_format_value(value)}')
+
+
+def _histogram_samples(labels, buckets, total):
+    count = 0
+    for bound, count in buckets.items():
+        yield '_bucket', {**labels, 'le': _format_value(bound)}, count
+    yield '_sum', labels, total
+    yield '_count', labels, count
+
+
+class RequestMetrics:
+    """
+    Request count, latency, errors and database usage per endpoint.
+
+    Every thread aggregates the requests it handles in its own counters, so
+    recording a request takes no lock. The counters of all threads are only
+    added up when the metrics are rendered. When a thread has finished, its
+    counters are folded into a single retired aggregate, so that counters
+    never decrease while the number of aggregates stays bounded by the number
+    of live threads, even under thread-per-request servers.
+
+    Requests are labeled by Flask endpoint name, i.e. the Flask-RESTful
+    endpoint of the resource, and HTTP method. The SQL statements of a
+    request are counted by QueryProfiler. The time of a streamed response
+    ends when its first chunk is ready.
+
+    Attributes:
+        enabled (bool): Whether requests are being recorded.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._local = threading.local()
+        self._threads = []
+        self._retired = _ThreadStats()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Record the requests of an application.
+
+        Args:
+            app (Flask): The application.
+        """
+        self.reset()
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        if not self.enabled:
+            return
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    def reset(self):
+        """
+        Forget every recorded request.
+        """
+        with self._lock:
+            self._local = threading.local()
+            self._threads = []
+            self._retired = _ThreadStats()
+
+    def _stats(self):
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            stats = self._local.stats = _ThreadStats()
+            with self._lock:
+                self._retire_finished()
+                self._threads.append((threading.current_thread(), stats))
+        return stats
+
+    def _retire_finished(self):
+        """Fold the counters of finished threads, called with the lock held."""
+        live = []
+        for thread, stats in self._threads:
+            if thread.is_alive():
+                live.append((thread, stats))
+            else:
+                _merge_all(self._retired, stats)
+        self._threads = live
+
+    @staticmethod
+    def _start_request():
+        g.request_started = time.perf_counter()
+
+    def _finish_request(self, response):
+        started = g.pop('request_started', None)
+        if started is None:
+            return response
+
+        key = (request.endpoint or 'unmatched', request.method)
+        stats = self._stats()
+        status_key = key + (str(response.status_code),)
+        stats.requests[status_key] = stats.requests.get(status_key, 0) + 1
+        if response.status_code >= 500:
+            stats.errors[key] = stats.errors.get(key, 0) + 1
+        stats.observe(
+            stats.latency, key, LATENCY_BUCKETS, time.perf_counter() - started
+        )
+        stats.observe(stats.db_queries, key, QUERY_BUCKETS, g.get('db_queries', 0))
+        stats.observe(stats.db_time, key, LATENCY_BUCKETS, g.get('db_time', 0.0))
+        return response
+
+    def _merged(self):
+        merged = _ThreadStats()
+        with self._lock:
+            self._retire_finished()
+            _merge_all(merged, self._retired)
+            threads = list(self._threads)
+        for _, stats in threads:
+            _merge_all(merged, stats)
+        return merged
+
+    def render(self, hashing=None, cache=None, pools=None):
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            hashing (dict): Optional snapshot of HashingPool.metrics().
+            cache (dict): Optional snapshot of ResponseCache.metrics().
+            pools (dict): Optional pool_status() of each engine, keyed by bind.
+
+        Returns:
+            str: The exposition text.
+        """
+        merged, lines = self._merged(), []
+
+        def request_labels(key):
+            return {'endpoint': key[0], 'method': key[1]}
+
+        _family(
+            lines,
+            'apiserver_http_requests_total',
+            'counter',
+            'Requests handled, by endpoint, method and status.',
+            [
+                ('', {**request_labels(key), 'status': key[2]}, value)
+                for key, value in sorted(merged.requests.items())
+            ],
+        )
+        _family(
+            lines,
+            'apiserver_http_request_errors_total',
+            'counter',
+            'Requests answered with a server error, by endpoint and method.',
+            [
+                ('', request_labels(key), value)
+                for key, value in sorted(merged.errors.items())
+            ],
+        )
+        for name, histograms, description in (
+            (
+                'apiserver_http_request_duration_seconds',
+                merged.latency,
+                'Time spent handling requests, by endpoint and method.',
+            ),
+            (
+                'apiserver_http_request_db_queries',
+                merged.db_queries,
+                'Number of SQL statements run per request, by endpoint and method.',
+            ),
+            (
+                'apiserver_http_request_db_duration_seconds',
+                merged.db_time,
+                'Time spent running SQL statements per request, by endpoint and method.',
+            ),
+        ):
+            _family(
+                lines,
+                name,
+                'histogram',
+                description,
+                [
+                    sample
+                    for key, histogram in sorted(histograms.items())
+                    for sample in _histogram_samples(
+                        request_labels(key), histogram.cumulative(), histogram.total
+                    )
+                ],
+            )
+
+        if hashing is not None:
+            _render_hashing(lines, hashing)
+        if cache is not None:
+            _render_cache(lines, cache)
+        if pools is not None:
+            _render_pools(lines, pools)
+        return '\n'.join(lines) + '\n'
+
+
+def _render_hashing(lines, hashing):
+    for name, kind, description, value in (
+        (
+            'apiserver_password_hash_queue_depth',
+            'gauge',
+            'Password hashes running or waiting for a worker.',
+            hashing['queue_depth'],
+        ),
+        (
+            'apiserver_password_hash_max_queue_depth',
+            'gauge',
+            'Password hashes admitted at a time.',
+            hashing['max_queue_depth'],
+        ),
+        (
+            'apiserver_password_hashes_total',
+            'counter',
+            'Password hashes computed.',
+            hashing['hashes'],
+        ),
+        (
+            'apiserver_password_hash_rejected_total',
+            'counter',
+            'Password hashes rejected because the queue was full.',
+            hashing['rejected'],
+        ),
+    ):
+        _family(lines, name, kind, description, [('', {}, value)])
+    _family(
+        lines,
+        'apiserver_password_hash_duration_seconds',
+        'histogram',
+        'Time spent computing password hashes.',
+        _histogram_samples({}, hashing['latency_buckets'], hashing['latency_sum']),
+    )
+
+
+def _render_cache(lines, cache):
+    for name, description in (
+        ('hits', 'Responses served from the response cache.'),
+        ('misses', 'Cacheable requests which reached their handler.'),
+        ('evictions', 'Responses dropped from the response cache to make room.'),
+    ):
+        _family(
+            lines,
+            f'apiserver_response_cache_{name}_total',
+            'counter',
+            description,
+            [('', {}, cache[name])],
+        )
+
+
+def _render_pools(lines, pools):
+    for name, kind, description in (
+        ('size', 'gauge', 'Connections kept open by the pool.'),
+        ('checked_in', 'gauge', 'Idle connections in the pool.'),
+        ('checked_out', 'gauge', 'Connections in use.'),
+        ('overflow', 'gauge', 'Connections open beyond the pool size.'),
+        ('checkouts', 'counter', 'Connections taken from the pool.'),
+        ('timeouts', 'counter', 'Checkouts which timed out waiting for a connection.'),
+    ):
+        metric = f'apiserver_db_pool_{name}'
+        if kind == 'counter':
+            metric += '_total'
+        _family(
+            lines,
+            metric,
+            kind,
+            description,
+            [
+                ('', {'bind': bind}, status[name])
+                for bind, status in sorted(pools.items())
+                if name in status
+            ],
+        )
+    _family(
+        lines,
+        'apiserver_db_pool_wait_seconds',
+        'histogram',
+        'Time spent waiting for a pooled connection.',
+        [
+            sample
+            for bind, status in sorted(pools.items())
+            if 'wait_buckets' in status
+            for sample in _histogram_samples(
+                {'bind': bind}, status['wait_buckets'], status['wait_sum']
+            )
+        ],
+    )
@@ -0,0 +1,204 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Keyset (cursor) pagination utilities
+"""
+# Standard library
+import base64
+import binascii
+import json
+from datetime import datetime
+
+# Third-party
+from sqlalchemy import and_, false, or_, true
+
+
+def parse_limit(value, default, maximum):
+    """
+    Parse the page size requested by the client.
+
+    Args:
+        value (str): Raw ``limit`` query argument, may be None.
+        default (int): Page size used when no limit is requested.
+        maximum (int): Largest page size allowed.
+
+    Returns:
+        int: The page size.
+
+    Raises:
+        ValueError: If the limit is not an integer between 1 and maximum.
+    """
+    if value is None:
+        return default
+    limit = int(value)
+    if not 1 <= limit <= maximum:
+        raise ValueError(f'limit must be between 1 and {maximum}')
+    return limit
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_value(column, value):
+    """Check a decoded value against the type of its column, cursors come
+    from clients and must never bind arbitrary JSON into the query."""
+    if value is None:
+        if not column.nullable:
+            raise ValueError('malformed cursor')
+        return value
+    python_type = column.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise ValueError('malformed cursor')
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as error:
+            raise ValueError('malformed cursor') from error
+    if not isinstance(value, python_type) or isinstance(value, bool) is not (
+        python_type is bool
+    ):
+        raise ValueError('malformed cursor')
+    return value
+
+
+def encode_cursor(columns, row):
+    """
+    Encode the sort key of a row into an opaque cursor.
+
+    Args:
+        columns (list): Columns the query is ordered by.
+        row (object): The last row of the current page.
+
+    Returns:
+        str: URL-safe cursor.
+    """
+    values = [_dump_value(getattr(row, column.key)) for column in columns]
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(columns, cursor):
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        columns (list): Columns the query is ordered by.
+        cursor (str): Cursor received from the client.
+
+    Returns:
+        list: Sort key values, one per column.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError('cursor does not match the sort order')
+        return [_load_value(column, value) for column, value in zip(columns, values)]
+    except (binascii.Error, UnicodeError, TypeError) as error:
+        raise ValueError('malformed cursor') from error
+
+
+def _strictly_after(column, value, descending):
+    """Rows strictly after ``value`` in the order of one column. NULL sorts
+    before every value, as ORDER BY does on MySQL and SQLite."""
+    if value is None:
+        return false() if descending else column.is_not(None)
+    if descending:
+        return (
+            or_(column < value, column.is_(None)) if column.nullable else column < value
+        )
+    return column > value
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _beyond(columns, values, descending):
+    """Build ``(c1, c2, ...) > (v1, v2, ...)`` expanded into plain comparisons."""
+    column, value = columns[0], values[0]
+    beyond = _strictly_after(column, value, descending)
+    if len(columns) == 1:
+        return beyond
+    return or_(
+        beyond,
+        and_(_equal(column, value), _beyond(columns[1:], values[1:], descending)),
+    )
+
+
+def _after(columns, values, descending):
+    """Build the keyset predicate, the redundant bound on the leading column
+    lets the database seek into an index on the sort columns."""
+    column, value = columns[0], values[0]
+    if value is None:
+        bound = column.is_(None) if descending else true()
+    elif descending:
+        bound = (
+            or_(column <= value, column.is_(None))
+            if column.nullable
+            else column <= value
+        )
+    else:
+        bound = column >= value
+    return and_(bound, _beyond(columns, values, descending))
+
+
+def keyset_predicate(columns, cursor, descending=False):
+    """
+    Build the predicate selecting the rows after a cursor.
+
+    Useful when the predicate cannot go in the WHERE clause, e.g. in the ON
+    clause of an outer join.
+
+    Args:
+        columns (list): Columns defining the sort order.
+        cursor (str): Cursor returned with the previous page.
+        descending (bool): Whether the order is descending.
+
+    Returns:
+        ColumnElement: The predicate.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    return _after(columns, decode_cursor(columns, cursor), descending)
+
+
+def keyset_paginate(query, columns, limit, cursor=None, descending=False):
+    """
+    Fetch one page of a query ordered by ``columns``.
+
+    The last column must be unique (usually the primary key) so that every
+    row has a distinct position. NULL values of a nullable column sort before
+    every other value, as MySQL and SQLite order them. Rows are located by comparing against the
+    cursor instead of using OFFSET, hence the cost of a page does not depend
+    on how deep the client has paged.
+
+    Args:
+        query (Query): Query to paginate.
+        columns (list): Columns defining the sort order.
+        limit (int): Maximum number of rows returned.
+        cursor (str): Cursor returned with the previous page, if any.
+        descending (bool): Whether to sort in descending order.
+
+    Returns:
+        tuple: Rows of the page and the cursor of the next page, or None if
+            this is the last page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if cursor:
+        query = query.filter(keyset_predicate(columns, cursor, descending))
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(columns, rows[-1])
+    return rows, next_cursor
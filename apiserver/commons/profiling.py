@@ -0,0 +1,149 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Per-request SQL profiling and slow-query log
+"""
+# Standard library
+import logging
+import os
+import re
+import sys
+import time
+
+# Third-party
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+slow_query_logger = logging.getLogger('TaskManagement.slow_queries')
+
+# Directory of the apiserver package, call-sites are searched below it
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%\(\w+\)s|%s|\?')
+_IN_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(statement):
+    """
+    Reduce a statement to its shape, so that slow statements can be grouped.
+
+    Literals and parameter placeholders become '?', IN lists of any length
+    become 'IN (...)' and whitespace is collapsed.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The normalized statement.
+    """
+    statement = _STRING.sub('?', statement)
+    statement = _NUMBER.sub('?', statement)
+    statement = _PLACEHOLDER.sub('?', statement)
+    statement = _IN_LIST.sub('IN (...)', statement)
+    return _WHITESPACE.sub(' ', statement).strip()
+
+
+def _call_site():
+    """Return the innermost frame of the apiserver package on the stack."""
+    frame = sys._getframe(1)  # pylint: disable=W0212
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(_PACKAGE_DIR)
+            and filename != __file__
+            and 'site-packages' not in filename
+        ):
+            path = os.path.relpath(filename, os.path.dirname(_PACKAGE_DIR))
+            return f'{path}:{frame.f_lineno} in {frame.f_code.co_name}'
+        frame = frame.f_back
+    return 'unknown'
+
+
+def _resource():
+    """Return the resource method serving the current request."""
+    if not has_request_context():
+        return 'no request'
+    view = current_app.view_functions.get(request.endpoint)
+    view_class = getattr(view, 'view_class', None)
+    if view_class is not None:
+        return f'{view_class.__name__}.{request.method.lower()}'
+    return f'{request.endpoint or "unmatched"} {request.method}'
+
+
+class QueryProfiler:
+    """
+    Times every SQL statement and attributes it to the request running it.
+
+    The number of statements and the time spent running them are summed per
+    request in g.db_queries and g.db_time. Statements slower than the
+    threshold are logged as warnings to the TaskManagement.slow_queries
+    logger, and every other statement at debug level, with the normalized
+    statement, the resource method serving the request and the call-site in
+    the apiserver package which ran it: the authentication helper, a lazy
+    load while dumping a schema or the query of the resource itself.
+
+    Attributes:
+        threshold (float): Duration, in seconds, from which a statement is slow.
+        headers (bool): Whether responses report the SQL time of the request.
+    """
+
+    def __init__(self):
+        self.threshold = 0.2
+        self.headers = False
+
+    def init_app(self, app, engines=()):
+        """
+        Profile the requests of an application and the statements it runs.
+
+        Args:
+            app (Flask): The application.
+            engines (iterable): Engines whose statements are timed.
+        """
+        self.threshold = app.config.get('SLOW_QUERY_THRESHOLD_MS', 200) / 1000
+        self.headers = app.config.get('SQL_PROFILE_HEADERS', False)
+        app.before_request(self._start_request)
+        if self.headers:
+            app.after_request(self._add_headers)
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._start_statement)
+            event.listen(engine, 'after_cursor_execute', self._finish_statement)
+
+    @staticmethod
+    def _start_request():
+        g.db_queries = 0
+        g.db_time = 0.0
+
+    @staticmethod
+    def _add_headers(response):
+        response.headers['X-DB-Query-Count'] = str(g.get('db_queries', 0))
+        response.headers['X-DB-Time-Ms'] = f'{g.get("db_time", 0.0) * 1000:.3f}'
+        return response
+
+    @staticmethod
+    def _start_statement(conn, cursor, statement, parameters, context, executemany):
+        context.profile_started = time.perf_counter()
+
+    def _finish_statement(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        elapsed = time.perf_counter() - context.profile_started
+        if has_request_context() and 'db_queries' in g:
+            g.db_queries += 1
+            g.db_time += elapsed
+        if elapsed >= self.threshold:
+            level = logging.WARNING
+        elif slow_query_logger.isEnabledFor(logging.DEBUG):
+            level = logging.DEBUG
+        else:
+            return
+        slow_query_logger.log(
+            level,
+            '%.1f ms %s at %s: %s',
+            elapsed * 1000,
+            _resource(),
+            _call_site(),
+            normalize_sql(statement),
+        )
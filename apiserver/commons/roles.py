@@ -0,0 +1,111 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Defines RoleRegistry class
+"""
+# Standard library
+import threading
+import time
+
+# Number of unknown keys remembered at a time
+MAX_MISSES = 1024
+
+
+class RoleRegistry:
+    """
+    Process-local mapping between role ids and role names.
+
+    Roles are read from the database once and then resolved from memory.
+    Writes to the roles table through the ORM of this process bump the
+    registry version, and the next lookup reloads the mapping. Other processes
+    (workers, the seed script) cannot bump it, hence the mapping is also
+    reloaded once it is older than ``ttl``: roles added, renamed or deleted
+    elsewhere are seen within ``ttl`` seconds. A lookup which misses reloads
+    the mapping once, and the miss is then remembered until the next bump or
+    for ``ttl`` seconds, so unknown roles are not read again and again from
+    the database.
+
+    Attributes:
+        version (int): Incremented every time the roles may have changed.
+        ttl (int): Number of seconds the loaded roles and misses are trusted.
+    """
+
+    def __init__(self, ttl=60):
+        self.version = 0
+        self.ttl = ttl
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._ids = {}
+        self._names = {}
+        self._misses = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Discard roles loaded for a previous application.
+        """
+        self.ttl = app.config.get('ROLE_REGISTRY_TTL', self.ttl)
+        self.bump()
+
+    def bump(self):
+        """
+        Mark the loaded roles as stale.
+        """
+        with self._lock:
+            self.version += 1
+
+    def load(self):
+        """
+        Read all roles from the database.
+        """
+        # pylint: disable=C0415
+        # First-party
+        from apiserver.api.models import Role
+
+        with self._lock:
+            version = self.version
+            rows = Role.query.with_entities(Role.id, Role.name).all()
+            self._ids = {name: role_id for role_id, name in rows}
+            self._names = {role_id: name for role_id, name in rows}
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+
+    def _lookup(self, mapping, key):
+        now = time.monotonic()
+        if self._loaded_version != self.version or now - self._loaded_at >= self.ttl:
+            self._misses = {}
+            self.load()
+        if key in getattr(self, mapping) or self._misses.get((mapping, key), 0) > now:
+            return getattr(self, mapping).get(key)
+        self.load()
+        if key not in getattr(self, mapping):
+            if len(self._misses) >= MAX_MISSES:
+                self._misses.clear()
+            self._misses[(mapping, key)] = now + self.ttl
+        return getattr(self, mapping).get(key)
+
+    def get_id(self, name):
+        """
+        Resolve a role name to its id.
+
+        Args:
+            name (str): Name of the role.
+
+        Returns:
+            int: The role id, or None if the role does not exist.
+        """
+        return self._lookup('_ids', name)
+
+    def get_name(self, role_id):
+        """
+        Resolve a role id to its name.
+
+        Args:
+            role_id (int): ID of the role.
+
+        Returns:
+            str: The role name, or None if the role does not exist.
+        """
+        if role_id is None:
+            return None
+        return self._lookup('_names', role_id)
@@ -0,0 +1,49 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+"""
+Streaming responses for large list endpoints
+"""
+# Standard library
+import json
+
+# Third-party
+from flask import Response, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_stream():
+    """
+    Check if the client asked for a streamed response, either with
+    ``?stream=1`` or with ``Accept: application/x-ndjson``.
+
+    Returns:
+        bool: True if the response should be streamed.
+    """
+    if request.args.get('stream') in ('1', 'true'):
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def stream_ndjson(query, serialize, chunk_size=500):
+    """
+    Stream query results as newline delimited JSON.
+
+    Rows are fetched from the database ``chunk_size`` at a time and each one is
+    serialized and written as soon as it is read, so memory use does not grow
+    with the size of the result.
+
+    Args:
+        query (Query): Query producing the rows.
+        serialize (function): Converts one row into a JSON serializable dict.
+        chunk_size (int): Number of rows fetched per round trip.
+
+    Returns:
+        Response: Streamed response.
+    """
+
+    def generate():
+        for row in query.yield_per(chunk_size):
+            yield json.dumps(serialize(row)) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
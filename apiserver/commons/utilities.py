@@ -5,12 +5,15 @@ Utilities functions
 """
 # Standard library
 import re
+from datetime import datetime
 
 # Third-party
 from sqlalchemy.exc import SQLAlchemyError
 
 # First-party
 from apiserver.api.models import User
+from apiserver.commons.constants import PriorityLevel, TaskStatus, TaskType
+from apiserver.extensions import credential_cache
 
 
 def is_valid_email(email):
@@ -24,11 +27,111 @@ def is_valid_email(email):
 
 
 def authenticate_user(username, password):
-    """Validate user's credentials"""
+    """Validate user's credentials, skipping the password hash check for
+    credentials verified recently"""
     try:
         user = User.query.filter_by(email=username).first()
-        if user and user.check_password(password):
+        if not user:
+            return None
+        if credential_cache.is_verified(username, password, user.id, user.password):
+            return user
+        if user.check_password(password):
+            credential_cache.add(username, password, user.id, user.password)
             return user
     except SQLAlchemyError:
         return None
     return None
+
+
+def _of_type(expected_type):
+    """Build a parser accepting values of the expected JSON type only"""
+
+    def parse(value):
+        if not isinstance(value, expected_type):
+            raise TypeError(f'{value!r} is not of type {expected_type.__name__}')
+        return value
+
+    return parse
+
+
+def parse_enum(enum_class, value):
+    """
+    Resolve an enum member from its value or its name.
+
+    Values such as 'high' are the documented spelling, names such as 'TIGHT'
+    are accepted too, as task creation and updates historically took them.
+
+    Args:
+        enum_class (Enum): The enum defined in constants.py.
+        value (str): Value or name of the member.
+
+    Returns:
+        Enum: The enum member.
+
+    Raises:
+        ValueError: If the value is neither a value nor a name of the enum.
+    """
+    if isinstance(value, enum_class):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f'{value!r} is not a valid {enum_class.__name__}')
+    try:
+        return enum_class(value)
+    except ValueError:
+        pass
+    try:
+        return enum_class[value]
+    except KeyError as error:
+        raise ValueError(f'{value!r} is not a valid {enum_class.__name__}') from error
+
+
+def _enum_of(enum_class):
+    """Build a parser accepting the values and the names of an enum"""
+    return lambda value: parse_enum(enum_class, value)
+
+
+TASK_FIELD_PARSERS = {
+    'title': _of_type(str),
+    'description': _of_type(str),
+    'due_date': datetime.fromisoformat,
+    'priority': _enum_of(PriorityLevel),
+    'status': _enum_of(TaskStatus),
+    'type': _enum_of(TaskType),
+    'assigned_to_id': int,
+    'recurring_task': _of_type(bool),
+    'estimate': int,
+    'actual_time_spent': int,
+}
+
+
+def parse_task_fields(data, allowed_fields):
+    """
+    Convert JSON task fields to column values.
+
+    Enum fields accept the enum values defined in constants.py, or their
+    names, and dates accept ISO 8601 strings, null is kept as is.
+
+    Args:
+        data (dict): Task fields received in the request.
+        allowed_fields (list): Names of the fields which may be set.
+
+    Returns:
+        dict: Column values keyed by field name.
+
+    Raises:
+        ValueError: If a field is not allowed or its value is invalid.
+    """
+    disallowed_fields = [key for key in data if key not in allowed_fields]
+    if disallowed_fields:
+        raise ValueError(f'Field(s) {", ".join(disallowed_fields)} not allowed.')
+
+    values = {}
+    for key, value in data.items():
+        if value is None:
+            values[key] = None
+            continue
+        try:
+            values[key] = TASK_FIELD_PARSERS[key](value)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f'Invalid value for {key}.') from error
+    return values
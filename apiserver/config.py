@@ -25,5 +25,60 @@ SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URI').format(
     port=MYSQL_PORT,
     db=MYSQL_DB,
 )
+# Optional read replicas, comma separated URIs formatted like DATABASE_URI
+SQLALCHEMY_BINDS = {
+    f'replica_{index}': uri.strip().format(
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        host=MYSQL_HOST,
+        port=MYSQL_PORT,
+        db=MYSQL_DB,
+    )
+    for index, uri in enumerate(os.getenv('DATABASE_REPLICA_URIS', '').split(','))
+    if uri.strip()
+}
+DATABASE_REPLICA_BINDS = list(SQLALCHEMY_BINDS)
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+# Connection pool of each database, applied per URI by configure_pools().
+# Connections are recycled before MySQL's wait_timeout closes them and
+# checked with a ping when taken from the pool after an idle period
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
 JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
+
+# AUTHENTICATION
+AUTH_CACHE_MAX_SIZE = int(os.getenv('AUTH_CACHE_MAX_SIZE', '1024'))
+AUTH_CACHE_TTL = int(os.getenv('AUTH_CACHE_TTL', '300'))
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '16'))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv('PASSWORD_HASH_RETRY_AFTER', '1'))
+# Seconds roles are resolved from memory before being read again, roles
+# changed by another process are seen after at most this delay
+ROLE_REGISTRY_TTL = int(os.getenv('ROLE_REGISTRY_TTL', '60'))
+
+# PAGINATION
+PAGINATION_DEFAULT_LIMIT = int(os.getenv('PAGINATION_DEFAULT_LIMIT', '50'))
+PAGINATION_MAX_LIMIT = int(os.getenv('PAGINATION_MAX_LIMIT', '500'))
+
+# RESPONSE CACHE
+# 'memory' (per process), 'redis' (shared, needs the redis package) or 'none'
+RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv('RESPONSE_CACHE_MAX_SIZE', '1024'))
+RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '30'))
+RESPONSE_CACHE_REDIS_URL = os.getenv('RESPONSE_CACHE_REDIS_URL')
+
+# BULK OPERATIONS
+BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', '500'))
+
+# METRICS
+# Expose request, database and pool metrics on /metrics
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+# SQL PROFILING
+# Statements running longer are logged to the slow-query log
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '200'))
+# Report the number of statements and the SQL time of each request in headers
+SQL_PROFILE_HEADERS = os.getenv('SQL_PROFILE_HEADERS', 'false').lower() == 'true'
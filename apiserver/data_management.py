@@ -4,16 +4,22 @@ import json
 import logging
 import os
 import sys
-from random import choice
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import islice
+from random import choice, randrange
 
 # Third-party
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, select
 from sqlalchemy.orm import sessionmaker
+from werkzeug.security import generate_password_hash
 
 # First-party
 from apiserver.api.models import Comment, Task, User
 from apiserver.api.models.roles import Role
-from apiserver.commons.constants import PriorityLevel
+from apiserver.commons.constants import PriorityLevel, TaskStatus
+from apiserver.commons.hashing import HashingPool
 
 logger = logging.getLogger('TaskManager.data_management')
 
@@ -117,6 +123,151 @@ def populate_comments():
         except Exception as _e:
             logger.error('Comment <%s> failed to add to the comments collection')
 
+
+def chunked(rows, size):
+    """Split an iterable of rows into lists of at most `size` rows."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def bulk_insert(model, rows, chunk_size):
+    """Insert rows with one executemany per chunk, inside the current transaction."""
+    count = 0
+    for chunk in chunked(rows, chunk_size):
+        session.execute(insert(model), chunk)
+        count += len(chunk)
+        logger.info('%s rows inserted into <%s>', count, model.__tablename__)
+    return count
+
+
+def fetch_in(columns, key, values, chunk_size):
+    """Fetch the rows whose `key` is one of `values`, with one IN query per chunk."""
+    for chunk in chunked(values, chunk_size):
+        yield from session.execute(select(*columns).where(key.in_(chunk)))
+
+
+def hash_passwords(users_data):
+    """Hash the password of every user with its own salt, in worker processes."""
+    workers = os.cpu_count() or 1
+    pool = HashingPool(workers=workers, max_pending=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = executor.map(pool.generate, [user['password'] for user in users_data])
+            return [
+                {**user_data, 'password': password_hash}
+                for user_data, password_hash in zip(users_data, hashes)
+            ]
+    finally:
+        pool.shutdown()
+
+
+def bulk_populate_users(chunk_size):
+    with open(users_file, 'r') as file:
+        users_data = json.load(file)['users']
+
+    emails = [user['email'] for user in users_data]
+    existing_emails = {
+        email for email, in fetch_in([User.email], User.email, emails, chunk_size)
+    }
+    new_users = [user for user in users_data if user['email'] not in existing_emails]
+    bulk_insert(User, hash_passwords(new_users), chunk_size)
+
+
+def bulk_populate_tasks(chunk_size):
+    with open(tasks_file, 'r') as file:
+        tasks_data = json.load(file)['tasks']
+    with open(users_file, 'r') as file:
+        emails = [user['email'] for user in json.load(file)['users']]
+
+    # Resolve foreign keys with one query per chunk of the template rows
+    users_ids = [
+        user_id for user_id, in fetch_in([User.id], User.email, emails, chunk_size)
+    ]
+    titles = [task['title'] for task in tasks_data]
+    existing_titles = {
+        title for title, in fetch_in([Task.title], Task.title, titles, chunk_size)
+    }
+    new_tasks = (
+        {**task, 'assigned_to_id': choice(users_ids)}
+        for task in tasks_data
+        if task['title'] not in existing_titles
+    )
+    bulk_insert(Task, new_tasks, chunk_size)
+
+
+def bulk_populate_comments(chunk_size):
+    with open(comments_file, 'r') as file:
+        comments_data = json.load(file)['comments']
+    with open(tasks_file, 'r') as file:
+        titles = [task['title'] for task in json.load(file)['tasks']]
+
+    tasks_ids = [
+        task_id for task_id, in fetch_in([Task.id], Task.title, titles, chunk_size)
+    ]
+    new_comments = (
+        {**comment, 'task_id': choice(tasks_ids)} for comment in comments_data
+    )
+    bulk_insert(Comment, new_comments, chunk_size)
+
+
+def populate_synthetic(scale, chunk_size):
+    """
+    Generate `scale` tasks, one user per 10 tasks and 3 comments per task.
+
+    For load testing only: every synthetic user shares the same salted hash
+    of 'user_password', hashing millions of passwords would take hours.
+    """
+    prefix = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    role_id = session.scalar(select(Role.id).filter_by(name='user'))
+    password = generate_password_hash('user_password')
+
+    users = (
+        {
+            'first_name': 'Synthetic',
+            'last_name': f'User {index}',
+            'email': f'{prefix}.user{index}@example.com',
+            'password': password,
+            'role_id': role_id,
+            'created_at': now,
+        }
+        for index in range(max(1, scale // 10))
+    )
+    bulk_insert(User, users, chunk_size)
+    users_ids = list(
+        session.scalars(select(User.id).where(User.email.startswith(f'{prefix}.')))
+    )
+
+    tasks = (
+        {
+            'title': f'{prefix} task {index}',
+            'description': f'Synthetic task {index}',
+            'priority': choice(list(PriorityLevel)),
+            'status': choice(list(TaskStatus)),
+            'created_by_id': choice(users_ids),
+            'assigned_to_id': choice(users_ids),
+            'created_at': now - timedelta(minutes=randrange(525600)),
+            'updated_at': now,
+        }
+        for index in range(scale)
+    )
+    bulk_insert(Task, tasks, chunk_size)
+    tasks_ids = list(
+        session.scalars(select(Task.id).where(Task.title.startswith(f'{prefix} ')))
+    )
+
+    comments = (
+        {
+            'content': f'Synthetic comment {index}',
+            'task_id': choice(tasks_ids),
+            'created_at': now - timedelta(minutes=randrange(525600)),
+        }
+        for index in range(scale * 3)
+    )
+    bulk_insert(Comment, comments, chunk_size)
+
+
 def main():
     try:
         logger.info('Data population begins.')
@@ -124,13 +275,27 @@ def main():
         # Parse command-line arguments
         parser = argparse.ArgumentParser(description='Populate data tables.')
         parser.add_argument('-c', '--collection', choices=['all', 'users', 'tasks', 'comments'], help='Specify data collection')
+        parser.add_argument('-b', '--bulk', action='store_true', help='Insert in chunks within a single transaction')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Rows per insert statement in bulk mode')
+        parser.add_argument('--scale', type=int, help='Generate N synthetic tasks, N/10 users and 3N comments')
         args = parser.parse_args()
 
         # Always populate roles
         populate_roles()
 
+        if args.scale:
+            populate_synthetic(args.scale, args.chunk_size)
+            session.commit()
+        elif args.bulk:
+            if args.collection in ('all', 'users'):
+                bulk_populate_users(args.chunk_size)
+            if args.collection in ('all', 'tasks'):
+                bulk_populate_tasks(args.chunk_size)
+            if args.collection in ('all', 'comments'):
+                bulk_populate_comments(args.chunk_size)
+            session.commit()
         # Check the collection argument and populate tables accordingly
-        if args.collection == 'all':
+        elif args.collection == 'all':
             populate_users()
             populate_tasks()
             populate_comments()
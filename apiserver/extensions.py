@@ -15,11 +15,24 @@ from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
 # First-party
+from apiserver.commons.caching import ResponseCache
+from apiserver.commons.credentials import CredentialCache
+from apiserver.commons.database import RoutingSession
+from apiserver.commons.hashing import HashingPool
 from apiserver.commons.logging import Logger
+from apiserver.commons.metrics import RequestMetrics
+from apiserver.commons.profiling import QueryProfiler
+from apiserver.commons.roles import RoleRegistry
 
 basic_auth = HTTPBasicAuth()
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 jwt = JWTManager()
 ma = Marshmallow()
 migrate = Migrate()
 logger = Logger()
+credential_cache = CredentialCache()
+role_registry = RoleRegistry()
+hashing_pool = HashingPool()
+response_cache = ResponseCache()
+request_metrics = RequestMetrics()
+query_profiler = QueryProfiler()
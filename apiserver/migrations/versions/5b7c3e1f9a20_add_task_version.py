@@ -0,0 +1,34 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+
+"""add task version
+
+Revision ID: 5b7c3e1f9a20
+Revises: decefe172bb2
+Create Date: 2026-10-18 14:05:12.318406
+
+"""
+
+# pylint: disable=C0103,C0116,E1101
+
+# Third-party
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5b7c3e1f9a20'
+down_revision = 'decefe172bb2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1')
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_column('version')
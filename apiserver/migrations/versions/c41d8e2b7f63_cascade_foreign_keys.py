@@ -0,0 +1,65 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+
+"""cascade foreign keys
+
+Revision ID: c41d8e2b7f63
+Revises: 5b7c3e1f9a20
+Create Date: 2026-10-18 16:40:08.112694
+
+"""
+
+# pylint: disable=C0103,C0116,E1101
+
+# Third-party
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c41d8e2b7f63'
+down_revision = '5b7c3e1f9a20'
+branch_labels = None
+depends_on = None
+
+# Names given to the unnamed constraints SQLite reflects in batch mode
+NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'
+}
+
+# (table, column, referred table, ON DELETE action)
+FOREIGN_KEYS = (
+    ('tasks', 'created_by_id', 'users', 'SET NULL'),
+    ('tasks', 'assigned_to_id', 'users', 'SET NULL'),
+    ('comments', 'task_id', 'tasks', 'CASCADE'),
+)
+
+
+def _constraint_name(table, column, referred_table):
+    for foreign_key in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        if foreign_key['constrained_columns'] == [column] and foreign_key['name']:
+            return foreign_key['name']
+    return f'fk_{table}_{column}_{referred_table}'
+
+
+def _replace_foreign_keys(on_delete):
+    for table, column, referred_table, action in FOREIGN_KEYS:
+        name = _constraint_name(table, column, referred_table)
+        with op.batch_alter_table(
+            table, schema=None, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(
+                f'fk_{table}_{column}_{referred_table}',
+                referred_table,
+                [column],
+                ['id'],
+                ondelete=action if on_delete else None,
+            )
+
+
+def upgrade():
+    _replace_foreign_keys(on_delete=True)
+
+
+def downgrade():
+    _replace_foreign_keys(on_delete=False)
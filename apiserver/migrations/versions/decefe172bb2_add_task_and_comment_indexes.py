@@ -0,0 +1,55 @@
+#!./venv/bin/python
+# -*- coding: utf-8 -*-
+
+"""add task and comment indexes
+
+Revision ID: decefe172bb2
+Revises: 2e9e81efe544
+Create Date: 2026-10-18 10:12:31.514732
+
+"""
+
+# pylint: disable=C0103,C0116,E1101
+
+# Third-party
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'decefe172bb2'
+down_revision = '2e9e81efe544'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_created_at_id', ['created_at', 'id'])
+        batch_op.create_index('ix_tasks_updated_at_id', ['updated_at', 'id'])
+        batch_op.create_index(
+            'ix_tasks_status_created_at_id', ['status', 'created_at', 'id']
+        )
+        batch_op.create_index(
+            'ix_tasks_assigned_to_id_created_at_id',
+            ['assigned_to_id', 'created_at', 'id'],
+        )
+        batch_op.create_index(
+            'ix_tasks_created_by_id_created_at_id',
+            ['created_by_id', 'created_at', 'id'],
+        )
+
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_comments_task_id_created_at_id', ['task_id', 'created_at', 'id']
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_comments_task_id_created_at_id')
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_created_by_id_created_at_id')
+        batch_op.drop_index('ix_tasks_assigned_to_id_created_at_id')
+        batch_op.drop_index('ix_tasks_status_created_at_id')
+        batch_op.drop_index('ix_tasks_updated_at_id')
+        batch_op.drop_index('ix_tasks_created_at_id')
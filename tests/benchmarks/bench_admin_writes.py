@@ -0,0 +1,73 @@
+"""Benchmark admin write latency through the authentication pipeline.
+
+Compares admin DELETE requests resolving the principal once per request with
+the legacy behaviour, where require_basic_auth and role_required both verified
+credentials. The credential cache is disabled so every request pays for the
+password hash.
+
+Usage:
+    python -m tests.benchmarks.bench_admin_writes [-n REQUESTS]
+"""
+# Standard library
+import argparse
+import base64
+import time
+from unittest.mock import patch
+
+# First-party
+from apiserver.api.models import Role, User
+from apiserver.app import create_app
+from apiserver.commons import helpers
+from apiserver.extensions import db
+from tests.config import SQLiteTestingConfig
+
+AUTHENTICATE_REQUEST = helpers.authenticate_request
+
+
+def legacy_authenticate_request():
+    """Authenticate again on every call, as each decorator used to."""
+    helpers.g.pop('current_user_id', None)
+    return AUTHENTICATE_REQUEST()
+
+
+def setup_app():
+    app = create_app(SQLiteTestingConfig)
+    with app.app_context():
+        db.create_all()
+        role = Role('admin')
+        db.session.add(role)
+        db.session.flush()
+        admin = User(email='admin@example.com', role_id=role.id)
+        admin.set_password('secretpassword')
+        db.session.add(admin)
+        db.session.commit()
+    return app
+
+
+def run(app, requests):
+    client = app.test_client()
+    credentials = base64.b64encode(b'admin@example.com:secretpassword').decode()
+    headers = {'Authorization': f'Basic {credentials}'}
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.delete('/api/v1/tasks/0', headers=headers)
+    return (time.perf_counter() - started) / requests * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark admin write latency.')
+    parser.add_argument('-n', '--requests', type=int, default=50)
+    args = parser.parse_args()
+
+    app = setup_app()
+    current = run(app, args.requests)
+    with patch.object(helpers, 'authenticate_request', legacy_authenticate_request):
+        legacy = run(app, args.requests)
+
+    print(f'legacy (double authentication): {legacy:8.2f} ms/request')
+    print(f'current (single authentication): {current:8.2f} ms/request')
+    print(f'speedup: {legacy / current:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
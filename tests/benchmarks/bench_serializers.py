@@ -0,0 +1,89 @@
+"""Benchmark the compiled serializers against marshmallow.
+
+Dumps a list of transient tasks and users, the way the list endpoints do,
+with ``Schema(many=True).dump`` and with the compiled serializers.
+
+Usage:
+    python -m tests.benchmarks.bench_serializers [-n ROWS] [-r REPEAT]
+"""
+# Standard library
+import argparse
+import timeit
+from datetime import datetime, timedelta
+
+# First-party
+from apiserver.api.models import Role, Task, User
+from apiserver.api.schemas import UserSchema
+from apiserver.api.schemas.compiled import dump_task, dump_user
+from apiserver.api.schemas.tasks import TaskSchema
+from apiserver.commons.constants import PriorityLevel, TaskStatus, TaskType
+
+
+def make_rows(count):
+    role = Role('user')
+    start = datetime(2023, 9, 1)
+    users = [
+        User(
+            id=index,
+            email=f'user{index}@example.com',
+            first_name='John',
+            last_name='Doe',
+            role=role,
+            created_at=start,
+        )
+        for index in range(count)
+    ]
+    tasks = [
+        Task(
+            id=index,
+            title=f'Task {index}',
+            description='Description',
+            due_date=start + timedelta(days=7),
+            priority=PriorityLevel.MEDIUM,
+            status=TaskStatus.OPEN,
+            type=TaskType.TASK,
+            created_by=users[index],
+            assigned_to=users[-index - 1],
+            created_at=start + timedelta(minutes=index),
+            updated_at=start + timedelta(minutes=index),
+            recurring_task=False,
+            estimate=4,
+        )
+        for index in range(count)
+    ]
+    return tasks, users
+
+
+def measure(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serializers.')
+    parser.add_argument('-n', '--rows', type=int, default=1000)
+    parser.add_argument('-r', '--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    tasks, users = make_rows(args.rows)
+    cases = [
+        (
+            'tasks',
+            lambda: TaskSchema(many=True).dump(tasks),
+            lambda: [dump_task(task) for task in tasks],
+        ),
+        (
+            'users',
+            lambda: UserSchema(many=True).dump(users),
+            lambda: [dump_user(user) for user in users],
+        ),
+    ]
+    for name, marshmallow, compiled in cases:
+        legacy = measure(marshmallow, args.repeat)
+        current = measure(compiled, args.repeat)
+        print(f'{name} marshmallow: {legacy:8.2f} ms / {args.rows} rows')
+        print(f'{name} compiled:    {current:8.2f} ms / {args.rows} rows')
+        print(f'{name} speedup: {legacy / current:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -19,3 +19,14 @@ class TestingConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = None  # patch database instead
     TESTING = True
+
+
+class SQLiteTestingConfig(TestingConfig):
+    """
+    Extends TestingConfig with an in-memory SQLite database
+    """
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    JWT_SECRET_KEY = 'testing-secret-key'
+    AUTH_CACHE_MAX_SIZE = 0
+    PASSWORD_HASH_WORKERS = 0
+    RESPONSE_CACHE_BACKEND = 'none'
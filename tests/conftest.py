@@ -1,9 +1,13 @@
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
+from apiserver.api.models import Role, Task, User
 from apiserver.app import create_app
-from tests.config import TestingConfig
+from apiserver.extensions import db
+from tests.config import SQLiteTestingConfig, TestingConfig
+from tests.utils import QueryCounter, basic_auth_header
 
 
 @pytest.fixture
@@ -18,4 +22,79 @@ def app():
             ctx = app.test_request_context()
             ctx.push()
             yield app
-            ctx.pop()
\ No newline at end of file
+            ctx.pop()
+
+
+@pytest.fixture
+def sqlite_app():
+    """Flask Test App backed by an in-memory SQLite database with roles populated"""
+    app = create_app(SQLiteTestingConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Role('admin'), Role('user')])
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def create_user(sqlite_app):
+    """Factory to add users to the SQLite database"""
+
+    def _create_user(email, password='secretpassword', role='user'):
+        with sqlite_app.app_context():
+            user = User(
+                first_name='John',
+                last_name='Doe',
+                email=email,
+                role_id=Role.query.filter_by(name=role).first().id,
+            )
+            user.set_password(password)
+            db.session.add(user)
+            db.session.commit()
+            return user.id
+
+    return _create_user
+
+
+@pytest.fixture
+def count_queries(sqlite_app):
+    """Context manager counting SQL statements sent to the SQLite database"""
+    with sqlite_app.app_context():
+        engine = db.engine
+
+    return lambda: QueryCounter(engine)
+
+
+@pytest.fixture
+def admin_headers(create_user):
+    """Basic Authentication header of an admin user"""
+    create_user('admin@example.com', role='admin')
+    return basic_auth_header('admin@example.com')
+
+
+@pytest.fixture
+def create_tasks(sqlite_app):
+    """Factory to add tasks to the SQLite database"""
+
+    def _create_tasks(count, **kwargs):
+        start = datetime(2023, 9, 1)
+        with sqlite_app.app_context():
+            offset = Task.query.count()
+            tasks = [
+                Task(
+                    title=f'Task {index}',
+                    created_at=start + timedelta(minutes=index // 2),
+                    **kwargs,
+                )
+                for index in range(offset, offset + count)
+            ]
+            db.session.add_all(tasks)
+            db.session.commit()
+            return [task.id for task in tasks]
+
+    return _create_tasks
@@ -0,0 +1,87 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import func, select
+
+from apiserver.api.models import Comment, Task, User
+from apiserver.app import create_app
+from apiserver.extensions import db
+from tests.config import SQLiteTestingConfig
+from tests.utils import basic_auth_header
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def template(name):
+    with open(os.path.join(ROOT, 'template', 'data', f'{name}.json')) as file:
+        return json.load(file)[name]
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    """Flask Test App backed by an empty SQLite database file"""
+    uri = f'sqlite:///{tmp_path / "seed.db"}'
+    app = create_app(
+        type('Config', (SQLiteTestingConfig,), {'SQLALCHEMY_DATABASE_URI': uri})
+    )
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+def seed(app, *args):
+    subprocess.run(
+        [sys.executable, '-m', 'apiserver.data_management', *args],
+        cwd=ROOT,
+        env={**os.environ, 'DATABASE_URI': app.config['SQLALCHEMY_DATABASE_URI']},
+        check=True,
+    )
+
+
+class TestBulkSeeding:
+    def test_bulk_inserts_every_template_row(self, file_app):
+        seed(file_app, '-c', 'all', '--bulk', '--chunk-size', '2')
+
+        with file_app.app_context():
+            for model, name in (
+                (User, 'users'),
+                (Task, 'tasks'),
+                (Comment, 'comments'),
+            ):
+                assert db.session.scalar(
+                    select(func.count()).select_from(model)
+                ) == len(template(name))
+
+    def test_rerun_skips_existing_users_and_tasks(self, file_app):
+        for _ in range(2):
+            seed(file_app, '-c', 'all', '--bulk', '--chunk-size', '2')
+
+        with file_app.app_context():
+            for model, name in ((User, 'users'), (Task, 'tasks')):
+                assert db.session.scalar(
+                    select(func.count()).select_from(model)
+                ) == len(template(name))
+
+    def test_seeded_users_can_sign_in(self, file_app):
+        seed(file_app, '-c', 'users', '--bulk')
+
+        client = file_app.test_client()
+        for user in template('users'):
+            response = client.post(
+                '/api/v1/sign_in',
+                headers=basic_auth_header(user['email'], user['password']),
+            )
+            assert response.status_code == 200
+
+    def test_users_sharing_a_password_get_distinct_hashes(self, file_app):
+        seed(file_app, '-c', 'users', '--bulk')
+
+        with file_app.app_context():
+            hashes = db.session.scalars(select(User.password)).all()
+        assert len(set(hashes)) == len(template('users'))
@@ -0,0 +1,133 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from apiserver.api.models import Role, User
+from apiserver.app import create_app
+from apiserver.commons.database import (
+    InstrumentedQueuePool,
+    configure_pools,
+    pool_status,
+    reset_after_fork,
+)
+from apiserver.extensions import db
+from tests.config import SQLiteTestingConfig
+from tests.utils import basic_auth_header
+
+
+@pytest.fixture
+def pool_app(tmp_path):
+    """Flask Test App backed by a SQLite file behind a single connection pool"""
+
+    class PoolConfig(SQLiteTestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "pool.db"}'
+        DB_POOL_SIZE = 1
+        DB_MAX_OVERFLOW = 0
+        DB_POOL_TIMEOUT = 1
+
+    app = create_app(PoolConfig)
+    with app.app_context():
+        db.create_all()
+        admin_role, user_role = Role('admin'), Role('user')
+        db.session.add_all([admin_role, user_role])
+        db.session.flush()
+        for email, role in (('admin@example.com', admin_role), ('john@example.com', user_role)):
+            user = User(email=email, role_id=role.id)
+            user.set_password('secretpassword')
+            db.session.add(user)
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+class TestDatabasePool:
+
+    def test_wait_metrics(self, tmp_path):
+        engine = create_engine(
+            f'sqlite:///{tmp_path / "wait.db"}',
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        with engine.connect():
+            status = pool_status(engine)
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        after = pool_status(engine)
+
+        assert (status['size'], status['checked_out'], status['checked_in']) == (1, 1, 0)
+        assert (after['checked_out'], after['checked_in']) == (0, 1)
+        assert (after['checkouts'], after['timeouts']) == (2, 1)
+        assert after['wait_max'] >= 0.05
+        assert after['wait_buckets'][0.01] == 1
+        assert after['wait_buckets'][float('inf')] == 2
+
+    def test_metrics_survive_reset_after_fork(self, pool_app):
+        with pool_app.app_context():
+            engine = db.engine
+            with engine.connect():
+                pass
+            pool, checkouts = engine.pool, pool_status(engine)['checkouts']
+
+            reset_after_fork(engine)
+
+            assert engine.pool is not pool
+            assert pool_status(engine)['checkouts'] == checkouts
+            with engine.connect():
+                pass
+            assert pool_status(engine)['checkouts'] == checkouts + 1
+
+    def test_status_endpoint(self, pool_app):
+        client = pool_app.test_client()
+
+        response = client.get('/api/v1/admin/db-pool', headers=basic_auth_header('admin@example.com'))
+
+        assert response.status_code == 200
+        status = response.json['result']['default']
+        assert status['pool'] == 'InstrumentedQueuePool'
+        assert status['size'] == 1
+        assert status['checkouts'] > 0
+
+    def test_status_endpoint_requires_admin(self, pool_app):
+        response = pool_app.test_client().get(
+            '/api/v1/admin/db-pool', headers=basic_auth_header('john@example.com')
+        )
+
+        assert response.status_code == 403
+
+    def test_in_memory_sqlite_keeps_static_pool(self):
+        app = create_app(SQLiteTestingConfig)
+
+        with app.app_context():
+            assert isinstance(db.engine.pool, StaticPool)
+
+    def test_pool_options_per_uri(self):
+        config = {
+            'SQLALCHEMY_DATABASE_URI': 'mysql://user@primary/db',
+            'SQLALCHEMY_ENGINE_OPTIONS': {'pool_recycle': 60},
+            'SQLALCHEMY_BINDS': {'replica_0': 'sqlite://', 'replica_1': 'mysql://user@replica/db'},
+            'DB_POOL_SIZE': 3,
+            'DB_MAX_OVERFLOW': 1,
+            'DB_POOL_TIMEOUT': 5,
+            'DB_POOL_RECYCLE': 1800,
+            'DB_POOL_PRE_PING': True,
+        }
+
+        configure_pools(config)
+
+        assert config['SQLALCHEMY_ENGINE_OPTIONS'] == {
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': 3,
+            'max_overflow': 1,
+            'pool_timeout': 5,
+            'pool_recycle': 60,
+            'pool_pre_ping': True,
+        }
+        assert config['SQLALCHEMY_BINDS']['replica_0'] == {'url': 'sqlite://'}
+        assert config['SQLALCHEMY_BINDS']['replica_1']['pool_size'] == 3
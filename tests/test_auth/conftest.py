@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+import pytest
+
+from apiserver.commons.credentials import CredentialCache
+
+
+class MockUser:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    def check_password(self, password):
+        return password == 'secretpassword'
+
+
+@pytest.fixture
+def credential_cache():
+    """Create a small CredentialCache for testing"""
+    return CredentialCache(max_size=2, ttl=60)
+
+
+@pytest.fixture
+def user():
+    return MockUser(id=1, email='john@example.com', password='hashed_password')
+
+
+@pytest.fixture
+def user_exists_mock(app, user):
+    """Patch User.query.filter_by to return a user and spy on check_password"""
+    with app.app_context():
+        user_query_mock = patch('apiserver.api.models.User.query')
+        user_query_filter_by_mock = user_query_mock.start()
+        user_query_filter_by_mock.filter_by.return_value.first.return_value = user
+        check_password_mock = patch.object(
+            MockUser, 'check_password', autospec=True, side_effect=MockUser.check_password
+        )
+        yield check_password_mock.start()
+        check_password_mock.stop()
+        user_query_mock.stop()
@@ -0,0 +1,64 @@
+from unittest.mock import patch
+
+import pytest
+
+from apiserver.api.models import User
+from tests.utils import basic_auth_header
+
+
+@pytest.fixture
+def check_password_spy():
+    with patch.object(
+        User, 'check_password', autospec=True, side_effect=User.check_password
+    ) as spy:
+        yield spy
+
+
+class TestAuthPipeline:
+
+    def test_admin_write_hashes_password_once(self, sqlite_app, create_user, check_password_spy):
+        create_user('admin@example.com', role='admin')
+        client = sqlite_app.test_client()
+
+        response = client.delete('/api/v1/tasks/999', headers=basic_auth_header('admin@example.com'))
+
+        assert response.status_code == 404
+        assert check_password_spy.call_count == 1
+
+    def test_delete_account_hashes_password_once(self, sqlite_app, create_user, check_password_spy):
+        create_user('admin@example.com', role='admin')
+        user_id = create_user('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.delete(
+            f'/api/v1/delete_user/{user_id}', headers=basic_auth_header('admin@example.com')
+        )
+
+        assert response.status_code == 200
+        assert check_password_spy.call_count == 1
+
+    def test_role_check_reuses_principal(self, sqlite_app, create_user, check_password_spy):
+        create_user('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.delete('/api/v1/tasks/999', headers=basic_auth_header('john@example.com'))
+
+        assert response.status_code == 403
+        assert check_password_spy.call_count == 1
+
+    def test_invalid_credentials(self, sqlite_app, create_user):
+        create_user('admin@example.com', role='admin')
+        client = sqlite_app.test_client()
+
+        response = client.delete(
+            '/api/v1/tasks/999', headers=basic_auth_header('admin@example.com', 'wrongpassword')
+        )
+
+        assert response.status_code == 401
+
+    def test_missing_auth_header(self, sqlite_app):
+        client = sqlite_app.test_client()
+
+        response = client.delete('/api/v1/tasks/999')
+
+        assert response.status_code == 401
@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+import pytest
+from flask_jwt_extended import create_access_token
+from werkzeug.security import check_password_hash
+
+from tests.utils import basic_auth_header
+
+
+@pytest.fixture
+def bearer_header(sqlite_app, create_user):
+    """Factory signing a user in and returning a Bearer Authorization header"""
+
+    def _bearer_header(email, role='user'):
+        create_user(email, role=role)
+        client = sqlite_app.test_client()
+        response = client.post('/api/v1/sign_in', headers=basic_auth_header(email))
+        return {'Authorization': f"Bearer {response.json['result']['access_token']}"}
+
+    return _bearer_header
+
+
+@pytest.fixture
+def check_password_hash_spy():
+    with patch(
+        'apiserver.commons.hashing.check_password_hash', side_effect=check_password_hash
+    ) as spy:
+        yield spy
+
+
+class TestBearerAuth:
+
+    def test_role_gated_request_skips_database_and_hashing(
+        self, sqlite_app, bearer_header, count_queries, check_password_hash_spy
+    ):
+        headers = bearer_header('admin@example.com', role='admin')
+        check_password_hash_spy.reset_mock()
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.delete('/api/v1/tasks/999', headers=headers)
+
+        assert response.status_code == 404
+        # Only the handler's own lookup of the task reaches the database
+        assert counter.count == 1
+        assert 'FROM tasks' in counter.statements[0]
+        assert check_password_hash_spy.call_count == 0
+
+    def test_role_claim_is_enforced(self, sqlite_app, bearer_header):
+        headers = bearer_header('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.delete('/api/v1/tasks/999', headers=headers)
+
+        assert response.status_code == 403
+
+    def test_create_task_records_token_identity(self, sqlite_app, bearer_header):
+        headers = bearer_header('admin@example.com', role='admin')
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/tasks/add', json={'title': 'Task'}, headers=headers)
+
+        assert response.status_code == 201
+        assert response.json['result']['createdBy']['email'] == 'admin@example.com'
+
+    def test_comment_endpoints_accept_bearer(self, sqlite_app, bearer_header):
+        headers = bearer_header('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/tasks/999/comments', headers=headers)
+
+        assert response.status_code == 404
+
+    def test_token_without_role_claim(self, sqlite_app, create_user):
+        user_id = create_user('admin@example.com', role='admin')
+        with sqlite_app.app_context():
+            token = create_access_token(identity=user_id)
+        client = sqlite_app.test_client()
+
+        response = client.delete(
+            '/api/v1/tasks/999', headers={'Authorization': f'Bearer {token}'}
+        )
+
+        assert response.status_code == 404
+
+    def test_invalid_token(self, sqlite_app):
+        client = sqlite_app.test_client()
+
+        response = client.delete(
+            '/api/v1/tasks/999', headers={'Authorization': 'Bearer invalid'}
+        )
+
+        assert response.status_code in (401, 422)
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+from apiserver.commons.utilities import authenticate_user
+from apiserver.extensions import credential_cache as app_credential_cache
+
+
+class TestCredentialCache:
+
+    def test_verified_credentials_are_remembered(self, credential_cache):
+        credential_cache.add('john@example.com', 'secretpassword', 1, 'hash')
+
+        assert credential_cache.is_verified('john@example.com', 'secretpassword', 1, 'hash')
+        assert not credential_cache.is_verified('john@example.com', 'wrongpassword', 1, 'hash')
+
+    def test_plaintext_password_is_not_stored(self, credential_cache):
+        credential_cache.add('john@example.com', 'secretpassword', 1, 'hash')
+
+        for key, value in credential_cache._entries.items():
+            assert b'secretpassword' not in key
+            assert 'secretpassword' not in value
+
+    def test_password_change_invalidates_entry(self, credential_cache):
+        credential_cache.add('john@example.com', 'secretpassword', 1, 'hash')
+
+        assert not credential_cache.is_verified('john@example.com', 'secretpassword', 1, 'new_hash')
+        assert len(credential_cache) == 0
+
+    def test_entry_expires_after_ttl(self, credential_cache):
+        credential_cache.add('john@example.com', 'secretpassword', 1, 'hash')
+
+        with patch('apiserver.commons.credentials.time.monotonic', return_value=10 ** 9):
+            assert not credential_cache.is_verified('john@example.com', 'secretpassword', 1, 'hash')
+
+    def test_cache_is_bounded(self, credential_cache):
+        credential_cache.add('a@example.com', 'password', 1, 'hash')
+        credential_cache.add('b@example.com', 'password', 2, 'hash')
+        credential_cache.add('c@example.com', 'password', 3, 'hash')
+
+        assert len(credential_cache) == 2
+        assert not credential_cache.is_verified('a@example.com', 'password', 1, 'hash')
+
+    def test_invalidate_user(self, credential_cache):
+        credential_cache.add('a@example.com', 'password', 1, 'hash')
+        credential_cache.add('b@example.com', 'password', 2, 'hash')
+        credential_cache.invalidate_user(1)
+
+        assert not credential_cache.is_verified('a@example.com', 'password', 1, 'hash')
+        assert credential_cache.is_verified('b@example.com', 'password', 2, 'hash')
+
+
+class TestAuthenticateUser:
+
+    def test_repeat_authentication_skips_password_hash(self, app, user, user_exists_mock):
+        app_credential_cache.clear()
+
+        assert authenticate_user('john@example.com', 'secretpassword') is user
+        assert authenticate_user('john@example.com', 'secretpassword') is user
+        assert user_exists_mock.call_count == 1
+
+    def test_invalid_password_is_not_cached(self, app, user_exists_mock):
+        app_credential_cache.clear()
+
+        assert authenticate_user('john@example.com', 'wrongpassword') is None
+        assert authenticate_user('john@example.com', 'wrongpassword') is None
+        assert user_exists_mock.call_count == 2
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from apiserver.commons.hashing import HashingPool, HashingPoolBusy
+from apiserver.extensions import hashing_pool
+from tests.utils import basic_auth_header
+
+
+def test_hashes_in_worker_processes():
+    pool = HashingPool(workers=1)
+    try:
+        password_hash = pool.generate('secretpassword')
+
+        assert pool.check(password_hash, 'secretpassword')
+        assert not pool.check(password_hash, 'wrongpassword')
+    finally:
+        pool.shutdown()
+
+    metrics = pool.metrics()
+    assert metrics['hashes'] == 3
+    assert metrics['queue_depth'] == 0
+    assert metrics['latency_buckets'][float('inf')] == 3
+    assert metrics['latency_sum'] > 0
+
+
+def test_sheds_load_when_queue_is_full():
+    pool = HashingPool(workers=0, max_pending=1, retry_after=5)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=pool._run, args=(slow_hash,))
+    worker.start()
+    started.wait(5)
+    try:
+        assert pool.metrics()['queue_depth'] == 1
+        with pytest.raises(HashingPoolBusy) as error:
+            pool.generate('secretpassword')
+    finally:
+        release.set()
+        worker.join()
+
+    assert ('Retry-After', '5') in error.value.get_headers()
+    metrics = pool.metrics()
+    assert metrics['rejected'] == 1
+    assert metrics['hashes'] == 1
+    assert metrics['queue_depth'] == 0
+
+
+def test_accepts_hashes_made_outside_the_pool():
+    pool = HashingPool(workers=0)
+
+    assert pool.check(generate_password_hash('secretpassword'), 'secretpassword')
+
+
+class TestHashingAdmission:
+
+    def test_signin_returns_503_when_saturated(self, sqlite_app, create_user, monkeypatch):
+        create_user('john@example.com')
+        monkeypatch.setattr(hashing_pool, 'max_pending', 0)
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/sign_in', headers=basic_auth_header('john@example.com'))
+
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == str(hashing_pool.retry_after)
+
+    def test_signup_returns_503_when_saturated(self, sqlite_app, monkeypatch):
+        monkeypatch.setattr(hashing_pool, 'max_pending', 0)
+        client = sqlite_app.test_client()
+        data = {
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john@example.com',
+            'password': 'secretpassword',
+        }
+
+        response = client.post('/api/v1/sign_up', json=data)
+
+        assert response.status_code == 503
+        assert 'Retry-After' in response.headers
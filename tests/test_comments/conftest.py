@@ -1,8 +1,11 @@
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
+from apiserver.api.models import Comment
 from apiserver.api.resources import CommentResource
+from apiserver.extensions import db as sql_db
 
 
 # Create a TaskResource instance for testing
@@ -19,6 +22,9 @@ class MockComment:
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
 
+    def to_json(self):
+        return {'id': self.id, 'content': self.content}
+
 
 # Mock the Task.query.filter_by method to return a task
 @pytest.fixture
@@ -58,6 +64,10 @@ def task_comments_mock(app):
         task_query_mock = patch('apiserver.api.models.Task.query')
         task_query_filter_mock = task_query_mock.start()
         task_query_filter_mock.return_value.first.return_value = task
+        # Comments are listed with the task id in a single outer join
+        joined = task_query_filter_mock.with_entities.return_value.outerjoin.return_value
+        page = joined.filter.return_value.order_by.return_value.limit.return_value
+        page.all.return_value = [(task.id, comment) for comment in task.comments]
 
         yield task_query_mock
         task_query_mock.stop()
@@ -73,4 +83,34 @@ def db(app):
         yield db_mock_start
 
     # Clean up the mock
-    db_mock.stop()
\ No newline at end of file
+    db_mock.stop()
+
+
+@pytest.fixture
+def comment_missing_mock(db):
+    """Make UPDATE and DELETE statements on comments match no row"""
+    db.session.execute.return_value.scalar.return_value = None
+    db.session.execute.return_value.rowcount = 0
+    return db
+
+
+@pytest.fixture
+def create_comments(sqlite_app):
+    """Factory to add comments on a task to the SQLite database"""
+
+    def _create_comments(task_id, count):
+        start = datetime(2023, 9, 1)
+        with sqlite_app.app_context():
+            comments = [
+                Comment(
+                    content=f'Comment {index}',
+                    task_id=task_id,
+                    created_at=start + timedelta(minutes=index // 2),
+                )
+                for index in range(count)
+            ]
+            sql_db.session.add_all(comments)
+            sql_db.session.commit()
+            return [comment.id for comment in comments]
+
+    return _create_comments
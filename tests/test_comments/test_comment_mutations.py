@@ -0,0 +1,82 @@
+import pytest
+
+from apiserver.api.models import Comment, Task
+from apiserver.extensions import db
+
+
+def comment_url(task_id, comment_id):
+    return f'/api/v1/tasks/{task_id}/comments/{comment_id}'
+
+
+@pytest.fixture(params=[True, False], ids=['returning', 'no-returning'])
+def returning(request, monkeypatch):
+    """Run with and without UPDATE ... RETURNING support"""
+    if not request.param:
+        monkeypatch.setattr(
+            'apiserver.api.resources.tasks.supports_returning', lambda statement: False
+        )
+    return request.param
+
+
+class TestCommentMutations:
+
+    def test_update_is_single_statement_per_table(
+        self, sqlite_app, admin_headers, create_tasks, create_comments, count_queries, returning
+    ):
+        task_id = create_tasks(1)[0]
+        comment_id = create_comments(task_id, 1)[0]
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.put(
+                comment_url(task_id, comment_id), json={'comment': 'Edited'}, headers=admin_headers
+            )
+
+        assert response.status_code == 200
+        assert response.json['result']['content'] == 'Edited'
+        writes = [
+            statement for statement in counter.statements
+            if statement.startswith('UPDATE')
+        ]
+        assert len(writes) == 2
+        reads = [
+            statement for statement in counter.statements
+            if statement.startswith('SELECT')
+            and ('FROM comments' in statement or 'FROM tasks' in statement)
+        ]
+        assert len(reads) == (0 if returning else 2)
+        with sqlite_app.app_context():
+            assert db.session.get(Comment, comment_id).content == 'Edited'
+            assert db.session.get(Task, task_id).version == 2
+
+    def test_delete_removes_comment_and_bumps_version(
+        self, sqlite_app, admin_headers, create_tasks, create_comments, returning
+    ):
+        task_id = create_tasks(1)[0]
+        comment_id = create_comments(task_id, 1)[0]
+
+        response = sqlite_app.test_client().delete(
+            comment_url(task_id, comment_id), headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        with sqlite_app.app_context():
+            assert db.session.get(Comment, comment_id) is None
+            assert db.session.get(Task, task_id).version == 2
+
+    @pytest.mark.parametrize('method, payload', [('put', {'comment': 'Edited'}), ('delete', None)])
+    def test_comment_of_another_task_is_not_found(
+        self, sqlite_app, admin_headers, create_tasks, create_comments, method, payload
+    ):
+        task_id, other_task_id = create_tasks(2)
+        comment_id = create_comments(other_task_id, 1)[0]
+
+        response = getattr(sqlite_app.test_client(), method)(
+            comment_url(task_id, comment_id), json=payload, headers=admin_headers
+        )
+
+        assert response.status_code == 404
+        with sqlite_app.app_context():
+            assert db.session.get(Comment, comment_id).content == 'Comment 0'
+            assert db.session.get(Task, task_id).version == 1
+            assert db.session.get(Task, other_task_id).version == 1
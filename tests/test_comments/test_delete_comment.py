@@ -13,7 +13,7 @@ class TestCommentResource:
             assert response_data['status'] == 'success'
 
 
-    def test_delete_comment_with_invalid_task(self, app, db, comment_resource):
+    def test_delete_comment_with_invalid_task(self, app, db, comment_resource, comment_missing_mock):
         with app.test_request_context('/api/v1/tasks/invalid_task_id/comments/456def', method='DELETE'):
             response = comment_resource.delete(task_id='invalid_task_id', comment_id='456def')
 
@@ -24,7 +24,7 @@ class TestCommentResource:
             assert response_data['status'] == 'failed'
 
 
-    def test_delete_comment_with_invalid_comment(self, app, db, comment_resource):
+    def test_delete_comment_with_invalid_comment(self, app, db, comment_resource, comment_missing_mock):
         with app.test_request_context('/api/v1/tasks/123abc/comments/invalid_comment_id', method='DELETE'):
             response = comment_resource.delete(task_id='123abc', comment_id='invalid_comment_id')
 
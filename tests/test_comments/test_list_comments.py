@@ -0,0 +1,124 @@
+import base64
+import json
+
+import pytest
+from sqlalchemy import update
+
+from apiserver.api.models import Comment
+from apiserver.extensions import db
+
+
+def list_comments(client, task_id, headers, **query_string):
+    return client.get(
+        f'/api/v1/tasks/{task_id}/comments', query_string=query_string, headers=headers
+    )
+
+
+class TestListComments:
+
+    def test_pages_follow_creation_order(
+        self, sqlite_app, admin_headers, create_tasks, create_comments
+    ):
+        task_id = create_tasks(1)[0]
+        comment_ids = create_comments(task_id, 5)
+        client = sqlite_app.test_client()
+
+        seen, cursor = [], None
+        while True:
+            query = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = list_comments(client, task_id, admin_headers, **query)
+            assert response.status_code == 200
+            seen.extend(comment['id'] for comment in response.json['result'])
+            cursor = response.json['next_cursor']
+            if cursor is None:
+                break
+
+        assert seen == comment_ids
+
+    def test_newest_first(self, sqlite_app, admin_headers, create_tasks, create_comments):
+        task_id = create_tasks(1)[0]
+        comment_ids = create_comments(task_id, 5)
+        client = sqlite_app.test_client()
+
+        first = list_comments(client, task_id, admin_headers, sort='-created_at', limit=3)
+        second = list_comments(
+            client, task_id, admin_headers,
+            sort='-created_at', limit=3, cursor=first.json['next_cursor'],
+        )
+
+        ids = [comment['id'] for comment in first.json['result'] + second.json['result']]
+        assert ids == comment_ids[::-1]
+        assert second.json['next_cursor'] is None
+
+    @pytest.mark.parametrize('sort', ['created_at', '-created_at'])
+    def test_pages_cover_comments_without_creation_date(
+        self, sqlite_app, admin_headers, create_tasks, create_comments, sort
+    ):
+        task_id = create_tasks(1)[0]
+        comment_ids = create_comments(task_id, 6)
+        with sqlite_app.app_context():
+            db.session.execute(
+                update(Comment)
+                .where(Comment.id.in_(comment_ids[::2]))
+                .values(created_at=None)
+            )
+            db.session.commit()
+        client = sqlite_app.test_client()
+
+        seen, cursor = [], None
+        while True:
+            query = {'sort': sort, 'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = list_comments(client, task_id, admin_headers, **query)
+            assert response.status_code == 200
+            seen.extend(comment['id'] for comment in response.json['result'])
+            cursor = response.json['next_cursor']
+            if cursor is None:
+                break
+
+        nulls, dated = comment_ids[::2], comment_ids[1::2]
+        expected = nulls + dated if sort == 'created_at' else dated[::-1] + nulls[::-1]
+        assert seen == expected
+
+    def test_comments_of_other_tasks_are_excluded(
+        self, sqlite_app, admin_headers, create_tasks, create_comments
+    ):
+        task_id, other_task_id = create_tasks(2)
+        create_comments(other_task_id, 3)
+
+        response = list_comments(sqlite_app.test_client(), task_id, admin_headers)
+
+        assert response.status_code == 200
+        assert response.json['result'] == []
+        assert response.json['next_cursor'] is None
+
+    def test_missing_task(self, sqlite_app, admin_headers):
+        response = list_comments(sqlite_app.test_client(), 404, admin_headers)
+
+        assert response.status_code == 404
+
+    def test_single_statement(
+        self, sqlite_app, admin_headers, create_tasks, create_comments, count_queries
+    ):
+        task_id = create_tasks(1)[0]
+        create_comments(task_id, 10)
+        client = sqlite_app.test_client()
+        list_comments(client, task_id, admin_headers)
+
+        with count_queries() as counter:
+            response = list_comments(client, task_id, admin_headers, limit=4)
+
+        assert len(response.json['result']) == 4
+        assert sum('comments' in statement for statement in counter.statements) == 1
+
+    @pytest.mark.parametrize('query', [
+        {'limit': 0},
+        {'cursor': 'not-a-cursor'},
+        {'cursor': base64.urlsafe_b64encode(json.dumps(['2023-01-01T00:00:00', None]).encode())},
+        {'sort': 'content'},
+    ])
+    def test_invalid_arguments(self, sqlite_app, admin_headers, create_tasks, query):
+        task_id = create_tasks(1)[0]
+
+        response = list_comments(sqlite_app.test_client(), task_id, admin_headers, **query)
+
+        assert response.status_code == 400
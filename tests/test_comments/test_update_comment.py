@@ -15,7 +15,7 @@ class TestCommentResource:
         assert response_status.value == 200
         assert response_data['status'] == 'success'
 
-    def test_update_comment_with_invalid_task(self, app, db, comment_resource):
+    def test_update_comment_with_invalid_task(self, app, db, comment_resource, comment_missing_mock):
         data = {'comment': 'Updated comment content.'}
         with app.test_request_context('/api/v1/tasks/invalid_task_id/comments/456def', method='PUT',
                                       data=json.dumps(data), content_type='application/json'):
@@ -27,7 +27,7 @@ class TestCommentResource:
         assert response_status.value == 404
         assert response_data['status'] == 'failed'
 
-    def test_update_comment_with_invalid_comment(self, app, db, comment_resource):
+    def test_update_comment_with_invalid_comment(self, app, db, comment_resource, comment_missing_mock):
         data = {'comment': 'Updated comment content.'}
         with app.test_request_context('/api/v1/tasks/123abc/comments/invalid_comment_id', method='PUT',
                                       data=json.dumps(data), content_type='application/json'):
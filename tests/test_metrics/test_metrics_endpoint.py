@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+
+from apiserver.app import create_app
+from apiserver.commons.database import InstrumentedQueuePool, pool_status
+from apiserver.commons.metrics import RequestMetrics
+from apiserver.extensions import request_metrics
+from tests.config import SQLiteTestingConfig
+
+
+def _samples(response):
+    """Parse the exposition text into {(name, labels): value}"""
+    samples = {}
+    for line in response.get_data(as_text=True).splitlines():
+        if not line or line.startswith('#'):
+            continue
+        series, value = line.rsplit(' ', 1)
+        name, _, labels = series.partition('{')
+        samples[(name, labels.rstrip('}'))] = float(value)
+    return samples
+
+
+@pytest.fixture
+def metrics_app(sqlite_app):
+    @sqlite_app.route('/unavailable')
+    def unavailable():
+        return 'Unavailable', 503
+
+    @sqlite_app.route('/ping')
+    def ping():
+        return 'pong'
+
+    return sqlite_app
+
+
+class TestMetricsEndpoint:
+
+    def test_requests_are_counted_per_endpoint(self, metrics_app, admin_headers, create_tasks):
+        create_tasks(3)
+        client = metrics_app.test_client()
+        for _ in range(2):
+            client.get('/api/v1/tasks', headers=admin_headers)
+        client.get('/api/v1/tasks', query_string={'sort': 'unknown'}, headers=admin_headers)
+
+        response = client.get('/metrics')
+
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        samples = _samples(response)
+        labels = 'endpoint="api._tasks",method="GET"'
+        assert samples[('apiserver_http_requests_total', labels + ',status="200"')] == 2
+        assert samples[('apiserver_http_requests_total', labels + ',status="400"')] == 1
+        assert samples[('apiserver_http_request_duration_seconds_count', labels)] == 3
+        assert samples[('apiserver_http_request_duration_seconds_bucket', labels + ',le="+Inf"')] == 3
+        assert samples[('apiserver_http_request_db_queries_count', labels)] == 3
+        assert samples[('apiserver_http_request_db_queries_sum', labels)] >= 2
+        assert samples[('apiserver_http_request_db_duration_seconds_sum', labels)] > 0
+
+    def test_server_errors_are_counted(self, metrics_app):
+        client = metrics_app.test_client()
+        client.get('/unavailable')
+        client.get('/does-not-exist')
+
+        samples = _samples(client.get('/metrics'))
+
+        assert samples[('apiserver_http_request_errors_total', 'endpoint="unavailable",method="GET"')] == 1
+        assert samples[('apiserver_http_requests_total', 'endpoint="unmatched",method="GET",status="404"')] == 1
+
+    def test_threads_aggregate_separately(self, metrics_app):
+        def send_requests():
+            client = metrics_app.test_client()
+            for _ in range(25):
+                client.get('/ping')
+
+        threads = [threading.Thread(target=send_requests) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        samples = _samples(metrics_app.test_client().get('/metrics'))
+
+        assert samples[('apiserver_http_requests_total', 'endpoint="ping",method="GET",status="200"')] == 100
+
+    def test_finished_threads_are_retired(self, metrics_app):
+        client = metrics_app.test_client()
+        for _ in range(50):
+            thread = threading.Thread(target=client.get, args=('/ping',))
+            thread.start()
+            thread.join()
+
+        samples = _samples(client.get('/metrics'))
+
+        # Only the thread serving /metrics is left, the others were folded
+        assert len(request_metrics._threads) == 1
+        assert samples[('apiserver_http_requests_total', 'endpoint="ping",method="GET",status="200"')] == 50
+        samples = _samples(client.get('/metrics'))
+        assert samples[('apiserver_http_requests_total', 'endpoint="ping",method="GET",status="200"')] == 50
+
+    def test_process_metrics_are_included(self, metrics_app):
+        samples = _samples(metrics_app.test_client().get('/metrics'))
+
+        assert ('apiserver_password_hashes_total', '') in samples
+        assert ('apiserver_response_cache_hits_total', '') in samples
+        assert ('apiserver_db_pool_wait_seconds_count', 'bind="default"') not in samples
+
+    def test_pool_metrics(self, tmp_path):
+        engine = create_engine(f'sqlite:///{tmp_path / "pool.db"}', poolclass=InstrumentedQueuePool)
+        with engine.connect():
+            pools = {'default': pool_status(engine)}
+
+        lines = RequestMetrics().render(pools=pools).splitlines()
+
+        assert 'apiserver_db_pool_checked_out{bind="default"} 1' in lines
+        assert 'apiserver_db_pool_checkouts_total{bind="default"} 1' in lines
+        assert 'apiserver_db_pool_wait_seconds_count{bind="default"} 1' in lines
+        assert '# TYPE apiserver_db_pool_wait_seconds histogram' in lines
+
+    def test_metrics_can_be_disabled(self):
+        class NoMetricsConfig(SQLiteTestingConfig):
+            METRICS_ENABLED = False
+
+        app = create_app(NoMetricsConfig)
+
+        assert app.test_client().get('/metrics').status_code == 404
+        assert not request_metrics.enabled
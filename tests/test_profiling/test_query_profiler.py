@@ -0,0 +1,115 @@
+import logging
+
+import pytest
+
+from apiserver.api.models import Role, User
+from apiserver.app import create_app
+from apiserver.commons.profiling import normalize_sql, slow_query_logger
+from apiserver.extensions import db, query_profiler
+from tests.config import SQLiteTestingConfig
+from tests.utils import QueryCounter, basic_auth_header
+
+
+@pytest.fixture
+def profiled_app():
+    """Flask Test App logging every statement as slow and reporting SQL headers"""
+
+    class ProfiledConfig(SQLiteTestingConfig):
+        SLOW_QUERY_THRESHOLD_MS = 0
+        SQL_PROFILE_HEADERS = True
+
+    app = create_app(ProfiledConfig)
+    with app.app_context():
+        db.create_all()
+        role = Role('admin')
+        db.session.add(role)
+        db.session.flush()
+        admin = User(first_name='John', last_name='Doe', email='admin@example.com', role_id=role.id)
+        admin.set_password('secretpassword')
+        db.session.add(admin)
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def slow_queries(caplog):
+    """Records of the slow-query logger, which does not propagate to the root logger"""
+    slow_query_logger.addHandler(caplog.handler)
+    yield caplog
+    slow_query_logger.removeHandler(caplog.handler)
+
+
+class TestNormalizeSql:
+
+    def test_literals_and_placeholders(self):
+        statement = "SELECT * FROM tasks\n  WHERE title = 'It''s' AND id > 10 AND status = ? LIMIT %s"
+
+        assert normalize_sql(statement) == (
+            'SELECT * FROM tasks WHERE title = ? AND id > ? AND status = ? LIMIT ?'
+        )
+
+    def test_in_lists_are_collapsed(self):
+        assert normalize_sql('DELETE FROM tasks WHERE id IN (?, ?, ?)') == (
+            'DELETE FROM tasks WHERE id IN (...)'
+        )
+        assert normalize_sql('DELETE FROM tasks WHERE id IN (%s)') == (
+            'DELETE FROM tasks WHERE id IN (...)'
+        )
+
+    def test_identifiers_are_kept(self):
+        assert normalize_sql('SELECT anon_1.id FROM tasks_2 AS anon_1') == (
+            'SELECT anon_1.id FROM tasks_2 AS anon_1'
+        )
+
+
+class TestQueryProfiler:
+
+    def test_slow_queries_are_attributed(self, profiled_app, slow_queries):
+        response = profiled_app.test_client().get(
+            '/api/v1/tasks', headers=basic_auth_header('admin@example.com')
+        )
+
+        assert response.status_code == 200
+        messages = [record.getMessage() for record in slow_queries.records]
+        assert all(record.levelno == logging.WARNING for record in slow_queries.records)
+        assert all(' TaskResource.get at apiserver/' in message for message in messages)
+        assert any(
+            'apiserver/commons/utilities.py' in message and 'in authenticate_user: SELECT' in message
+            for message in messages
+        )
+        assert any(
+            'in keyset_paginate: SELECT' in message and 'FROM tasks' in message
+            for message in messages
+        )
+        assert not any('secretpassword' in message for message in messages)
+
+    def test_fast_queries_are_not_logged(self, profiled_app, slow_queries, monkeypatch):
+        monkeypatch.setattr(query_profiler, 'threshold', 60)
+
+        profiled_app.test_client().get(
+            '/api/v1/tasks', headers=basic_auth_header('admin@example.com')
+        )
+
+        assert not [record for record in slow_queries.records if record.levelno >= logging.WARNING]
+
+    def test_profile_headers(self, profiled_app):
+        with profiled_app.app_context():
+            engine = db.engine
+
+        with QueryCounter(engine) as counter:
+            response = profiled_app.test_client().get(
+                '/api/v1/tasks', headers=basic_auth_header('admin@example.com')
+            )
+
+        assert int(response.headers['X-DB-Query-Count']) == len(counter.statements)
+        assert float(response.headers['X-DB-Time-Ms']) > 0
+
+    def test_profile_headers_are_opt_in(self, sqlite_app):
+        response = sqlite_app.test_client().get('/api/v1/tasks')
+
+        assert 'X-DB-Query-Count' not in response.headers
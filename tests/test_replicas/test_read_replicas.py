@@ -0,0 +1,127 @@
+import pytest
+from flask import g
+
+from apiserver.api.models import Role, Task, User
+from apiserver.app import create_app
+from apiserver.commons.database import read_replica
+from apiserver.extensions import db
+from tests.config import SQLiteTestingConfig
+from tests.utils import QueryCounter, basic_auth_header
+
+
+def _seed(session, task_title):
+    admin_role, user_role = Role('admin'), Role('user')
+    session.add_all([admin_role, user_role])
+    session.flush()
+    admin = User(first_name='John', last_name='Doe', email='admin@example.com', role_id=admin_role.id)
+    admin.set_password('secretpassword')
+    session.add_all([admin, Task(title=task_title)])
+    session.commit()
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """Flask Test App backed by a primary SQLite file and a replica SQLite file
+
+    Both files hold the same admin user and a task with the same id but a
+    different title, which tells which database answered a query.
+    """
+
+    class ReplicaConfig(SQLiteTestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "primary.db"}'
+        SQLALCHEMY_BINDS = {'replica_0': f'sqlite:///{tmp_path / "replica.db"}'}
+        DATABASE_REPLICA_BINDS = ['replica_0']
+
+    app = create_app(ReplicaConfig)
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines['replica_0'])
+        _seed(db.session, 'Primary task')
+        with db.Session(db.engines['replica_0']) as replica_session:
+            _seed(replica_session, 'Replica task')
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registers a metadata per bind on the shared extension
+    db.metadatas.pop('replica_0', None)
+
+
+@pytest.fixture
+def engines(replica_app):
+    with replica_app.app_context():
+        return db.engines[None], db.engines['replica_0']
+
+
+def _titles(response):
+    return [task['title'] for task in response.json['result']]
+
+
+class TestReadReplicas:
+
+    def test_list_tasks_reads_replica(self, replica_app, engines):
+        primary, replica = engines
+        client = replica_app.test_client()
+
+        with QueryCounter(primary) as on_primary, QueryCounter(replica) as on_replica:
+            response = client.get('/api/v1/tasks', headers=basic_auth_header('admin@example.com'))
+
+        assert response.status_code == 200
+        assert _titles(response) == ['Replica task']
+        assert any('FROM tasks' in statement for statement in on_replica.statements)
+        assert not any('FROM tasks' in statement for statement in on_primary.statements)
+
+    def test_read_endpoints_use_replica(self, replica_app):
+        with replica_app.app_context():
+            db.session.add(Task(title='Only on primary'))
+            db.session.commit()
+        client = replica_app.test_client()
+        headers = basic_auth_header('admin@example.com')
+
+        users = client.get('/api/v1/users', headers=headers)
+        comments = client.get('/api/v1/tasks/2/comments', headers=headers)
+
+        assert [user['email'] for user in users.json['result']] == ['admin@example.com']
+        assert comments.status_code == 404
+
+    def test_writes_go_to_primary(self, replica_app, engines):
+        primary, replica = engines
+        client = replica_app.test_client()
+
+        with QueryCounter(replica) as on_replica:
+            response = client.put(
+                '/api/v1/tasks/1',
+                json={'description': 'Updated'},
+                headers=basic_auth_header('admin@example.com'),
+            )
+
+        assert response.status_code == 201
+        assert response.json['result']['title'] == 'Primary task'
+        assert on_replica.statements == []
+
+    def test_read_after_write_stays_on_primary(self, replica_app):
+        @read_replica
+        def titles():
+            return [task.title for task in Task.query.order_by(Task.id)]
+
+        with replica_app.test_request_context():
+            assert titles() == ['Replica task']
+
+            db.session.add(Task(title='New task'))
+            db.session.flush()
+
+            assert g.primary_only
+            assert titles() == ['Primary task', 'New task']
+            db.session.rollback()
+
+    def test_reads_stay_on_primary_without_replica(self, replica_app):
+        replica_app.config['DATABASE_REPLICA_BINDS'] = []
+
+        response = replica_app.test_client().get(
+            '/api/v1/tasks', headers=basic_auth_header('admin@example.com')
+        )
+
+        assert _titles(response) == ['Primary task']
@@ -0,0 +1,130 @@
+import json
+from datetime import datetime
+
+import pytest
+from marshmallow import Schema, fields
+
+from apiserver.api.models import Task, User
+from apiserver.api.schemas import UserSchema
+from apiserver.api.schemas.compiled import compile_schema, dump_task, dump_user
+from apiserver.api.schemas.tasks import TaskSchema
+from apiserver.commons.constants import PriorityLevel, TaskStatus, TaskType
+
+
+def make_user(user_id=1, role_id=2, **kwargs):
+    return User(
+        id=user_id,
+        email=f'user{user_id}@example.com',
+        role_id=role_id,
+        created_at=datetime(2023, 9, 1, 12, 30, 15, 250),
+        **kwargs,
+    )
+
+
+TASKS = [
+    # Every column set
+    Task(
+        id=1,
+        title='Complete task',
+        description='Ünïcode description',
+        due_date=datetime(2023, 10, 1, 9, 0),
+        priority=PriorityLevel.TIGHT,
+        status=TaskStatus.IN_WORK,
+        type=TaskType.SUBTASK,
+        created_by=make_user(1, first_name='John', last_name='Doe'),
+        assigned_to=make_user(2),
+        created_at=datetime(2023, 9, 1),
+        updated_at=datetime(2023, 9, 2, 8, 15, 30, 123456),
+        completion_date=datetime(2023, 9, 3),
+        recurring_task=True,
+        estimate=8,
+        actual_time_spent=0,
+    ),
+    # Optional columns and relationships left empty
+    Task(
+        id=2,
+        title='Minimal task',
+        priority=PriorityLevel.RELAXED,
+        status=TaskStatus.OPEN,
+        type=TaskType.TASK,
+        recurring_task=False,
+    ),
+    # Falsy values which must not be mistaken for None
+    Task(
+        id=3,
+        title='',
+        description='',
+        priority=PriorityLevel.MEDIUM,
+        status=TaskStatus.COMPLETED,
+        type=TaskType.SUBTASK,
+        created_by=make_user(3),
+        estimate=0,
+    ),
+]
+
+USERS = [
+    make_user(1, first_name='John', last_name='Doe'),
+    make_user(2, role_id=1),
+    User(id=3, email='norole@example.com'),
+]
+
+
+@pytest.mark.parametrize('task', TASKS, ids=lambda task: f'task-{task.id}')
+def test_dump_task_matches_marshmallow(task):
+    expected = TaskSchema().dump(task)
+
+    assert dump_task(task) == expected
+    assert json.dumps(dump_task(task)) == json.dumps(expected)
+
+
+@pytest.mark.parametrize('user', USERS, ids=lambda user: f'user-{user.id}')
+def test_dump_user_matches_marshmallow(sqlite_app, user):
+    with sqlite_app.app_context():
+        expected = UserSchema().dump(user)
+
+        assert dump_user(user) == expected
+        assert json.dumps(dump_user(user)) == json.dumps(expected)
+
+
+def test_dump_task_list_matches_marshmallow():
+    expected = TaskSchema(many=True).dump(TASKS)
+
+    assert json.dumps([dump_task(task) for task in TASKS]) == json.dumps(expected)
+
+
+def test_compile_schema_falls_back_to_marshmallow():
+    class ExampleSchema(Schema):
+        name = fields.String(data_key='fullName')
+        count = fields.Integer(as_string=True)
+        day = fields.DateTime(format='%Y-%m-%d')
+        kind = fields.String(dump_default='unknown')
+        tags = fields.List(fields.String())
+        extra = fields.Method('get_extra')
+
+        def get_extra(self, obj):
+            return obj.name.upper()
+
+    class Example:
+        name = 'example'
+        count = 3
+        day = datetime(2023, 9, 1)
+        tags = ['a', 'b']
+
+    expected = ExampleSchema().dump(Example())
+
+    assert json.dumps(compile_schema(ExampleSchema)(Example())) == json.dumps(expected)
+
+
+def test_dump_user_resolves_role_name(sqlite_app):
+    with sqlite_app.app_context():
+        assert dump_user(make_user(1, role_id=1))['role'] == {'name': 'admin'}
+        assert dump_user(User(id=3, email='norole@example.com'))['role'] is None
+
+
+def test_compile_schema_restricts_fields():
+    user = make_user(1, first_name='John')
+
+    assert compile_schema(UserSchema, only=['id', 'email'])(user) == {
+        'id': '1',
+        'email': 'user1@example.com',
+    }
@@ -0,0 +1,99 @@
+import pytest
+
+from apiserver.api.models import Task
+
+
+def assignees(app, task_ids):
+    with app.app_context():
+        tasks = Task.query.filter(Task.id.in_(task_ids)).order_by(Task.id)
+        return [(task.assigned_to_id, task.version) for task in tasks]
+
+
+class TestBulkAssignTasks:
+
+    def test_assign_pairs(self, sqlite_app, admin_headers, create_user, create_tasks, count_queries):
+        john_id = create_user('john@example.com')
+        jane_id = create_user('jane@example.com')
+        task_ids = create_tasks(4)
+        data = {'assignments': [
+            {'task_id': task_ids[0], 'user_id': john_id},
+            {'task_id': task_ids[1], 'user_id': jane_id},
+            {'task_id': task_ids[2], 'user_id': john_id},
+        ]}
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.post('/api/v1/assign-task/bulk', json=data, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.json['result'] == [
+            {'task_id': task_ids[0], 'user_id': john_id},
+            {'task_id': task_ids[1], 'user_id': jane_id},
+            {'task_id': task_ids[2], 'user_id': john_id},
+        ]
+        assert len([sql for sql in counter.statements if sql.startswith('UPDATE')]) == 2
+        assert assignees(sqlite_app, task_ids) == [
+            (john_id, 2), (jane_id, 2), (john_id, 2), (None, 1)
+        ]
+
+    def test_reassign_all_tasks_of_a_user(self, sqlite_app, admin_headers, create_user, create_tasks):
+        john_id = create_user('john@example.com')
+        jane_id = create_user('jane@example.com')
+        john_task_ids = create_tasks(3, assigned_to_id=john_id)
+        other_task_ids = create_tasks(1)
+        data = {'from_user_id': john_id, 'to_user_id': jane_id}
+
+        response = sqlite_app.test_client().post(
+            '/api/v1/assign-task/bulk', json=data, headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        assert [item['task_id'] for item in response.json['result']] == john_task_ids
+        assert assignees(sqlite_app, john_task_ids) == [(jane_id, 2)] * 3
+        assert assignees(sqlite_app, other_task_ids) == [(None, 1)]
+
+    def test_unknown_ids_assign_nothing(self, sqlite_app, admin_headers, create_user, create_tasks):
+        john_id = create_user('john@example.com')
+        task_ids = create_tasks(2)
+        data = {'assignments': [
+            {'task_id': task_ids[0], 'user_id': john_id},
+            {'task_id': task_ids[1], 'user_id': 999},
+            {'task_id': 998, 'user_id': john_id},
+        ]}
+
+        response = sqlite_app.test_client().post(
+            '/api/v1/assign-task/bulk', json=data, headers=admin_headers
+        )
+
+        assert response.status_code == 404
+        assert response.json['result'] == {'user_ids': [999], 'task_ids': [998]}
+        assert assignees(sqlite_app, task_ids) == [(None, 1)] * 2
+
+    @pytest.mark.parametrize('data', [
+        None,
+        {},
+        {'assignments': {'task_id': 1, 'user_id': 1}},
+        {'assignments': [{'task_id': 1}]},
+        {'assignments': [{'task_id': 1, 'user_id': 1}, {'task_id': 1, 'user_id': 2}]},
+        {'from_user_id': 'john'},
+        {'from_user_id': 1.0, 'to_user_id': 2},
+        {'assignments': [{'task_id': 3.7, 'user_id': 1}]},
+        {'assignments': [{'task_id': True, 'user_id': 1}]},
+        {'assignments': [{'task_id': '1', 'user_id': 1}]},
+    ])
+    def test_invalid_payload(self, sqlite_app, admin_headers, data):
+        response = sqlite_app.test_client().post(
+            '/api/v1/assign-task/bulk', json=data, headers=admin_headers
+        )
+
+        assert response.status_code == 400
+
+    def test_too_many_assignments(self, sqlite_app, admin_headers):
+        sqlite_app.config['BULK_MAX_ITEMS'] = 1
+        data = {'assignments': [{'task_id': 1, 'user_id': 1}, {'task_id': 2, 'user_id': 1}]}
+
+        response = sqlite_app.test_client().post(
+            '/api/v1/assign-task/bulk', json=data, headers=admin_headers
+        )
+
+        assert response.status_code == 413
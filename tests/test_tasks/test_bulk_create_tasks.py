@@ -0,0 +1,69 @@
+from apiserver.api.models import Task
+from apiserver.commons.constants import PriorityLevel
+
+
+class TestBulkCreateTasks:
+
+    def test_create_tasks(self, sqlite_app, admin_headers, count_queries):
+        data = [
+            {'title': 'Task A', 'priority': 'high', 'due_date': '2023-09-15'},
+            {'title': 'Task B', 'description': 'Desc task B'},
+        ]
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.post('/api/v1/tasks/bulk', json=data, headers=admin_headers)
+
+        assert response.status_code == 201
+        assert [item['status'] for item in response.json['result']] == ['created', 'created']
+        assert len([sql for sql in counter.statements if sql.startswith('INSERT')]) == 1
+        with sqlite_app.app_context():
+            task = Task.query.filter_by(title='Task A').first()
+            assert task.id == response.json['result'][0]['id']
+            assert task.priority == PriorityLevel.TIGHT
+            assert task.created_by_id is not None
+
+    def test_duplicate_and_invalid_items(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(1)
+        data = [
+            {'title': 'Task 0'},
+            {'title': 'Task A'},
+            {'title': 'Task A'},
+            {'description': 'No title'},
+            {'title': 'Task B', 'status': 'done'},
+            {'title': 'Task C', 'password': 'secret'},
+        ]
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/tasks/bulk', json=data, headers=admin_headers)
+
+        assert response.status_code == 207
+        assert [item['status'] for item in response.json['result']] == [
+            'conflict', 'created', 'conflict', 'invalid', 'invalid', 'invalid',
+        ]
+        with sqlite_app.app_context():
+            assert Task.query.count() == 2
+
+    def test_nothing_created(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/tasks/bulk', json=[{'title': ''}], headers=admin_headers)
+
+        assert response.status_code == 400
+        assert response.json['status'] == 'failed'
+
+    def test_batch_ceiling(self, sqlite_app, admin_headers):
+        sqlite_app.config['BULK_MAX_ITEMS'] = 2
+        data = [{'title': f'Task {index}'} for index in range(3)]
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/tasks/bulk', json=data, headers=admin_headers)
+
+        assert response.status_code == 413
+
+    def test_payload_must_be_a_list(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        response = client.post('/api/v1/tasks/bulk', json={'title': 'Task A'}, headers=admin_headers)
+
+        assert response.status_code == 400
@@ -0,0 +1,109 @@
+import pytest
+
+from apiserver.api.models import Task
+from apiserver.commons.constants import TaskStatus
+from tests.utils import basic_auth_header
+
+
+@pytest.fixture(params=[True, False], ids=['returning', 'no-returning'])
+def returning(request, monkeypatch):
+    """Run with and without UPDATE ... RETURNING support"""
+    if not request.param:
+        monkeypatch.setattr(
+            'apiserver.api.resources.tasks.supports_returning', lambda statement: False
+        )
+    return request.param
+
+
+def task_states(app, task_ids):
+    with app.app_context():
+        tasks = Task.query.filter(Task.id.in_(task_ids)).order_by(Task.id)
+        return [(task.status, task.version) for task in tasks]
+
+
+class TestBulkUpdateTasks:
+
+    def test_update_by_ids(self, sqlite_app, admin_headers, create_tasks, count_queries, returning):
+        task_ids = create_tasks(4)
+        data = {'ids': task_ids[:3] + [999], 'changes': {'status': 'completed'}}
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.json['result'] == task_ids[:3]
+        assert len([sql for sql in counter.statements if sql.startswith('UPDATE')]) == 1
+        assert task_states(sqlite_app, task_ids) == [(TaskStatus.COMPLETED, 2)] * 3 + [
+            (TaskStatus.OPEN, 1)
+        ]
+
+    def test_update_by_filter(self, sqlite_app, admin_headers, create_user, create_tasks, returning):
+        user_id = create_user('john@example.com')
+        assigned_ids = create_tasks(2, assigned_to_id=user_id)
+        other_ids = create_tasks(2)
+        data = {
+            'filter': {'assigned_to_id': user_id, 'status': 'open'},
+            'changes': {'status': 'in work', 'priority': 'high'},
+        }
+
+        response = sqlite_app.test_client().patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.json['result'] == assigned_ids
+        assert task_states(sqlite_app, assigned_ids) == [(TaskStatus.IN_WORK, 2)] * 2
+        assert task_states(sqlite_app, other_ids) == [(TaskStatus.OPEN, 1)] * 2
+
+    @pytest.mark.parametrize('data', [
+        {'changes': {'status': 'completed'}},
+        {'ids': [1], 'filter': {'status': 'open'}, 'changes': {'status': 'completed'}},
+        {'ids': [1]},
+        {'ids': [1], 'changes': {'title': 'Same title everywhere'}},
+        {'ids': [1], 'changes': {'status': 'done'}},
+        {'ids': ['1'], 'changes': {'status': 'completed'}},
+        {'filter': {}, 'changes': {'status': 'completed'}},
+        {'filter': {'assignee': 1}, 'changes': {'status': 'completed'}},
+    ])
+    def test_invalid_payload(self, sqlite_app, admin_headers, create_tasks, data):
+        task_ids = create_tasks(1)
+
+        response = sqlite_app.test_client().patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.status_code == 400
+        assert task_states(sqlite_app, task_ids) == [(TaskStatus.OPEN, 1)]
+
+    def test_too_many_ids(self, sqlite_app, admin_headers):
+        sqlite_app.config['BULK_MAX_ITEMS'] = 2
+        data = {'ids': [1, 2, 3], 'changes': {'status': 'completed'}}
+
+        response = sqlite_app.test_client().patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.status_code == 413
+
+    def test_requires_admin(self, sqlite_app, create_user, create_tasks):
+        create_user('john@example.com')
+        task_ids = create_tasks(1)
+        data = {'ids': task_ids, 'changes': {'status': 'completed'}}
+
+        response = sqlite_app.test_client().patch(
+            '/api/v1/tasks', json=data, headers=basic_auth_header('john@example.com')
+        )
+
+        assert response.status_code == 403
+
+    def test_too_many_filter_matches(self, sqlite_app, admin_headers, create_user, create_tasks):
+        sqlite_app.config['BULK_MAX_ITEMS'] = 2
+        user_id = create_user('john@example.com')
+        task_ids = create_tasks(1, assigned_to_id=user_id) + create_tasks(2)
+        data = {'filter': {'status': 'open'}, 'changes': {'status': 'completed'}}
+        client = sqlite_app.test_client()
+
+        response = client.patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.status_code == 400
+        assert task_states(sqlite_app, task_ids) == [(TaskStatus.OPEN, 1)] * 3
+
+        data['filter']['assigned_to_id'] = user_id
+        response = client.patch('/api/v1/tasks', json=data, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.json['result'] == task_ids[:1]
@@ -0,0 +1,71 @@
+from apiserver.api.models import Comment, Task, User
+from apiserver.extensions import db
+from tests.utils import basic_auth_header
+
+
+class TestCascadingDeletes:
+
+    def test_task_delete_is_single_statement(
+        self, sqlite_app, admin_headers, create_tasks, count_queries
+    ):
+        task_id = create_tasks(1)[0]
+        with sqlite_app.app_context():
+            db.session.add_all(
+                Comment(content=f'Comment {index}', task_id=task_id) for index in range(50)
+            )
+            db.session.commit()
+
+        with count_queries() as counter:
+            response = sqlite_app.test_client().delete(
+                f'/api/v1/tasks/{task_id}', headers=admin_headers
+            )
+
+        assert response.status_code == 200
+        deletes = [statement for statement in counter.statements if statement.startswith('DELETE')]
+        assert len(deletes) == 1
+        assert not any('FROM comments' in statement for statement in counter.statements)
+        with sqlite_app.app_context():
+            assert Comment.query.count() == 0
+
+    def test_missing_task(self, sqlite_app, admin_headers):
+        response = sqlite_app.test_client().delete('/api/v1/tasks/404', headers=admin_headers)
+
+        assert response.status_code == 404
+
+    def test_user_delete_releases_tasks(
+        self, sqlite_app, admin_headers, create_user, create_tasks, count_queries
+    ):
+        user_id = create_user('john@example.com')
+        task_ids = create_tasks(3, assigned_to_id=user_id, created_by_id=user_id)
+
+        with count_queries() as counter:
+            response = sqlite_app.test_client().delete(
+                f'/api/v1/delete_user/{user_id}', headers=admin_headers
+            )
+
+        assert response.status_code == 200
+        assert not any(
+            statement.startswith('SELECT') and 'FROM tasks' in statement
+            for statement in counter.statements
+        )
+        with sqlite_app.app_context():
+            assert db.session.get(User, user_id) is None
+            tasks = Task.query.filter(Task.id.in_(task_ids)).all()
+            assert [(task.assigned_to_id, task.created_by_id) for task in tasks] == [(None, None)] * 3
+            assert {task.version for task in tasks} == {2}
+
+    def test_missing_user(self, sqlite_app, admin_headers):
+        response = sqlite_app.test_client().delete(
+            '/api/v1/delete_user/404', headers=admin_headers
+        )
+
+        assert response.status_code == 404
+
+    def test_deleted_user_can_no_longer_sign_in(self, sqlite_app, admin_headers, create_user):
+        user_id = create_user('john@example.com')
+        client = sqlite_app.test_client()
+        client.delete(f'/api/v1/delete_user/{user_id}', headers=admin_headers)
+
+        response = client.post('/api/v1/sign_in', headers=basic_auth_header('john@example.com'))
+
+        assert response.status_code == 401
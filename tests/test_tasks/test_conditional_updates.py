@@ -0,0 +1,146 @@
+import pytest
+
+from apiserver.api.models import Task
+from apiserver.commons.constants import TaskStatus
+from apiserver.extensions import db
+from tests.utils import basic_auth_header
+
+
+@pytest.fixture(params=[True, False], ids=['returning', 'no-returning'])
+def returning(request, monkeypatch):
+    """Run with and without UPDATE ... RETURNING support"""
+    if not request.param:
+        monkeypatch.setattr(
+            'apiserver.api.resources.tasks.supports_returning', lambda statement: False
+        )
+    return request.param
+
+
+def get_etag(client, task_id, headers):
+    return client.get('/api/v1/tasks', query_string={'task_id': task_id}, headers=headers).headers['ETag']
+
+
+class TestConditionalUpdates:
+
+    def test_update_returns_new_state(
+        self, sqlite_app, admin_headers, create_tasks, count_queries, returning
+    ):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            response = client.put(
+                f'/api/v1/tasks/{task_id}',
+                json={'status': 'completed', 'estimate': 5},
+                headers=admin_headers,
+            )
+
+        assert response.status_code == 201
+        result = response.json['result']
+        assert (result['id'], result['status'], result['estimate'], result['version']) == (
+            str(task_id), 'completed', 5, 2
+        )
+        assert response.headers['ETag'] == get_etag(client, task_id, admin_headers)
+        task_statements = [statement for statement in counter.statements if 'tasks' in statement]
+        assert len(task_statements) == (1 if returning else 2)
+        assert task_statements[0].startswith('UPDATE')
+
+    def test_concurrent_editors(self, sqlite_app, admin_headers, create_tasks, returning):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        etag = get_etag(client, task_id, admin_headers)
+
+        first = client.put(
+            f'/api/v1/tasks/{task_id}',
+            json={'description': 'First'},
+            headers={**admin_headers, 'If-Match': etag},
+        )
+        second = client.put(
+            f'/api/v1/tasks/{task_id}',
+            json={'description': 'Second'},
+            headers={**admin_headers, 'If-Match': etag},
+        )
+        third = client.put(
+            f'/api/v1/tasks/{task_id}',
+            json={'description': 'Third'},
+            headers={**admin_headers, 'If-Match': first.headers['ETag']},
+        )
+
+        assert (first.status_code, second.status_code, third.status_code) == (201, 412, 201)
+        with sqlite_app.app_context():
+            task = db.session.get(Task, task_id)
+            assert (task.description, task.version) == ('Third', 3)
+
+    @pytest.mark.parametrize('if_match', ['*', '"1-1", "other"'])
+    def test_if_match_variants(self, sqlite_app, admin_headers, create_tasks, if_match):
+        task_id = create_tasks(1)[0]
+        etag = if_match.replace('1-1', f'{task_id}-1')
+
+        response = sqlite_app.test_client().put(
+            f'/api/v1/tasks/{task_id}',
+            json={'status': 'in work'},
+            headers={**admin_headers, 'If-Match': etag},
+        )
+
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize('if_match', ['"unknown"', 'W/"{task_id}-1"', '"0-1"'])
+    def test_mismatched_tags_are_rejected(self, sqlite_app, admin_headers, create_tasks, if_match):
+        task_id = create_tasks(1)[0]
+
+        response = sqlite_app.test_client().put(
+            f'/api/v1/tasks/{task_id}',
+            json={'status': 'in work'},
+            headers={**admin_headers, 'If-Match': if_match.format(task_id=task_id)},
+        )
+
+        assert response.status_code == 412
+        with sqlite_app.app_context():
+            assert db.session.get(Task, task_id).status == TaskStatus.OPEN
+
+    def test_missing_task(self, sqlite_app, admin_headers):
+        response = sqlite_app.test_client().put(
+            '/api/v1/tasks/404',
+            json={'status': 'in work'},
+            headers={**admin_headers, 'If-Match': '"404-1"'},
+        )
+
+        assert response.status_code == 404
+
+    def test_invalid_value(self, sqlite_app, admin_headers, create_tasks):
+        task_id = create_tasks(1)[0]
+
+        response = sqlite_app.test_client().put(
+            f'/api/v1/tasks/{task_id}', json={'status': 'done'}, headers=admin_headers
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('priority,status', [('high', 'in work'), ('TIGHT', 'IN_WORK')])
+    def test_enum_values_and_names(self, sqlite_app, admin_headers, create_tasks, priority, status):
+        task_id = create_tasks(1)[0]
+
+        response = sqlite_app.test_client().put(
+            f'/api/v1/tasks/{task_id}',
+            json={'priority': priority, 'status': status},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 201
+        assert response.json['result']['priority'] == 'high'
+        with sqlite_app.app_context():
+            assert db.session.get(Task, task_id).status == TaskStatus.IN_WORK
+
+    def test_requires_admin(self, sqlite_app, create_user, create_tasks):
+        create_user('john@example.com')
+        task_id = create_tasks(1)[0]
+
+        response = sqlite_app.test_client().put(
+            f'/api/v1/tasks/{task_id}',
+            json={'description': 'Updated'},
+            headers=basic_auth_header('john@example.com'),
+        )
+
+        assert response.status_code == 403
+        with sqlite_app.app_context():
+            assert db.session.get(Task, task_id).version == 1
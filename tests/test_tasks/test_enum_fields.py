@@ -0,0 +1,73 @@
+import pytest
+
+from apiserver.api.models import Task
+from apiserver.commons.constants import PriorityLevel, TaskStatus
+
+
+def task_state(app, title):
+    with app.app_context():
+        task = Task.query.filter_by(title=title).first()
+        return task.priority, task.status
+
+
+@pytest.mark.parametrize(
+    'priority,status', [('high', 'in work'), ('TIGHT', 'IN_WORK')], ids=['values', 'names']
+)
+class TestEnumFields:
+    """Enum fields accept the enum values as well as the enum names"""
+
+    expected = (PriorityLevel.TIGHT, TaskStatus.IN_WORK)
+
+    def test_create(self, sqlite_app, admin_headers, priority, status):
+        response = sqlite_app.test_client().post(
+            '/api/v1/tasks/add',
+            json={'title': 'Task A', 'priority': priority, 'status': status},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 201
+        assert response.json['result']['priority'] == 'high'
+        assert task_state(sqlite_app, 'Task A') == self.expected
+
+    def test_bulk_create(self, sqlite_app, admin_headers, priority, status):
+        response = sqlite_app.test_client().post(
+            '/api/v1/tasks/bulk',
+            json=[{'title': 'Task A', 'priority': priority, 'status': status}],
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 201
+        assert task_state(sqlite_app, 'Task A') == self.expected
+
+    def test_bulk_update(self, sqlite_app, admin_headers, create_tasks, priority, status):
+        task_ids = create_tasks(1)
+
+        response = sqlite_app.test_client().patch(
+            '/api/v1/tasks',
+            json={'ids': task_ids, 'changes': {'priority': priority, 'status': status}},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert task_state(sqlite_app, 'Task 0') == self.expected
+
+
+class TestInvalidEnumFields:
+
+    @pytest.mark.parametrize('priority', ['urgent', 'tight', 3])
+    def test_create_rejects_unknown_priority(self, sqlite_app, admin_headers, priority):
+        response = sqlite_app.test_client().post(
+            '/api/v1/tasks/add',
+            json={'title': 'Task A', 'priority': priority},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 400
+        assert response.json['message'] == 'Invalid value for priority.'
+
+    def test_create_rejects_unknown_field(self, sqlite_app, admin_headers):
+        response = sqlite_app.test_client().post(
+            '/api/v1/tasks/add', json={'title': 'Task A', 'owner': 1}, headers=admin_headers
+        )
+
+        assert response.status_code == 400
@@ -0,0 +1,140 @@
+import pytest
+
+from apiserver.api.models import Comment, Task
+from apiserver.extensions import db
+
+
+@pytest.fixture
+def task_version(sqlite_app):
+    """Read the version and updated_at timestamp of a task"""
+
+    def _task_version(task_id):
+        with sqlite_app.app_context():
+            task = db.session.get(Task, task_id)
+            return task.version, task.updated_at
+
+    return _task_version
+
+
+class TestTaskVersion:
+
+    def test_put_bumps_version_and_timestamp(self, sqlite_app, admin_headers, create_tasks, task_version):
+        task_id = create_tasks(1)[0]
+        version, updated_at = task_version(task_id)
+        client = sqlite_app.test_client()
+
+        response = client.put(f'/api/v1/tasks/{task_id}', json={'description': 'Updated'}, headers=admin_headers)
+
+        assert response.status_code == 201
+        new_version, new_updated_at = task_version(task_id)
+        assert new_version == version + 1
+        assert new_updated_at > updated_at
+
+    def test_assign_bumps_version(self, sqlite_app, admin_headers, create_user, create_tasks, task_version):
+        user_id = create_user('john@example.com')
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+
+        response = client.post(
+            '/api/v1/assign-task', json={'user_id': user_id, 'task_id': task_id}, headers=admin_headers
+        )
+
+        assert response.status_code == 201
+        assert response.json['result']['version'] == 2
+        assert task_version(task_id)[0] == 2
+
+    def test_comment_writes_bump_version(self, sqlite_app, admin_headers, create_tasks, task_version):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+
+        client.post(f'/api/v1/tasks/{task_id}/comments', json={'comment': 'First'}, headers=admin_headers)
+        assert task_version(task_id)[0] == 2
+
+        with sqlite_app.app_context():
+            comment_id = Comment.query.filter_by(task_id=task_id).first().id
+        client.put(
+            f'/api/v1/tasks/{task_id}/comments/{comment_id}', json={'comment': 'Edited'}, headers=admin_headers
+        )
+        assert task_version(task_id)[0] == 3
+
+        client.delete(f'/api/v1/tasks/{task_id}/comments/{comment_id}', headers=admin_headers)
+        assert task_version(task_id)[0] == 4
+
+    def test_timestamps_are_set_per_row(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+        first = client.post('/api/v1/tasks/add', json={'title': 'First'}, headers=admin_headers)
+        second = client.post('/api/v1/tasks/add', json={'title': 'Second'}, headers=admin_headers)
+
+        assert second.json['result']['createdAt'] > first.json['result']['createdAt']
+
+
+class TestTaskETags:
+
+    def test_task_detail_not_modified(self, sqlite_app, admin_headers, create_tasks):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/tasks', query_string={'task_id': task_id}, headers=admin_headers)
+        etag = response.headers['ETag']
+        assert not etag.startswith('W/')
+
+        response = client.get(
+            '/api/v1/tasks',
+            query_string={'task_id': task_id},
+            headers={**admin_headers, 'If-None-Match': etag},
+        )
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert response.data == b''
+
+    def test_task_detail_etag_changes_on_write(self, sqlite_app, admin_headers, create_tasks):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        etag = client.get(
+            '/api/v1/tasks', query_string={'task_id': task_id}, headers=admin_headers
+        ).headers['ETag']
+
+        client.post(f'/api/v1/tasks/{task_id}/comments', json={'comment': 'New'}, headers=admin_headers)
+        response = client.get(
+            '/api/v1/tasks',
+            query_string={'task_id': task_id},
+            headers={**admin_headers, 'If-None-Match': etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_task_list_not_modified(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(3)
+        client = sqlite_app.test_client()
+        etag = client.get('/api/v1/tasks', headers=admin_headers).headers['ETag']
+
+        response = client.get('/api/v1/tasks', headers={**admin_headers, 'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    @pytest.mark.parametrize('query_string', [{}, {'all': 'true'}])
+    def test_task_list_etag_changes(self, sqlite_app, admin_headers, create_tasks, query_string):
+        task_ids = create_tasks(3)
+        client = sqlite_app.test_client()
+        etags = [client.get('/api/v1/tasks', query_string=query_string, headers=admin_headers).headers['ETag']]
+
+        client.put(f'/api/v1/tasks/{task_ids[1]}', json={'description': 'Updated'}, headers=admin_headers)
+        etags.append(client.get('/api/v1/tasks', query_string=query_string, headers=admin_headers).headers['ETag'])
+        create_tasks(1)
+        etags.append(client.get('/api/v1/tasks', query_string=query_string, headers=admin_headers).headers['ETag'])
+
+        assert len(set(etags)) == 3
+
+    def test_task_list_pages_have_distinct_etags(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(4)
+        client = sqlite_app.test_client()
+
+        first = client.get('/api/v1/tasks', query_string={'limit': 2}, headers=admin_headers)
+        second = client.get(
+            '/api/v1/tasks',
+            query_string={'limit': 2, 'cursor': first.json['next_cursor']},
+            headers=admin_headers,
+        )
+
+        assert first.headers['ETag'] != second.headers['ETag']
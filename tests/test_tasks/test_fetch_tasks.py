@@ -0,0 +1,123 @@
+import base64
+import json
+
+import pytest
+from sqlalchemy import update
+
+from apiserver.api.models import Task
+from apiserver.extensions import db
+
+
+class TestTaskPagination:
+
+    def test_pages_cover_all_tasks_in_order(self, sqlite_app, admin_headers, create_tasks):
+        task_ids = create_tasks(7)
+        client = sqlite_app.test_client()
+
+        fetched, cursor = [], None
+        while True:
+            query = {'limit': 3, **({'cursor': cursor} if cursor else {})}
+            response = client.get('/api/v1/tasks', query_string=query, headers=admin_headers)
+            assert response.status_code == 200
+            fetched.extend(int(task['id']) for task in response.json['result'])
+            cursor = response.json['next_cursor']
+            if not cursor:
+                break
+
+        assert fetched == task_ids
+
+    @pytest.mark.parametrize('sort', ['created_at', '-created_at'])
+    def test_pages_cover_tasks_without_creation_date(
+        self, sqlite_app, admin_headers, create_tasks, sort
+    ):
+        task_ids = create_tasks(7)
+        with sqlite_app.app_context():
+            db.session.execute(
+                update(Task).where(Task.id.in_(task_ids[1:6:2])).values(created_at=None)
+            )
+            db.session.commit()
+        client = sqlite_app.test_client()
+
+        fetched, cursor = [], None
+        while True:
+            query = {'sort': sort, 'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = client.get('/api/v1/tasks', query_string=query, headers=admin_headers)
+            assert response.status_code == 200
+            fetched.extend(int(task['id']) for task in response.json['result'])
+            cursor = response.json['next_cursor']
+            if not cursor:
+                break
+
+        everything = client.get(
+            '/api/v1/tasks', query_string={'sort': sort, 'all': 'true'}, headers=admin_headers
+        )
+        assert fetched == [int(task['id']) for task in everything.json['result']]
+        assert sorted(fetched) == task_ids
+
+    def test_null_cursor_on_nullable_column(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(2)
+        cursor = base64.urlsafe_b64encode(json.dumps([None, 1]).encode()).decode()
+
+        response = sqlite_app.test_client().get(
+            '/api/v1/tasks', query_string={'cursor': cursor}, headers=admin_headers
+        )
+
+        assert response.status_code == 200
+
+    def test_default_limit(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(3)
+        sqlite_app.config['PAGINATION_DEFAULT_LIMIT'] = 2
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/tasks', headers=admin_headers)
+
+        assert len(response.json['result']) == 2
+        assert response.json['next_cursor']
+
+    def test_full_list_requires_opt_in(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(3)
+        sqlite_app.config['PAGINATION_DEFAULT_LIMIT'] = 2
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/tasks', query_string={'all': 'true'}, headers=admin_headers)
+
+        assert len(response.json['result']) == 3
+        assert 'next_cursor' not in response.json
+
+    def test_invalid_limit(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        for limit in ('0', 'abc', '100000'):
+            response = client.get('/api/v1/tasks', query_string={'limit': limit}, headers=admin_headers)
+            assert response.status_code == 400
+            assert response.json['status'] == 'failed'
+
+    def test_invalid_cursor(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        for cursor in ('not-a-cursor', 'WzFd'):
+            response = client.get('/api/v1/tasks', query_string={'cursor': cursor}, headers=admin_headers)
+            assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        'sort,values',
+        [
+            (None, ['2023-01-01T00:00:00', {'a': 1}]),
+            (None, ['2023-01-01T00:00:00', '1']),
+            (None, ['2023-01-01T00:00:00', True]),
+            (None, [1, 1]),
+            (None, ['yesterday', 1]),
+            ('title', [['Task 1'], 1]),
+            (None, ['2023-01-01T00:00:00', None]),
+            ('title', [None, 1]),
+        ],
+    )
+    def test_cursor_with_wrong_value_types(self, sqlite_app, admin_headers, create_tasks, sort, values):
+        create_tasks(2)
+        cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        query = {'cursor': cursor, **({'sort': sort} if sort else {})}
+
+        response = sqlite_app.test_client().get('/api/v1/tasks', query_string=query, headers=admin_headers)
+
+        assert response.status_code == 400
+        assert response.json['status'] == 'failed'
@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from apiserver.commons.constants import PriorityLevel, TaskStatus
+
+
+class TestTaskFilters:
+
+    def test_filter_by_status_and_priority(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(2)
+        expected = create_tasks(2, status=TaskStatus.COMPLETED, priority=PriorityLevel.TIGHT)
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/tasks',
+            query_string={'status': 'completed,in work', 'priority': 'high'},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert [int(task['id']) for task in response.json['result']] == expected
+
+    def test_filter_by_assignee(self, sqlite_app, admin_headers, create_user, create_tasks):
+        user_id = create_user('john@example.com')
+        create_tasks(2)
+        expected = create_tasks(1, assigned_to_id=user_id)
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/tasks', query_string={'assigned_to_id': user_id}, headers=admin_headers
+        )
+
+        assert [int(task['id']) for task in response.json['result']] == expected
+
+    def test_filter_by_due_date_range(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(1, due_date=datetime(2023, 9, 1))
+        expected = create_tasks(1, due_date=datetime(2023, 9, 15))
+        create_tasks(1, due_date=datetime(2023, 10, 1))
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/tasks',
+            query_string={'due_date_from': '2023-09-10', 'due_date_to': '2023-09-30'},
+            headers=admin_headers,
+        )
+
+        assert [int(task['id']) for task in response.json['result']] == expected
+
+    def test_invalid_filter_value(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        for query in ({'status': 'done'}, {'assigned_to_id': 'abc'}, {'due_date_to': 'tomorrow'}):
+            response = client.get('/api/v1/tasks', query_string=query, headers=admin_headers)
+            assert response.status_code == 400
+            assert response.json['status'] == 'failed'
+
+    def test_filter_by_enum_name(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(1)
+        expected = create_tasks(1, status=TaskStatus.COMPLETED)
+
+        response = sqlite_app.test_client().get(
+            '/api/v1/tasks', query_string={'status': 'COMPLETED'}, headers=admin_headers
+        )
+
+        assert [int(task['id']) for task in response.json['result']] == expected
+
+
+class TestTaskSort:
+
+    def test_sort_descending_across_pages(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(5)
+        client = sqlite_app.test_client()
+
+        first = client.get(
+            '/api/v1/tasks', query_string={'sort': '-title', 'limit': 3}, headers=admin_headers
+        )
+        second = client.get(
+            '/api/v1/tasks',
+            query_string={'sort': '-title', 'limit': 3, 'cursor': first.json['next_cursor']},
+            headers=admin_headers,
+        )
+
+        titles = [task['title'] for task in first.json['result'] + second.json['result']]
+        assert titles == ['Task 4', 'Task 3', 'Task 2', 'Task 1', 'Task 0']
+        assert second.json['next_cursor'] is None
+
+    def test_invalid_sort(self, sqlite_app, admin_headers):
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/tasks', query_string={'sort': 'password'}, headers=admin_headers)
+
+        assert response.status_code == 400
+
@@ -0,0 +1,45 @@
+from flask_jwt_extended import create_access_token
+
+
+class TestTaskQueryCount:
+
+    def test_task_list_query_count_is_constant(
+        self, sqlite_app, admin_headers, create_user, create_tasks, count_queries
+    ):
+        for index in range(6):
+            user_id = create_user(f'user{index}@example.com')
+            create_tasks(2, assigned_to_id=user_id, created_by_id=user_id)
+        client = sqlite_app.test_client()
+        # The first request loads the role registry
+        client.get('/api/v1/tasks', headers=admin_headers)
+
+        counts = []
+        for limit in (1, 5, 12):
+            with count_queries() as counter:
+                response = client.get(
+                    '/api/v1/tasks', query_string={'limit': limit}, headers=admin_headers
+                )
+            assert len(response.json['result']) == limit
+            assert response.json['result'][0]['assignedTo']['email']
+            counts.append(counter.count)
+
+        assert len(set(counts)) == 1
+
+    def test_assigned_tasks_query_count_is_constant(
+        self, sqlite_app, create_user, create_tasks, count_queries
+    ):
+        user_id = create_user('john@example.com')
+        creator_ids = [create_user(f'user{index}@example.com') for index in range(5)]
+        with sqlite_app.app_context():
+            headers = {'Authorization': f'Bearer {create_access_token(identity=user_id)}'}
+        client = sqlite_app.test_client()
+
+        counts = []
+        for creator_id in creator_ids:
+            create_tasks(1, assigned_to_id=user_id, created_by_id=creator_id)
+            with count_queries() as counter:
+                response = client.get('/api/v1/assigned-tasks-list', headers=headers)
+            assert response.json['result'][-1]['createdBy']['id'] == str(creator_id)
+            counts.append(counter.count)
+
+        assert counts == [1] * len(creator_ids)
@@ -0,0 +1,76 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from apiserver.api.models import Comment
+from apiserver.extensions import db
+from tests.utils import full_table_scans
+
+HOT_TABLES = {'tasks', 'comments'}
+
+
+@pytest.fixture
+def populated(sqlite_app, create_user, create_tasks):
+    task_ids = []
+    for index in range(5):
+        user_id = create_user(f'user{index}@example.com')
+        task_ids += create_tasks(10, assigned_to_id=user_id, created_by_id=user_id)
+    with sqlite_app.app_context():
+        db.session.add_all(Comment(content='Comment', task_id=task_id) for task_id in task_ids)
+        db.session.commit()
+        db.session.execute(db.text('ANALYZE'))
+        token = create_access_token(identity=user_id)
+    return {'user_id': user_id, 'task_id': task_ids[0], 'token': token}
+
+
+def assert_no_full_scans(sqlite_app, counter):
+    with sqlite_app.app_context():
+        with db.engine.connect() as connection:
+            for statement, parameters in counter.queries:
+                if not statement.lstrip().upper().startswith('SELECT'):
+                    continue
+                scanned = HOT_TABLES.intersection(
+                    full_table_scans(connection, statement, parameters)
+                )
+                assert not scanned, f'Full scan of {scanned} in: {statement}'
+
+
+class TestQueryPlans:
+
+    @pytest.mark.parametrize('query', [
+        {'limit': 5},
+        {'limit': 5, 'sort': '-updated_at'},
+        {'limit': 5, 'status': 'open'},
+        {'limit': 5, 'assigned_to_id': 1},
+        {'limit': 5, 'created_by_id': 1},
+    ])
+    def test_task_list(self, sqlite_app, admin_headers, populated, count_queries, query):
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            first = client.get('/api/v1/tasks', query_string=query, headers=admin_headers)
+            client.get(
+                '/api/v1/tasks',
+                query_string={**query, 'cursor': first.json['next_cursor']},
+                headers=admin_headers,
+            )
+
+        assert_no_full_scans(sqlite_app, counter)
+
+    def test_assigned_tasks_list(self, sqlite_app, populated, count_queries):
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            client.get(
+                '/api/v1/assigned-tasks-list',
+                headers={'Authorization': f'Bearer {populated["token"]}'},
+            )
+
+        assert_no_full_scans(sqlite_app, counter)
+
+    def test_task_comments(self, sqlite_app, admin_headers, populated, count_queries):
+        client = sqlite_app.test_client()
+
+        with count_queries() as counter:
+            client.get(f'/api/v1/tasks/{populated["task_id"]}/comments', headers=admin_headers)
+
+        assert_no_full_scans(sqlite_app, counter)
@@ -0,0 +1,249 @@
+import pytest
+
+from apiserver.commons.caching import MemoryBackend, SharedBackend
+from apiserver.extensions import response_cache
+from tests.utils import basic_auth_header
+
+
+class FakeRedis:
+    """Stand-in for a Redis client, shared between backends like a server"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, name):
+        return self.data.get(name)
+
+    def set(self, name, value, ex=None):
+        self.data[name] = value.encode() if isinstance(value, str) else value
+
+    def mget(self, names):
+        return [self.data.get(name) for name in names]
+
+    def incr(self, name):
+        self.data[name] = str(int(self.data.get(name, 0)) + 1).encode()
+        return int(self.data[name])
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def cache(request, sqlite_app):
+    """Enable the response cache with each backend"""
+    if request.param == 'memory':
+        response_cache.backend = MemoryBackend(max_size=100, ttl=60)
+    else:
+        response_cache.backend = SharedBackend(FakeRedis(), ttl=60)
+    response_cache.hits = response_cache.misses = 0
+    yield response_cache
+    response_cache.backend = None
+
+
+def get_tasks(client, headers, **query_string):
+    return client.get('/api/v1/tasks', query_string=query_string, headers=headers)
+
+
+class TestResponseCache:
+
+    def test_repeated_read_is_served_from_cache(
+        self, sqlite_app, cache, admin_headers, create_tasks, count_queries
+    ):
+        create_tasks(3)
+        client = sqlite_app.test_client()
+        first = get_tasks(client, admin_headers)
+
+        with count_queries() as counter:
+            second = get_tasks(client, admin_headers)
+
+        assert second.json == first.json
+        assert second.headers['ETag'] == first.headers['ETag']
+        assert not any('FROM tasks' in statement for statement in counter.statements)
+        assert cache.metrics() == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+    def test_cached_response_answers_if_none_match(
+        self, sqlite_app, cache, admin_headers, create_tasks
+    ):
+        create_tasks(1)
+        client = sqlite_app.test_client()
+        etag = get_tasks(client, admin_headers).headers['ETag']
+
+        response = client.get(
+            '/api/v1/tasks', headers={**admin_headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+        assert cache.hits == 1
+
+    def test_write_invalidates_affected_reads_only(
+        self, sqlite_app, cache, admin_headers, create_tasks
+    ):
+        task_ids = create_tasks(2)
+        client = sqlite_app.test_client()
+        get_tasks(client, admin_headers)
+        get_tasks(client, admin_headers, task_id=task_ids[0])
+        get_tasks(client, admin_headers, task_id=task_ids[1])
+
+        client.put(
+            f'/api/v1/tasks/{task_ids[0]}', json={'description': 'Updated'}, headers=admin_headers
+        )
+        listing = get_tasks(client, admin_headers)
+        updated = get_tasks(client, admin_headers, task_id=task_ids[0])
+        untouched = get_tasks(client, admin_headers, task_id=task_ids[1])
+
+        assert listing.json['result'][0]['description'] == 'Updated'
+        assert updated.json['result']['description'] == 'Updated'
+        assert untouched.json['result']['id'] == str(task_ids[1])
+        assert (cache.hits, cache.misses) == (1, 5)
+
+    def test_detail_tag_uses_integer_id(self, sqlite_app, cache, admin_headers, create_tasks):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        get_tasks(client, admin_headers, task_id=f'0{task_id}')
+
+        client.put(f'/api/v1/tasks/{task_id}', json={'description': 'New'}, headers=admin_headers)
+        response = get_tasks(client, admin_headers, task_id=f'0{task_id}')
+
+        assert response.json['result']['description'] == 'New'
+        assert cache.hits == 0
+
+    def test_invalid_detail_id_is_not_cached(self, sqlite_app, cache, admin_headers):
+        client = sqlite_app.test_client()
+        for _ in range(2):
+            get_tasks(client, admin_headers, task_id='abc')
+
+        assert cache.metrics() == {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @pytest.mark.parametrize('method, path, payload', [
+        ('post', '/api/v1/tasks/{task_id}/comments', {'comment': 'New'}),
+        ('delete', '/api/v1/tasks/{task_id}', None),
+    ])
+    def test_task_writes_invalidate_detail(
+        self, sqlite_app, cache, admin_headers, create_tasks, method, path, payload
+    ):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        version = get_tasks(client, admin_headers, task_id=task_id).json.get('result')
+
+        getattr(client, method)(path.format(task_id=task_id), json=payload, headers=admin_headers)
+        response = get_tasks(client, admin_headers, task_id=task_id)
+
+        assert response.json.get('result') != version
+        assert cache.hits == 0
+
+    @pytest.mark.parametrize('method, path, payload', [
+        ('put', '/api/v1/tasks/0{task_id}', {'description': 'New'}),
+        ('delete', '/api/v1/tasks/0{task_id}', None),
+        ('post', '/api/v1/tasks/0{task_id}/comments', {'comment': 'New'}),
+        ('put', '/api/v1/tasks/0{task_id}/comments/{comment_id}', {'comment': 'New'}),
+        ('delete', '/api/v1/tasks/0{task_id}/comments/{comment_id}', None),
+    ])
+    def test_writes_through_non_canonical_id_invalidate_detail(
+        self, sqlite_app, cache, admin_headers, create_tasks, method, path, payload
+    ):
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        comment_id = client.post(
+            f'/api/v1/tasks/{task_id}/comments', json={'comment': 'Old'}, headers=admin_headers
+        ).json['result']['id']
+        before = get_tasks(client, admin_headers, task_id=task_id)
+
+        response = getattr(client, method)(
+            path.format(task_id=task_id, comment_id=comment_id),
+            json=payload,
+            headers=admin_headers,
+        )
+        after = get_tasks(client, admin_headers, task_id=task_id)
+
+        assert response.status_code in (200, 201)
+        assert after.headers.get('ETag') != before.headers.get('ETag')
+        assert cache.hits == 0
+
+    def test_assign_invalidates_assigned_tasks(
+        self, sqlite_app, cache, admin_headers, create_user, create_tasks
+    ):
+        user_id = create_user('john@example.com')
+        task_id = create_tasks(1)[0]
+        client = sqlite_app.test_client()
+        token = client.post(
+            '/api/v1/sign_in', headers=basic_auth_header('john@example.com')
+        ).json['result']['access_token']
+        headers = {'Authorization': f'Bearer {token}'}
+        assert client.get('/api/v1/assigned-tasks-list', headers=headers).json['result'] == []
+
+        client.post(
+            '/api/v1/assign-task', json={'user_id': user_id, 'task_id': task_id}, headers=admin_headers
+        )
+        response = client.get('/api/v1/assigned-tasks-list', headers=headers)
+
+        assert [task['id'] for task in response.json['result']] == [str(task_id)]
+
+    def test_keys_depend_on_caller(self, sqlite_app, cache, admin_headers, create_user, create_tasks):
+        create_user('john@example.com')
+        create_tasks(1)
+        client = sqlite_app.test_client()
+
+        get_tasks(client, admin_headers)
+        get_tasks(client, basic_auth_header('john@example.com'))
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_streamed_reads_bypass_cache(self, sqlite_app, cache, admin_headers, create_tasks):
+        create_tasks(1)
+        client = sqlite_app.test_client()
+
+        get_tasks(client, admin_headers, stream='1')
+        get_tasks(client, admin_headers, stream='1')
+
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+class TestBackends:
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryBackend(max_size=2, ttl=60)
+        backend.set('a', 1)
+        backend.set('b', 2)
+        backend.get('a')
+        backend.set('c', 3)
+
+        assert backend.get('b') is None
+        assert backend.get('a') == 1
+        assert backend.evictions == 1
+
+    def test_memory_backend_expires_entries(self):
+        backend = MemoryBackend(max_size=2, ttl=0)
+        backend.set('a', 1)
+
+        assert backend.get('a') is None
+
+    def test_memory_backend_bounds_tag_generations(self):
+        backend = MemoryBackend(max_size=2, ttl=60, max_tags=2)
+        backend.bump(['task:1'])
+        before = backend.generations(['task:1', 'task:9'])
+
+        backend.bump(['task:2', 'task:3'])
+
+        after = backend.generations(['task:1', 'task:9'])
+        assert len(backend._generations) == 2
+        # Forgetting task:1 moves it, and every unknown tag, to a new generation
+        assert after[0] not in (0, before[0])
+        assert after[1] != before[1]
+
+    def test_memory_backend_clear_resets_generations(self):
+        backend = MemoryBackend(max_size=2, ttl=60)
+        backend.bump(['tasks'])
+        backend.set('key', 1)
+
+        backend.clear()
+
+        assert backend.get('key') is None
+        assert backend._generations == {}
+        assert backend.generations(['tasks']) != [0]
+
+    def test_shared_backend_invalidates_across_workers(self):
+        client = FakeRedis()
+        worker, other_worker = SharedBackend(client), SharedBackend(client)
+        worker.set('key', {'data': [1]})
+
+        other_worker.bump(['tasks'])
+
+        assert other_worker.get('key') == {'data': [1]}
+        assert worker.generations(['tasks', 'users']) == [1, 0]
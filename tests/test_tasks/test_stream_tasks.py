@@ -0,0 +1,48 @@
+import json
+
+from flask_jwt_extended import create_access_token
+
+
+class TestStreamTasks:
+
+    def test_stream_query_argument(self, sqlite_app, admin_headers, create_tasks):
+        task_ids = create_tasks(7)
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/tasks', query_string={'stream': 1, 'limit': 2}, headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == 'application/x-ndjson'
+        tasks = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [int(task['id']) for task in tasks] == task_ids
+
+    def test_stream_accept_header_with_filter(self, sqlite_app, admin_headers, create_tasks):
+        create_tasks(2)
+        expected = create_tasks(2, description='Streamed')
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/tasks',
+            query_string={'sort': '-created_at'},
+            headers={**admin_headers, 'Accept': 'application/x-ndjson'},
+        )
+
+        lines = response.get_data(as_text=True).splitlines()
+        assert len(lines) == 4
+        assert [int(json.loads(line)['id']) for line in lines[:2]] == expected[::-1]
+
+    def test_stream_assigned_tasks(self, sqlite_app, create_user, create_tasks):
+        user_id = create_user('john@example.com')
+        task_ids = create_tasks(3, assigned_to_id=user_id)
+        create_tasks(2)
+        with sqlite_app.app_context():
+            headers = {'Authorization': f'Bearer {create_access_token(identity=user_id)}'}
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/assigned-tasks-list?stream=1', headers=headers)
+
+        tasks = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [int(task['id']) for task in tasks] == task_ids
@@ -0,0 +1,35 @@
+import json
+
+from tests.utils import basic_auth_header
+
+
+class TestUsersListResource:
+
+    def test_list_users(self, sqlite_app, create_user):
+        create_user('admin@example.com', role='admin')
+        create_user('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.get('/api/v1/users', headers=basic_auth_header('admin@example.com'))
+
+        assert response.status_code == 200
+        assert [user['email'] for user in response.json['result']] == [
+            'admin@example.com',
+            'john@example.com',
+        ]
+        assert response.json['result'][1]['role'] == {'name': 'user'}
+
+    def test_stream_users(self, sqlite_app, create_user):
+        create_user('admin@example.com', role='admin')
+        create_user('john@example.com')
+        client = sqlite_app.test_client()
+
+        response = client.get(
+            '/api/v1/users',
+            headers={**basic_auth_header('admin@example.com'), 'Accept': 'application/x-ndjson'},
+        )
+
+        assert response.mimetype == 'application/x-ndjson'
+        users = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [user['email'] for user in users] == ['admin@example.com', 'john@example.com']
+        assert users[0]['role'] == {'name': 'admin'}
@@ -0,0 +1,122 @@
+from apiserver.api.models import Role
+from apiserver.extensions import db, role_registry
+from tests.utils import basic_auth_header
+
+
+class TestRoleRegistry:
+
+    def test_resolves_roles_from_memory(self, sqlite_app, count_queries):
+        with sqlite_app.app_context():
+            role_registry.load()
+
+            with count_queries() as counter:
+                admin_id = role_registry.get_id('admin')
+                assert role_registry.get_name(admin_id) == 'admin'
+                assert role_registry.get_name(None) is None
+
+        assert counter.count == 0
+
+    def test_reloads_after_roles_change(self, sqlite_app):
+        with sqlite_app.app_context():
+            role_registry.load()
+            version = role_registry.version
+
+            db.session.add(Role('manager'))
+            db.session.commit()
+
+            assert role_registry.version > version
+            assert role_registry.get_name(role_registry.get_id('manager')) == 'manager'
+
+    def test_unknown_role(self, sqlite_app):
+        with sqlite_app.app_context():
+            assert role_registry.get_id('unknown') is None
+            assert role_registry.get_name(999) is None
+
+    def test_signup_resolves_role_without_query(self, sqlite_app, count_queries):
+        client = sqlite_app.test_client()
+        with sqlite_app.app_context():
+            role_registry.load()
+        data = {
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john@example.com',
+            'password': 'secretpassword',
+        }
+
+        with count_queries() as counter:
+            response = client.post('/api/v1/sign_up', json=data)
+
+        assert response.status_code == 201
+        assert response.json['result']['role'] == {'name': 'user'}
+        assert not any('FROM roles' in statement for statement in counter.statements)
+
+    def test_signup_with_unknown_role(self, sqlite_app):
+        client = sqlite_app.test_client()
+        data = {
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'email': 'john@example.com',
+            'password': 'secretpassword',
+            'role': 'unknown',
+        }
+
+        response = client.post('/api/v1/sign_up', json=data)
+
+        assert response.status_code == 400
+
+    def test_list_users_resolves_roles_without_query(
+        self, sqlite_app, create_user, count_queries
+    ):
+        create_user('admin@example.com', role='admin')
+        for index in range(3):
+            create_user(f'user{index}@example.com')
+        client = sqlite_app.test_client()
+        headers = basic_auth_header('admin@example.com')
+        with sqlite_app.app_context():
+            role_registry.load()
+
+        with count_queries() as counter:
+            response = client.get('/api/v1/users', headers=headers)
+
+        assert response.status_code == 200
+        assert [user['role'] for user in response.json['result']] == [
+            {'name': 'admin'}
+        ] + [{'name': 'user'}] * 3
+        assert not any('roles' in statement for statement in counter.statements)
+
+    def test_unknown_role_is_not_reloaded_until_bump(self, sqlite_app, count_queries):
+        with sqlite_app.app_context():
+            assert role_registry.get_id('unknown') is None
+
+            with count_queries() as counter:
+                assert role_registry.get_id('unknown') is None
+                assert role_registry.get_id('unknown') is None
+            assert counter.count == 0
+
+            db.session.add(Role('unknown'))
+            db.session.commit()
+
+            assert role_registry.get_id('unknown') is not None
+
+    def test_roles_changed_by_another_process_are_seen_after_ttl(
+        self, sqlite_app, monkeypatch
+    ):
+        now = [1000.0]
+        monkeypatch.setattr('apiserver.commons.roles.time.monotonic', lambda: now[0])
+        with sqlite_app.app_context():
+            admin_id = role_registry.get_id('admin')
+            assert role_registry.get_id('manager') is None
+
+            # Plain SQL, as another worker or the seed script would, bumps nothing
+            db.session.execute(db.text("INSERT INTO roles (name) VALUES ('manager')"))
+            db.session.execute(
+                db.text("UPDATE roles SET name = 'administrator' WHERE name = 'admin'")
+            )
+            db.session.commit()
+            assert role_registry.get_id('manager') is None
+            assert role_registry.get_name(admin_id) == 'admin'
+
+            now[0] += role_registry.ttl
+            assert role_registry.get_id('manager') is not None
+            assert role_registry.get_name(admin_id) == 'administrator'
+            assert role_registry.get_id('admin') is None
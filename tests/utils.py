@@ -0,0 +1,52 @@
+import base64
+
+import pytest
+from sqlalchemy import event
+
+
+def basic_auth_header(email, password='secretpassword'):
+    """Build a Basic Authentication header"""
+    credentials = base64.b64encode(f'{email}:{password}'.encode()).decode()
+    return {'Authorization': f'Basic {credentials}'}
+
+
+class QueryCounter:
+    """Count SQL statements executed on an engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.queries = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.queries.append((statement, parameters))
+
+    @property
+    def statements(self):
+        return [statement for statement, _ in self.queries]
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+
+def full_table_scans(connection, statement, parameters):
+    """EXPLAIN a statement and return the tables it reads with a full scan"""
+    if connection.dialect.name == 'sqlite':
+        plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        # e.g. 'SCAN tasks' as opposed to 'SCAN tasks USING INDEX ...'
+        return [
+            row.detail.split()[1]
+            for row in plan
+            if row.detail.startswith('SCAN ') and ' USING ' not in row.detail
+        ]
+    if connection.dialect.name == 'mysql':
+        plan = connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+        return [row.table for row in plan if row.type == 'ALL']
+    pytest.skip(f'No query plan check for the {connection.dialect.name} dialect')